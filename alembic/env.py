@@ -16,6 +16,8 @@ from app.core.database import Base
 from app.models import (  # noqa: F401
     WorkItem, Report, ReportItem, AgentLog,
     GitProvider, ProviderType, Repository, Recipient, AppSetting,
+    SyncCursor, HttpCacheEntry, WorkItemCommit, EmailOutbox,
+    BackgroundJob, RecipientReportType, ReportAggregate, WorkItemEvent,
 )
 
 config = context.config
@@ -0,0 +1,36 @@
+"""add sync_cursors table for incremental agent scans
+
+Revision ID: c3d4e5f6g7h8
+Revises: b2c3d4e5f6g7
+Create Date: 2026-10-17 09:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c3d4e5f6g7h8'
+down_revision: Union[str, None] = 'b2c3d4e5f6g7'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table('sync_cursors',
+        sa.Column('id', sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column('provider_key', sa.String(length=300), nullable=False),
+        sa.Column('repo_name', sa.String(length=200), nullable=False),
+        sa.Column('stream', sa.String(length=20), nullable=False),
+        sa.Column('cursor_at', sa.DateTime(), nullable=False),
+        sa.Column('cursor_sha', sa.String(length=64), nullable=True),
+        sa.Column('updated_at', sa.DateTime(), server_default=sa.text('now()'), nullable=False),
+        sa.UniqueConstraint('provider_key', 'repo_name', 'stream', name='uq_sync_cursors_target'),
+        sa.PrimaryKeyConstraint('id')
+    )
+
+
+def downgrade() -> None:
+    op.drop_table('sync_cursors')
@@ -0,0 +1,38 @@
+"""add http_cache_entries table for conditional GitHub requests
+
+Revision ID: d4e5f6g7h8i9
+Revises: c3d4e5f6g7h8
+Create Date: 2026-10-17 10:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd4e5f6g7h8i9'
+down_revision: Union[str, None] = 'c3d4e5f6g7h8'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table('http_cache_entries',
+        sa.Column('id', sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column('cache_key', sa.String(length=64), nullable=False),
+        sa.Column('url', sa.String(length=1000), nullable=False),
+        sa.Column('etag', sa.String(length=200), nullable=True),
+        sa.Column('last_modified', sa.String(length=100), nullable=True),
+        sa.Column('body', sa.Text(), nullable=False),
+        sa.Column('next_url', sa.String(length=1000), nullable=True),
+        sa.Column('last_used_at', sa.DateTime(), server_default=sa.text('now()'), nullable=False),
+        sa.Column('updated_at', sa.DateTime(), server_default=sa.text('now()'), nullable=False),
+        sa.UniqueConstraint('cache_key'),
+        sa.PrimaryKeyConstraint('id')
+    )
+
+
+def downgrade() -> None:
+    op.drop_table('http_cache_entries')
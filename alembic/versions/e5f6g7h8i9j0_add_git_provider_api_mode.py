@@ -0,0 +1,28 @@
+"""add api_mode to git_providers (rest / graphql)
+
+Revision ID: e5f6g7h8i9j0
+Revises: d4e5f6g7h8i9
+Create Date: 2026-10-17 11:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e5f6g7h8i9j0'
+down_revision: Union[str, None] = 'd4e5f6g7h8i9'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('git_providers',
+        sa.Column('api_mode', sa.String(length=20), nullable=False, server_default='rest')
+    )
+
+
+def downgrade() -> None:
+    op.drop_column('git_providers', 'api_mode')
@@ -0,0 +1,62 @@
+"""add work_item_commits table and backfill from work_items.related_commits
+
+Revision ID: f6g7h8i9j0k1
+Revises: e5f6g7h8i9j0
+Create Date: 2026-10-17 13:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f6g7h8i9j0k1'
+down_revision: Union[str, None] = 'e5f6g7h8i9j0'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table('work_item_commits',
+        sa.Column('id', sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column('work_item_id', sa.Integer(), nullable=False),
+        sa.Column('github_repo', sa.String(length=200), nullable=False),
+        sa.Column('sha', sa.String(length=64), nullable=False),
+        sa.Column('created_at', sa.DateTime(), server_default=sa.text('now()'), nullable=False),
+        sa.ForeignKeyConstraint(['work_item_id'], ['work_items.id'], ondelete='CASCADE'),
+        sa.UniqueConstraint('github_repo', 'sha', name='uq_work_item_commits_repo_sha'),
+        sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index('ix_work_item_commits_work_item_id', 'work_item_commits', ['work_item_id'])
+
+    # 콤마 구분 문자열 → 행 단위 (저장소 내 중복 SHA는 먼저 등록된 항목에 연결)
+    op.execute("""
+        INSERT INTO work_item_commits (work_item_id, github_repo, sha)
+        SELECT DISTINCT ON (w.github_repo, btrim(c.sha)) w.id, w.github_repo, btrim(c.sha)
+        FROM work_items w
+        CROSS JOIN LATERAL unnest(string_to_array(w.related_commits, ',')) AS c(sha)
+        WHERE w.related_commits IS NOT NULL AND btrim(c.sha) <> ''
+        ORDER BY w.github_repo, btrim(c.sha), w.id
+    """)
+
+    op.drop_column('work_items', 'related_commits')
+
+
+def downgrade() -> None:
+    op.add_column('work_items', sa.Column('related_commits', sa.Text(), nullable=True))
+
+    op.execute("""
+        UPDATE work_items w
+        SET related_commits = c.shas
+        FROM (
+            SELECT work_item_id, string_agg(sha, ',' ORDER BY id) AS shas
+            FROM work_item_commits
+            GROUP BY work_item_id
+        ) c
+        WHERE w.id = c.work_item_id
+    """)
+
+    op.drop_index('ix_work_item_commits_work_item_id', table_name='work_item_commits')
+    op.drop_table('work_item_commits')
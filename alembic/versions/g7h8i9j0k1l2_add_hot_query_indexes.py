@@ -0,0 +1,53 @@
+"""add indexes for report and listing hot queries
+
+Revision ID: g7h8i9j0k1l2
+Revises: f6g7h8i9j0k1
+Create Date: 2026-10-17 14:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'g7h8i9j0k1l2'
+down_revision: Union[str, None] = 'f6g7h8i9j0k1'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # 동일 Issue 중복 행 정리 (가장 먼저 등록된 행 유지, 커밋 연결은 유지 행으로 이전)
+    op.execute("""
+        CREATE TEMPORARY TABLE work_item_duplicates ON COMMIT DROP AS
+        SELECT id, keep_id FROM (
+            SELECT id, min(id) OVER (PARTITION BY github_repo, github_issue_number) AS keep_id
+            FROM work_items
+            WHERE github_issue_number IS NOT NULL
+        ) t
+        WHERE id <> keep_id
+    """)
+    op.execute("""
+        UPDATE work_item_commits c
+        SET work_item_id = d.keep_id
+        FROM work_item_duplicates d
+        WHERE c.work_item_id = d.id
+    """)
+    op.execute("DELETE FROM work_items WHERE id IN (SELECT id FROM work_item_duplicates)")
+
+    op.create_index('ix_work_items_repo_issue', 'work_items', ['github_repo', 'github_issue_number'], unique=True)
+    op.create_index('ix_work_items_updated_at', 'work_items', ['updated_at'])
+    op.create_index('ix_work_items_category_updated_at', 'work_items', ['category', 'updated_at'])
+    op.create_index('ix_agent_logs_executed_at', 'agent_logs', ['executed_at'])
+    op.create_index('ix_agent_logs_agent_name_executed_at', 'agent_logs', ['agent_name', 'executed_at'])
+    op.create_index('ix_report_items_report_id', 'report_items', ['report_id'])
+
+
+def downgrade() -> None:
+    op.drop_index('ix_report_items_report_id', table_name='report_items')
+    op.drop_index('ix_agent_logs_agent_name_executed_at', table_name='agent_logs')
+    op.drop_index('ix_agent_logs_executed_at', table_name='agent_logs')
+    op.drop_index('ix_work_items_category_updated_at', table_name='work_items')
+    op.drop_index('ix_work_items_updated_at', table_name='work_items')
+    op.drop_index('ix_work_items_repo_issue', table_name='work_items')
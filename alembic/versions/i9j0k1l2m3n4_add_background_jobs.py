@@ -0,0 +1,46 @@
+"""add background_jobs table for queued manual triggers
+
+Revision ID: i9j0k1l2m3n4
+Revises: h8i9j0k1l2m3
+Create Date: 2026-10-17 16:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'i9j0k1l2m3n4'
+down_revision: Union[str, None] = 'h8i9j0k1l2m3'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table('background_jobs',
+        sa.Column('id', sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column('job_type', sa.String(length=50), nullable=False),
+        sa.Column('status', sa.String(length=20), nullable=False),
+        sa.Column('repos_done', sa.Integer(), nullable=False),
+        sa.Column('repos_total', sa.Integer(), nullable=False),
+        sa.Column('items_processed', sa.Integer(), nullable=False),
+        sa.Column('error_message', sa.Text(), nullable=True),
+        sa.Column('created_at', sa.DateTime(), server_default=sa.text('now()'), nullable=False),
+        sa.Column('started_at', sa.DateTime(), nullable=True),
+        sa.Column('finished_at', sa.DateTime(), nullable=True),
+        sa.PrimaryKeyConstraint('id')
+    )
+    # 같은 종류의 대기/실행 중 작업은 1개만 (동시 트리거 병합)
+    op.create_index(
+        'ux_background_jobs_active_type', 'background_jobs', ['job_type'],
+        unique=True, postgresql_where=sa.text("status IN ('queued', 'running')"),
+    )
+    op.create_index('ix_background_jobs_created_at', 'background_jobs', ['created_at'])
+
+
+def downgrade() -> None:
+    op.drop_index('ix_background_jobs_created_at', table_name='background_jobs')
+    op.drop_index('ux_background_jobs_active_type', table_name='background_jobs')
+    op.drop_table('background_jobs')
@@ -0,0 +1,41 @@
+"""allow a commit to link to multiple work items
+
+Revision ID: j0k1l2m3n4o5
+Revises: i9j0k1l2m3n4
+Create Date: 2026-10-17 17:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'j0k1l2m3n4o5'
+down_revision: Union[str, None] = 'i9j0k1l2m3n4'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # (저장소, SHA) → (저장소, SHA, 항목): 커밋 1개가 참조한 Issue 항목마다 1행
+    op.drop_constraint('uq_work_item_commits_repo_sha', 'work_item_commits', type_='unique')
+    op.create_unique_constraint(
+        'uq_work_item_commits_repo_sha_item', 'work_item_commits',
+        ['github_repo', 'sha', 'work_item_id'],
+    )
+
+
+def downgrade() -> None:
+    # 여러 항목에 연결된 커밋은 가장 먼저 연결된 행만 유지
+    op.execute("""
+        DELETE FROM work_item_commits c
+        USING work_item_commits keep
+        WHERE keep.github_repo = c.github_repo
+          AND keep.sha = c.sha
+          AND keep.id < c.id
+    """)
+    op.drop_constraint('uq_work_item_commits_repo_sha_item', 'work_item_commits', type_='unique')
+    op.create_unique_constraint(
+        'uq_work_item_commits_repo_sha', 'work_item_commits', ['github_repo', 'sha'],
+    )
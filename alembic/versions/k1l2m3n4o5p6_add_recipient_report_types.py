@@ -0,0 +1,59 @@
+"""normalize recipients.report_types into recipient_report_types
+
+Revision ID: k1l2m3n4o5p6
+Revises: j0k1l2m3n4o5
+Create Date: 2026-10-17 18:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'k1l2m3n4o5p6'
+down_revision: Union[str, None] = 'j0k1l2m3n4o5'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table('recipient_report_types',
+        sa.Column('recipient_id', sa.Integer(), nullable=False),
+        sa.Column('report_type', sa.String(length=20), nullable=False),
+        sa.ForeignKeyConstraint(['recipient_id'], ['recipients.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('recipient_id', 'report_type')
+    )
+    op.create_index(
+        'ix_recipient_report_types_type_recipient', 'recipient_report_types',
+        ['report_type', 'recipient_id'],
+    )
+
+    # 콤마 구분 문자열 → 유형별 1행 (공백 제거, 소문자, 빈 값 제외)
+    op.execute("""
+        INSERT INTO recipient_report_types (recipient_id, report_type)
+        SELECT DISTINCT r.id, lower(trim(t.report_type))
+        FROM recipients r
+        CROSS JOIN LATERAL unnest(string_to_array(r.report_types, ',')) AS t(report_type)
+        WHERE trim(t.report_type) <> ''
+    """)
+
+    op.drop_column('recipients', 'report_types')
+
+
+def downgrade() -> None:
+    op.add_column('recipients', sa.Column(
+        'report_types', sa.String(length=100), nullable=False, server_default='all'
+    ))
+    op.execute("""
+        UPDATE recipients r
+        SET report_types = COALESCE((
+            SELECT string_agg(t.report_type, ',' ORDER BY t.report_type)
+            FROM recipient_report_types t
+            WHERE t.recipient_id = r.id
+        ), '')
+    """)
+
+    op.drop_index('ix_recipient_report_types_type_recipient', table_name='recipient_report_types')
+    op.drop_table('recipient_report_types')
@@ -0,0 +1,37 @@
+"""add report_aggregates daily rollup table
+
+Revision ID: l2m3n4o5p6q7
+Revises: k1l2m3n4o5p6
+Create Date: 2026-10-17 19:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'l2m3n4o5p6q7'
+down_revision: Union[str, None] = 'k1l2m3n4o5p6'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table('report_aggregates',
+        sa.Column('id', sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column('aggregate_date', sa.Date(), nullable=False),
+        sa.Column('category', sa.String(length=20), nullable=False),
+        sa.Column('github_repo', sa.String(length=200), nullable=False),
+        sa.Column('item_count', sa.Integer(), nullable=False),
+        sa.Column('resolved_count', sa.Integer(), nullable=False),
+        sa.Column('last_updated_at', sa.DateTime(), nullable=True),
+        sa.Column('created_at', sa.DateTime(), server_default=sa.text('now()'), nullable=False),
+        sa.UniqueConstraint('aggregate_date', 'category', 'github_repo', name='uq_report_aggregates_date_category_repo'),
+        sa.PrimaryKeyConstraint('id')
+    )
+
+
+def downgrade() -> None:
+    op.drop_table('report_aggregates')
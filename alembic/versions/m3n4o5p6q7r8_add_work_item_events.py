@@ -0,0 +1,52 @@
+"""add work_item_events change log
+
+Revision ID: m3n4o5p6q7r8
+Revises: l2m3n4o5p6q7
+Create Date: 2026-10-17 20:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'm3n4o5p6q7r8'
+down_revision: Union[str, None] = 'l2m3n4o5p6q7'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table('work_item_events',
+        sa.Column('id', sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column('work_item_id', sa.Integer(), nullable=False),
+        sa.Column('event_type', sa.String(length=20), nullable=False),
+        sa.Column('category', sa.String(length=20), nullable=False),
+        sa.Column('status', sa.String(length=20), nullable=False),
+        sa.Column('changed_fields', sa.String(length=200), nullable=True),
+        sa.Column('commit_sha', sa.String(length=64), nullable=True),
+        sa.Column('created_at', sa.DateTime(), server_default=sa.text('now()'), nullable=False),
+        sa.ForeignKeyConstraint(['work_item_id'], ['work_items.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index('ix_work_item_events_created_at', 'work_item_events', ['created_at'], unique=False)
+    op.create_index(
+        'ix_work_item_events_item_created', 'work_item_events', ['work_item_id', 'created_at'], unique=False
+    )
+
+    # 기존 항목은 현재 상태를 생성 이력으로 기록 (이력 시작점)
+    op.execute(
+        """
+        INSERT INTO work_item_events (work_item_id, event_type, category, status, created_at)
+        SELECT id, 'created', lower(category::text), lower(status::text), created_at
+        FROM work_items
+        """
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_work_item_events_item_created', table_name='work_item_events')
+    op.drop_index('ix_work_item_events_created_at', table_name='work_item_events')
+    op.drop_table('work_item_events')
@@ -0,0 +1,27 @@
+"""add work_items.content_hash
+
+Revision ID: n4o5p6q7r8s9
+Revises: m3n4o5p6q7r8
+Create Date: 2026-10-17 21:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'n4o5p6q7r8s9'
+down_revision: Union[str, None] = 'm3n4o5p6q7r8'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # 기존 항목은 NULL → 다음 스캔에서 조회될 때 해시 기록 (updated_at 유지)
+    op.add_column('work_items', sa.Column('content_hash', sa.String(length=64), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column('work_items', 'content_hash')
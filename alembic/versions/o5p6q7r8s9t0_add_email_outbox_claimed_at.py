@@ -0,0 +1,27 @@
+"""add email_outbox.claimed_at
+
+Revision ID: o5p6q7r8s9t0
+Revises: n4o5p6q7r8s9
+Create Date: 2026-10-18 10:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'o5p6q7r8s9t0'
+down_revision: Union[str, None] = 'n4o5p6q7r8s9'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # 배포 시점에 발송 중인 행(claimed_at NULL)은 이전 프로세스 중단분 → 다음 drain에서 복구
+    op.add_column('email_outbox', sa.Column('claimed_at', sa.DateTime(), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column('email_outbox', 'claimed_at')
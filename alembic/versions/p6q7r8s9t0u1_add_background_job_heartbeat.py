@@ -0,0 +1,27 @@
+"""add background_jobs.heartbeat_at
+
+Revision ID: p6q7r8s9t0u1
+Revises: o5p6q7r8s9t0
+Create Date: 2026-10-18 11:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'p6q7r8s9t0u1'
+down_revision: Union[str, None] = 'o5p6q7r8s9t0'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # 기존 실행 중 작업(heartbeat_at NULL)은 started_at/created_at 기준으로 중단 판정
+    op.add_column('background_jobs', sa.Column('heartbeat_at', sa.DateTime(), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column('background_jobs', 'heartbeat_at')
@@ -4,82 +4,124 @@ Autonomous-QA-Agent
 """
 
 import time
+import hashlib
 import logging
-from datetime import datetime, timedelta
+from datetime import timedelta
 
 from sqlalchemy.orm import Session
 
 from ..core.database import SessionLocal
-from ..services.github_service import get_github_service, create_github_service_from_provider
-from ..services import config_service
 from ..models.issue import WorkItem, ItemCategory, ItemStatus
 from ..models.agent_log import AgentLog
+from ..services import cursor_service
+from ..services.cursor_service import STREAM_ISSUES
+from .scan_pool import (
+    resolve_scan_targets, assign_since, get_scan_workers, get_scan_queue_pages,
+    fetch_pages_concurrently, RepoScanState, request_stats, api_modes, format_repo_timings,
+)
 
 logger = logging.getLogger(__name__)
 
 
+def issue_content_hash(issue_data: dict) -> str:
+    """Issue 내용 해시 - 제목/본문/라벨(순서 무관)/분류/상태/종료 시각을 정규화하여 SHA-256"""
+    fields = (
+        issue_data["title"].strip(),
+        (issue_data["body"] or "")[:1000].replace("\r\n", "\n").strip(),
+        ",".join(sorted(issue_data["labels"])),
+        issue_data["category"].value,
+        issue_data["state"],
+        issue_data["closed_at"].isoformat() if issue_data["closed_at"] else "",
+    )
+    return hashlib.sha256("\x1f".join(fields).encode()).hexdigest()
+
+
 class QAAgent:
     """GitHub Issues 자동 검수 Agent"""
 
     INITIAL_SCAN_DAYS = 30
-    REGULAR_SCAN_HOURS = 2
+    UPSERT_BATCH_SIZE = 500
 
-    def run(self):
-        """Agent 실행 (스케줄러에서 호출)"""
+    def run(self, progress=None):
+        """Agent 실행 (스케줄러/백그라운드 작업에서 호출, progress: 저장소 단위 진행률 기록)"""
         logger.info("=== Autonomous-QA-Agent 실행 시작 ===")
         start_time = time.time()
 
         db = SessionLocal()
         try:
-            existing_count = db.query(WorkItem).count()
-            if existing_count == 0:
-                since = datetime.now() - timedelta(days=self.INITIAL_SCAN_DAYS)
-                logger.info(f"초기 스캔 모드: 최근 {self.INITIAL_SCAN_DAYS}일")
-            else:
-                since = datetime.now() - timedelta(hours=self.REGULAR_SCAN_HOURS)
-                logger.info(f"정기 스캔 모드: 최근 {self.REGULAR_SCAN_HOURS}시간")
+            targets = resolve_scan_targets(db)
+            if targets is None:
+                logger.warning("GitHub 토큰 미설정. QA-Agent 건너뜀.")
+                if progress:
+                    progress.fail("GitHub 토큰 미설정")
+                return
 
+            # 저장소별 커서 이후 변경분만 조회 (커서 없으면 초기 스캔)
+            cursors = cursor_service.load_cursors(db, STREAM_ISSUES)
+            initial_since = cursor_service.utc_naive() - timedelta(days=self.INITIAL_SCAN_DAYS)
+            initial_count = assign_since(targets, cursors, initial_since)
+            logger.info(
+                f"증분 스캔: 저장소 {len(targets)}개 "
+                f"(초기 스캔 {initial_count}개, 최근 {self.INITIAL_SCAN_DAYS}일)"
+            )
+
+            workers = get_scan_workers(db)
+            if progress:
+                progress.add_total(len(targets))
             total_new = 0
             total_updated = 0
+            total_unchanged = 0
+            timings = []
+            repo_states: dict[int, RepoScanState] = {}
 
-            # DB에 git_providers가 있으면 등록된 리포만 스캔
-            providers = config_service.get_active_git_providers(db)
-            if providers:
-                for provider in providers:
-                    github = create_github_service_from_provider(provider)
-                    if not github.is_configured:
-                        continue
-                    repos = config_service.get_active_repositories(db, provider.id)
-                    if repos:
-                        # 등록된 리포만 스캔
-                        for repo in repos:
-                            new, updated = self._scan_repo(db, github, repo.repo_name, since)
-                            total_new += new
-                            total_updated += updated
-                    else:
-                        # 리포 등록 없으면 조직 전체 스캔
-                        org_repos = github.get_org_repos()
-                        for repo in org_repos:
-                            new, updated = self._scan_repo(db, github, repo["name"], since)
-                            total_new += new
-                            total_updated += updated
-            else:
-                # .env fallback: 기존 방식
-                github = get_github_service()
-                if not github.is_configured:
-                    logger.warning("GitHub 토큰 미설정. QA-Agent 건너뜀.")
-                    return
-
-                repos = github.get_org_repos()
-                for repo in repos:
-                    new, updated = self._scan_repo(db, github, repo["name"], since)
+            # GitHub 조회는 병렬, DB 쓰기는 현재 스레드에서 페이지 단위로 직렬 처리
+            requests_before = request_stats(targets)
+            pages = fetch_pages_concurrently(targets, STREAM_ISSUES, workers, get_scan_queue_pages())
+            for page in pages:
+                target = page.target
+                state = repo_states.setdefault(id(target), RepoScanState())
+                write_start = time.time()
+
+                if page.items:
+                    new, updated, unchanged = self.apply_issues(db, target.repo_name, page.items)
                     total_new += new
                     total_updated += updated
+                    total_unchanged += unchanged
+                    state.processed += new + updated
+                    newest = max(issue_data["updated_at"] for issue_data in page.items)
+                    if state.cursor_at is None or newest > state.cursor_at:
+                        state.cursor_at = newest
+
+                # 커서는 저장소 전체 페이지를 반영한 뒤에만 전진 (최신순 조회 → 중단 시 누락 방지)
+                if page.done and state.cursor_at is not None and not page.failed:
+                    cursor_service.advance_cursor(
+                        db, cursors, target.github.provider_key, target.repo_name, STREAM_ISSUES,
+                        cursor_at=state.cursor_at,
+                    )
+                    db.commit()
+                state.write_seconds += time.time() - write_start
 
+                if page.done:
+                    timings.append((target.repo_name, page.fetch_seconds, state.write_seconds))
+                    if progress:
+                        progress.advance(state.processed)
+                elif progress:
+                    # 페이지가 많은 저장소 처리 중에도 작업 생존 기록
+                    progress.heartbeat()
+
+            request_count, request_seconds = (
+                after - before for after, before in zip(request_stats(targets), requests_before)
+            )
             duration = time.time() - start_time
+            total_fetched = total_new + total_updated + total_unchanged
+            # 저장 처리량 (비교/반영한 행 수 / 저장소별 저장 시간 합계)
+            write_seconds = sum(repo_write for _, _, repo_write in timings)
+            write_rate = total_fetched / write_seconds if write_seconds > 0 else 0.0
             logger.info(
-                f"=== QA-Agent 완료: 신규 {total_new}건, 갱신 {total_updated}건 "
-                f"({duration:.1f}초) ==="
+                f"=== QA-Agent 완료: 조회 {total_fetched}건 (신규 {total_new}, 변경 {total_updated}, "
+                f"미변경 {total_unchanged}) "
+                f"(저장소 {len(targets)}개, 병렬 {workers}, API {request_count}회, "
+                f"저장 {write_rate:.0f}건/초, {duration:.1f}초) ==="
             )
 
             # 실행 이력 기록
@@ -87,7 +129,14 @@ class QAAgent:
                 agent_name="QA-Agent",
                 action="issues_scan",
                 status="success",
-                detail=f"신규 {total_new}건, 갱신 {total_updated}건",
+                detail=(
+                    f"조회 {total_fetched}건, 변경 {total_new + total_updated}건"
+                    f"(신규 {total_new}, 갱신 {total_updated}), 미변경 {total_unchanged}건 | "
+                    f"저장소 {len(targets)}개, 병렬 {workers} | "
+                    f"저장 {write_seconds:.2f}초 ({write_rate:.0f}건/초) | "
+                    f"API({api_modes(targets)}) {request_count}회 {request_seconds:.2f}초 | "
+                    f"저장소별(조회/저장 초): {format_repo_timings(timings)}"
+                ),
                 items_processed=total_new + total_updated,
                 duration_seconds=round(duration, 2),
             )
@@ -97,6 +146,8 @@ class QAAgent:
         except Exception as e:
             duration = time.time() - start_time
             logger.error(f"QA-Agent 오류: {e}", exc_info=True)
+            if progress:
+                progress.fail(str(e))
             try:
                 db.rollback()
                 log = AgentLog(
@@ -113,33 +164,85 @@ class QAAgent:
         finally:
             db.close()
 
-    def _scan_repo(
-        self, db: Session, github, repo_name: str, since: datetime
-    ) -> tuple[int, int]:
-        """저장소 Issues 스캔"""
-        issues = github.get_issues(repo_name, since=since)
+    def apply_issues(
+        self, db: Session, repo_name: str, issues: list[dict]
+    ) -> tuple[int, int, int]:
+        """조회된 Issues를 배치 단위로 upsert - 폴링/웹훅 공용 (Returns: 신규, 갱신, 미변경 건수)"""
         new_count = 0
         updated_count = 0
+        unchanged_count = 0
 
-        for issue_data in issues:
-            existing = (
-                db.query(WorkItem)
-                .filter(
+        for start in range(0, len(issues), self.UPSERT_BATCH_SIZE):
+            batch = issues[start:start + self.UPSERT_BATCH_SIZE]
+            new, updated, unchanged = self._upsert_issues(db, repo_name, batch)
+            db.commit()
+            new_count += new
+            updated_count += updated
+            unchanged_count += unchanged
+
+        if new_count or updated_count:
+            logger.info(
+                f"  [{repo_name}] 신규: {new_count}, 갱신: {updated_count}, 미변경: {unchanged_count}"
+            )
+
+        return new_count, updated_count, unchanged_count
+
+    def _upsert_issues(
+        self, db: Session, repo_name: str, issues: list[dict]
+    ) -> tuple[int, int, int]:
+        """
+        Issue 배치 upsert - 저장된 내용 해시를 먼저 조회하여 변경 없는 Issue는 로딩/갱신 생략
+        - 해시가 다른 항목만 전체 행을 조회하여 바뀐 필드만 반영
+        """
+        hashes = {issue_data["number"]: issue_content_hash(issue_data) for issue_data in issues}
+        stored_hashes = dict(
+            db.query(WorkItem.github_issue_number, WorkItem.content_hash).filter(
+                WorkItem.github_repo == repo_name,
+                WorkItem.github_issue_number.in_(hashes),
+            )
+        )
+        stale = [number for number, stored in stored_hashes.items() if stored != hashes[number]]
+        existing_items = {}
+        if stale:
+            existing_items = {
+                item.github_issue_number: item
+                for item in db.query(WorkItem).filter(
                     WorkItem.github_repo == repo_name,
-                    WorkItem.github_issue_number == issue_data["number"],
+                    WorkItem.github_issue_number.in_(stale),
                 )
-                .first()
-            )
+            }
+
+        new_items = []
+        updated_count = 0
+        unchanged_count = 0
+        for issue_data in issues:
+            number = issue_data["number"]
+            content_hash = hashes[number]
+            existing = existing_items.get(number)
+
+            if existing is None and number in stored_hashes:
+                # 저장된 해시와 동일 → 행을 건드리지 않음
+                unchanged_count += 1
+                continue
 
             if existing:
-                existing.title = issue_data["title"]
-                existing.summary = issue_data["body"][:1000] if issue_data["body"] else None
-                existing.labels = ",".join(issue_data["labels"])
-                existing.category = issue_data["category"]
+                values = {
+                    "title": issue_data["title"],
+                    "summary": issue_data["body"][:1000] if issue_data["body"] else None,
+                    "labels": ",".join(issue_data["labels"]),
+                    "category": issue_data["category"],
+                }
                 if issue_data["state"] == "closed" and existing.status != ItemStatus.CLOSED:
-                    existing.status = ItemStatus.CLOSED
-                    existing.resolved_at = issue_data["closed_at"]
-                updated_count += 1
+                    values["status"] = ItemStatus.CLOSED
+                    values["resolved_at"] = issue_data["closed_at"]
+                # 내용이 바뀐 항목만 갱신 (updated_at/변경 이력도 이 경우에만 기록)
+                if existing.apply_changes(values):
+                    updated_count += 1
+                else:
+                    # 해시만 다름 (해시 미기록 항목, 정규화 차이) → updated_at 유지
+                    existing.updated_at = WorkItem.updated_at
+                    unchanged_count += 1
+                existing.content_hash = content_hash
             else:
                 status = (
                     ItemStatus.CLOSED if issue_data["state"] == "closed"
@@ -147,24 +250,24 @@ class QAAgent:
                 )
                 work_item = WorkItem(
                     github_repo=repo_name,
-                    github_issue_number=issue_data["number"],
+                    github_issue_number=number,
                     github_issue_url=issue_data["url"],
                     category=issue_data["category"],
                     status=status,
                     title=issue_data["title"],
                     summary=issue_data["body"][:1000] if issue_data["body"] else None,
                     labels=",".join(issue_data["labels"]),
+                    content_hash=content_hash,
                 )
                 if issue_data["state"] == "closed":
                     work_item.resolved_at = issue_data["closed_at"]
-                db.add(work_item)
-                new_count += 1
-
-        db.commit()
-        if new_count or updated_count:
-            logger.info(f"  [{repo_name}] 신규: {new_count}, 갱신: {updated_count}")
+                # 같은 배치 내 중복 번호 방지
+                existing_items[number] = work_item
+                new_items.append(work_item)
 
-        return new_count, updated_count
+        # INSERT는 executemany로 묶여 전송됨
+        db.add_all(new_items)
+        return len(new_items), updated_count, unchanged_count
 
 
 # 싱글톤
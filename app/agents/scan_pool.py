@@ -0,0 +1,206 @@
+"""
+Agent 공통 저장소 스캔 헬퍼
+GitHub 조회는 프로바이더별 스레드 풀에서 병렬 실행, DB 쓰기는 호출 스레드에서 페이지 단위로 직렬 처리
+"""
+
+import time
+import queue
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import ExitStack
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Iterator, Optional
+
+from sqlalchemy.orm import Session
+
+from ..core.config import settings
+from ..services.github_service import (
+    GitHubService, get_github_service, create_github_service_from_provider,
+)
+from ..services import config_service
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class ScanTarget:
+    """스캔 대상 저장소"""
+    github: GitHubService
+    repo_name: str
+    since: Optional[datetime] = None
+
+
+@dataclass
+class ScanPage:
+    """저장소 조회 결과 한 페이지 (done=True는 저장소 조회 종료 알림, items 없음)"""
+    target: ScanTarget
+    items: list[dict]
+    done: bool = False
+    failed: bool = False
+    fetch_seconds: float = 0.0
+
+
+@dataclass
+class RepoScanState:
+    """저장소별 페이지 반영 누적 상태 (done 페이지에서 커서 전진/진행률 기록에 사용)"""
+    cursor_at: Optional[datetime] = None
+    cursor_sha: Optional[str] = None
+    write_seconds: float = 0.0
+    processed: int = 0
+
+
+def resolve_scan_targets(db: Session) -> Optional[list[ScanTarget]]:
+    """스캔 대상 저장소 목록 조회 (DB 프로바이더 → .env fallback, 미설정 시 None)"""
+    targets = []
+
+    # DB에 git_providers가 있으면 등록된 리포만 스캔
+    providers = config_service.get_active_git_providers(db)
+    if providers:
+        for provider in providers:
+            github = create_github_service_from_provider(provider)
+            if not github.is_configured:
+                continue
+            repos = config_service.get_active_repositories(db, provider.id)
+            if repos:
+                targets.extend(ScanTarget(github, repo.repo_name) for repo in repos)
+            else:
+                # 리포 등록 없으면 조직 전체 스캔
+                targets.extend(ScanTarget(github, repo["name"]) for repo in github.get_org_repos())
+        return targets
+
+    # .env fallback: 기존 방식
+    github = get_github_service()
+    if not github.is_configured:
+        return None
+    return [ScanTarget(github, repo["name"]) for repo in github.get_org_repos()]
+
+
+def assign_since(targets: list[ScanTarget], cursors: dict, initial_since: datetime) -> int:
+    """커서가 있으면 커서 지점부터, 없으면 initial_since부터 조회하도록 설정. 초기 스캔 수 반환"""
+    initial_count = 0
+    for target in targets:
+        cursor = cursors.get((target.github.provider_key, target.repo_name))
+        if cursor:
+            target.since = cursor.cursor_at
+        else:
+            target.since = initial_since
+            initial_count += 1
+    return initial_count
+
+
+def get_scan_workers(db: Session) -> int:
+    """프로바이더당 동시 조회 스레드 수 (1이면 순차 실행)"""
+    workers = config_service.get_setting_int(db, "agent_scan_workers", settings.agent_scan_workers)
+    return max(1, workers)
+
+
+def get_scan_queue_pages() -> int:
+    """조회 → DB 쓰기 대기 페이지 수 (메모리 상한)"""
+    return max(1, settings.agent_scan_queue_pages)
+
+
+def fetch_pages_concurrently(
+    targets: list[ScanTarget],
+    stream: str,
+    max_workers: int,
+    queue_pages: int,
+) -> Iterator[ScanPage]:
+    """
+    저장소별 issues/commits를 페이지 단위로 조회하여 도착 순서대로 반환
+    - 저장소마다 마지막에 done 페이지 (failed면 일부 페이지만 반환된 상태 → 커서 전진 금지)
+    - 프로바이더마다 별도 풀을 두어 토큰별 동시 요청 수를 max_workers로 제한
+    - GraphQL 프로바이더는 BATCH_SIZE개 저장소를 한 요청으로 묶어 조회
+    - 대기 페이지가 queue_pages개에 이르면 조회 스레드가 대기 → 저장소 크기와 무관하게 메모리 일정
+    """
+    chunks = []
+    by_provider: dict[int, list[ScanTarget]] = {}
+    for target in targets:
+        by_provider.setdefault(id(target.github), []).append(target)
+    for provider_targets in by_provider.values():
+        size = provider_targets[0].github.BATCH_SIZE
+        chunks.extend(provider_targets[i:i + size] for i in range(0, len(provider_targets), size))
+
+    def _scan_pages(chunk: list[ScanTarget]) -> Iterator[ScanPage]:
+        """chunk 조회 (소비 측 대기 시간은 조회 소요초에서 제외)"""
+        by_name = {target.repo_name: target for target in chunk}
+        fetch_seconds = 0.0
+        failed = False
+        started = time.time()
+        try:
+            pages = chunk[0].github.iter_batch(stream, [(t.repo_name, t.since) for t in chunk])
+            for repo_name, items in pages:
+                fetch_seconds += time.time() - started
+                yield ScanPage(by_name[repo_name], items)
+                started = time.time()
+        except Exception as e:
+            logger.error(f"저장소 조회 실패 ({', '.join(by_name)}): {e}")
+            failed = True
+        fetch_seconds += time.time() - started
+        for target in chunk:
+            yield ScanPage(target, [], done=True, failed=failed, fetch_seconds=fetch_seconds)
+
+    if max_workers <= 1:
+        # 순차 실행: 한 페이지 조회 → 저장 반복
+        for chunk in chunks:
+            yield from _scan_pages(chunk)
+        return
+
+    pages: queue.Queue = queue.Queue(maxsize=queue_pages)
+    stopped = threading.Event()
+
+    def _run(chunk: list[ScanTarget]) -> None:
+        # 소비 측이 중단되면 (stopped) 대기 중인 조회 스레드도 종료, 시작 전이면 조회하지 않음
+        if stopped.is_set():
+            return
+        for page in _scan_pages(chunk):
+            while not stopped.is_set():
+                try:
+                    pages.put(page, timeout=0.5)
+                    break
+                except queue.Full:
+                    continue
+            if stopped.is_set():
+                return
+
+    with ExitStack() as stack:
+        pools: dict[int, ThreadPoolExecutor] = {}
+        try:
+            for chunk in chunks:
+                key = id(chunk[0].github)
+                if key not in pools:
+                    pools[key] = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="repo-scan")
+                    # 중단 시 아직 시작하지 않은 chunk는 취소, 실행 중인 스레드는 종료 대기
+                    stack.callback(pools[key].shutdown, wait=True, cancel_futures=True)
+                pools[key].submit(_run, chunk)
+
+            remaining = len(targets)
+            while remaining:
+                page = pages.get()
+                if page.done:
+                    remaining -= 1
+                yield page
+        finally:
+            stopped.set()
+
+
+def request_stats(targets: list[ScanTarget]) -> tuple[int, float]:
+    """대상 프로바이더들의 누적 (API 요청 수, 요청 소요초) 합계"""
+    services = {id(t.github): t.github for t in targets}
+    totals = [service.request_stats() for service in services.values()]
+    return sum(t[0] for t in totals), sum(t[1] for t in totals)
+
+
+def api_modes(targets: list[ScanTarget]) -> str:
+    """대상 프로바이더들의 조회 방식 요약 (예: rest, graphql)"""
+    return ", ".join(sorted({t.github.API_MODE for t in targets})) or "-"
+
+
+def format_repo_timings(timings: list[tuple[str, float, float]], limit: int = 20) -> str:
+    """저장소별 (조회초/저장초) 요약 - 조회 시간 내림차순 상위 limit개"""
+    ordered = sorted(timings, key=lambda t: t[1], reverse=True)
+    parts = [f"{repo}={fetch:.2f}/{write:.2f}" for repo, fetch, write in ordered[:limit]]
+    if len(ordered) > limit:
+        parts.append(f"외 {len(ordered) - limit}개")
+    return ", ".join(parts)
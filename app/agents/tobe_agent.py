@@ -7,90 +7,175 @@ import re
 import time
 import logging
 from datetime import datetime, timedelta
+from typing import NamedTuple
 
+from sqlalchemy import func
 from sqlalchemy.orm import Session
 
 from ..core.database import SessionLocal
-from ..services.github_service import get_github_service, create_github_service_from_provider
-from ..services import config_service
 from ..models.issue import WorkItem, ItemCategory, ItemStatus
+from ..models.work_item_commit import WorkItemCommit
 from ..models.agent_log import AgentLog
+from ..services import cursor_service
+from ..services.cursor_service import STREAM_COMMITS
+from .scan_pool import (
+    resolve_scan_targets, assign_since, get_scan_workers, get_scan_queue_pages,
+    fetch_pages_concurrently, RepoScanState, request_stats, api_modes, format_repo_timings,
+)
 
 logger = logging.getLogger(__name__)
 
-# Issue 번호 추출 패턴
-_ISSUE_PATTERNS = [
-    re.compile(r"#(\d+)"),
-    re.compile(r"[Cc]loses?\s+#(\d+)"),
-    re.compile(r"[Ff]ixes?\s+#(\d+)"),
-    re.compile(r"[Rr]esolves?\s+#(\d+)"),
-]
+# Issue 참조 종류
+REF_CLOSES = "closes"
+REF_FIXES = "fixes"
+REF_RESOLVES = "resolves"
+REF_REFS = "refs"
+CLOSING_REFS = (REF_CLOSES, REF_FIXES, REF_RESOLVES)
+
+# Issue 참조 패턴 - #번호를 기준으로 찾고 닫기 키워드는 번호 앞에서만 확인
+# - 리터럴 '#'로 시작 → 정규식 엔진이 '#' 위치만 검사 (선택 키워드 그룹을 앞에 두면 매 위치 시도)
+# - owner/repo#N, abc#N 같은 다른 저장소/단어 내 참조는 제외
+_ISSUE_NUMBER_RE = re.compile(r"#(?<![\w/#]#)(\d+)\b")
+# "키워드[:] #N"의 키워드 (바로 뒤의 #번호에만 적용, GitHub과 동일)
+_CLOSING_KEYWORD_RE = re.compile(r"(?<!\w)(?:close[sd]?|fix(?:e[sd])?|resolve[sd]?)\Z", re.IGNORECASE)
+_CLOSING_KEYWORD_MAX_LEN = len("resolves")
+# 키워드 어간 → 참조 종류 (closes/closed, fixes/fixed, resolves/resolved)
+_KEYWORD_STEMS = (("close", REF_CLOSES), ("fix", REF_FIXES), ("resolve", REF_RESOLVES))
+
+
+def _skip_spaces_back(text: str, end: int) -> int:
+    while end and text[end - 1].isspace():
+        end -= 1
+    return end
+
+
+def _ref_action(message: str, hash_pos: int) -> str:
+    """#번호 앞의 닫기 키워드로 참조 종류 결정 (키워드와 # 사이: 공백* [:] 공백+)"""
+    if not hash_pos or not message[hash_pos - 1].isspace():
+        return REF_REFS
+    end = _skip_spaces_back(message, hash_pos)
+    if end and message[end - 1] == ":":
+        end = _skip_spaces_back(message, end - 1)
+    match = _CLOSING_KEYWORD_RE.search(message, max(0, end - _CLOSING_KEYWORD_MAX_LEN), end)
+    if not match:
+        return REF_REFS
+    keyword = match.group().lower()
+    return next(action for stem, action in _KEYWORD_STEMS if keyword.startswith(stem))
+
+
+class IssueRef(NamedTuple):
+    """커밋 메시지의 Issue 참조"""
+    number: int
+    action: str
+
+    @property
+    def closes(self) -> bool:
+        return self.action in CLOSING_REFS
+
+
+def extract_issue_refs(commit_message: str) -> list[IssueRef]:
+    """커밋 메시지에서 참조된 Issue 번호 전체 추출 (등장 순서, 같은 번호는 닫기 참조 우선)"""
+    if "#" not in commit_message:
+        return []
+    refs: dict[int, str] = {}
+    for match in _ISSUE_NUMBER_RE.finditer(commit_message):
+        number = int(match[1])
+        if refs.get(number) in CLOSING_REFS:
+            continue
+        refs[number] = _ref_action(commit_message, match.start())
+    return [IssueRef(number, action) for number, action in refs.items()]
 
 
 class TobeAgent:
     """진행사항 추적 Agent"""
 
     INITIAL_SCAN_DAYS = 14
-    REGULAR_SCAN_HOURS = 1
 
-    def run(self):
-        """Agent 실행 (스케줄러에서 호출)"""
+    def run(self, progress=None):
+        """Agent 실행 (스케줄러/백그라운드 작업에서 호출, progress: 저장소 단위 진행률 기록)"""
         logger.info("=== Auto-Tobe-Agent 실행 시작 ===")
         start_time = time.time()
 
         db = SessionLocal()
         try:
-            commit_items = db.query(WorkItem).filter(
-                WorkItem.related_commits.isnot(None)
-            ).count()
-            if commit_items == 0:
-                since = datetime.now() - timedelta(days=self.INITIAL_SCAN_DAYS)
-                logger.info(f"초기 스캔 모드: 최근 {self.INITIAL_SCAN_DAYS}일")
-            else:
-                since = datetime.now() - timedelta(hours=self.REGULAR_SCAN_HOURS)
-                logger.info(f"정기 스캔 모드: 최근 {self.REGULAR_SCAN_HOURS}시간")
+            targets = resolve_scan_targets(db)
+            if targets is None:
+                logger.warning("GitHub 토큰 미설정. Tobe-Agent 건너뜀.")
+                if progress:
+                    progress.fail("GitHub 토큰 미설정")
+                return
+
+            # 저장소별 커서 이후 커밋만 조회 (커서 없으면 초기 스캔)
+            cursors = cursor_service.load_cursors(db, STREAM_COMMITS)
+            initial_since = cursor_service.utc_naive() - timedelta(days=self.INITIAL_SCAN_DAYS)
+            initial_count = assign_since(targets, cursors, initial_since)
+            logger.info(
+                f"증분 스캔: 저장소 {len(targets)}개 "
+                f"(초기 스캔 {initial_count}개, 최근 {self.INITIAL_SCAN_DAYS}일)"
+            )
 
+            workers = get_scan_workers(db)
+            if progress:
+                progress.add_total(len(targets))
             total_tracked = 0
+            timings = []
 
-            # DB에 git_providers가 있으면 등록된 리포만 스캔
-            providers = config_service.get_active_git_providers(db)
-            if providers:
-                for provider in providers:
-                    github = create_github_service_from_provider(provider)
-                    if not github.is_configured:
-                        continue
-                    repos = config_service.get_active_repositories(db, provider.id)
-                    if repos:
-                        for repo in repos:
-                            tracked = self._track_progress(db, github, repo.repo_name, since)
-                            total_tracked += tracked
-                    else:
-                        org_repos = github.get_org_repos()
-                        for repo in org_repos:
-                            tracked = self._track_progress(db, github, repo["name"], since)
-                            total_tracked += tracked
-            else:
-                # .env fallback: 기존 방식
-                github = get_github_service()
-                if not github.is_configured:
-                    logger.warning("GitHub 토큰 미설정. Tobe-Agent 건너뜀.")
-                    return
-
-                repos = github.get_org_repos()
-                for repo in repos:
-                    tracked = self._track_progress(db, github, repo["name"], since)
+            repo_states: dict[int, RepoScanState] = {}
+
+            # GitHub 조회는 병렬, DB 쓰기는 현재 스레드에서 페이지 단위로 직렬 처리
+            requests_before = request_stats(targets)
+            pages = fetch_pages_concurrently(targets, STREAM_COMMITS, workers, get_scan_queue_pages())
+            for page in pages:
+                target = page.target
+                state = repo_states.setdefault(id(target), RepoScanState())
+                write_start = time.time()
+
+                if page.items:
+                    tracked = self.apply_commits(db, target.repo_name, page.items)
                     total_tracked += tracked
+                    state.processed += tracked
+                    dated = [c for c in page.items if c["date"]]
+                    if dated:
+                        newest = max(dated, key=lambda c: c["date"])
+                        if state.cursor_at is None or newest["date"] > state.cursor_at:
+                            state.cursor_at, state.cursor_sha = newest["date"], newest["sha"]
 
+                # 커서는 저장소 전체 페이지를 반영한 뒤에만 전진 (최신순 조회 → 중단 시 누락 방지)
+                if page.done and state.cursor_at is not None and not page.failed:
+                    cursor_service.advance_cursor(
+                        db, cursors, target.github.provider_key, target.repo_name, STREAM_COMMITS,
+                        cursor_at=state.cursor_at, cursor_sha=state.cursor_sha,
+                    )
+                    db.commit()
+                state.write_seconds += time.time() - write_start
+
+                if page.done:
+                    timings.append((target.repo_name, page.fetch_seconds, state.write_seconds))
+                    if progress:
+                        progress.advance(state.processed)
+                elif progress:
+                    # 페이지가 많은 저장소 처리 중에도 작업 생존 기록
+                    progress.heartbeat()
+
+            request_count, request_seconds = (
+                after - before for after, before in zip(request_stats(targets), requests_before)
+            )
             duration = time.time() - start_time
             logger.info(
-                f"=== Tobe-Agent 완료: 추적 {total_tracked}건 ({duration:.1f}초) ==="
+                f"=== Tobe-Agent 완료: 추적 {total_tracked}건 "
+                f"(저장소 {len(targets)}개, 병렬 {workers}, API {request_count}회, {duration:.1f}초) ==="
             )
 
             log = AgentLog(
                 agent_name="Tobe-Agent",
                 action="commit_track",
                 status="success",
-                detail=f"추적 {total_tracked}건",
+                detail=(
+                    f"추적 {total_tracked}건 | "
+                    f"저장소 {len(targets)}개, 병렬 {workers} | "
+                    f"API({api_modes(targets)}) {request_count}회 {request_seconds:.2f}초 | "
+                    f"저장소별(조회/저장 초): {format_repo_timings(timings)}"
+                ),
                 items_processed=total_tracked,
                 duration_seconds=round(duration, 2),
             )
@@ -100,6 +185,8 @@ class TobeAgent:
         except Exception as e:
             duration = time.time() - start_time
             logger.error(f"Tobe-Agent 오류: {e}", exc_info=True)
+            if progress:
+                progress.fail(str(e))
             try:
                 db.rollback()
                 log = AgentLog(
@@ -116,58 +203,65 @@ class TobeAgent:
         finally:
             db.close()
 
-    def _track_progress(
-        self, db: Session, github, repo_name: str, since: datetime
-    ) -> int:
-        """커밋 기반 진행사항 추적"""
-        commits = github.get_recent_commits(repo_name, since=since)
-        tracked = 0
+    def apply_commits(self, db: Session, repo_name: str, commits: list[dict]) -> int:
+        """조회된 커밋을 진행사항으로 반영 - 폴링/웹훅 공용 (기존 커밋/연결 Issue는 저장소 단위로 일괄 조회)"""
+        if not commits:
+            return 0
 
-        for commit_data in commits:
-            message = commit_data["message"].split("\n")[0]
+        # 이미 반영된 커밋 SHA
+        shas = {commit_data["sha"] for commit_data in commits}
+        known = {
+            sha for (sha,) in db.query(WorkItemCommit.sha).filter(
+                WorkItemCommit.github_repo == repo_name,
+                WorkItemCommit.sha.in_(shas),
+            )
+        }
 
-            existing = (
-                db.query(WorkItem)
-                .filter(
+        # 커밋 메시지가 참조하는 Issue 항목 (커밋 1개 → 여러 Issue)
+        issue_refs = {
+            commit_data["sha"]: extract_issue_refs(commit_data["message"])
+            for commit_data in commits
+            if commit_data["sha"] not in known
+        }
+        referenced = {ref.number for refs in issue_refs.values() for ref in refs}
+        issue_items = {}
+        if referenced:
+            issue_items = {
+                item.github_issue_number: item
+                for item in db.query(WorkItem).filter(
                     WorkItem.github_repo == repo_name,
-                    WorkItem.related_commits.contains(commit_data["sha"]),
+                    WorkItem.github_issue_number.in_(referenced),
                 )
-                .first()
-            )
-            if existing:
+            }
+
+        tracked = 0
+        for commit_data in commits:
+            sha = commit_data["sha"]
+            if sha in known:
                 continue
+            known.add(sha)
 
-            issue_number = self._extract_issue_number(commit_data["message"])
-            if issue_number:
-                work_item = (
-                    db.query(WorkItem)
-                    .filter(
-                        WorkItem.github_repo == repo_name,
-                        WorkItem.github_issue_number == issue_number,
-                    )
-                    .first()
+            linked = [
+                (issue_items[ref.number], ref) for ref in issue_refs[sha]
+                if ref.number in issue_items
+            ]
+            for work_item, ref in linked:
+                if not self._mark_progress(work_item, ref, commit_data["date"]):
+                    # 상태 변화가 없어도 커밋 연결은 활동 → 보고서 기간에 포함 (commit_linked 이력과 일치)
+                    work_item.updated_at = func.now()
+                db.add(WorkItemCommit(work_item=work_item, github_repo=repo_name, sha=sha))
+
+            if not linked:
+                message = commit_data["message"].split("\n")[0]
+                work_item = WorkItem(
+                    github_repo=repo_name,
+                    category=ItemCategory.IN_PROGRESS,
+                    status=ItemStatus.IN_PROGRESS,
+                    title=message[:500],
+                    summary=commit_data["message"][:1000],
                 )
-                if work_item:
-                    work_item.category = ItemCategory.IN_PROGRESS
-                    work_item.status = ItemStatus.IN_PROGRESS
-                    existing_commits = work_item.related_commits or ""
-                    work_item.related_commits = (
-                        f"{existing_commits},{commit_data['sha']}"
-                        if existing_commits
-                        else commit_data["sha"]
-                    )
-                    tracked += 1
-                    continue
-
-            work_item = WorkItem(
-                github_repo=repo_name,
-                category=ItemCategory.IN_PROGRESS,
-                status=ItemStatus.IN_PROGRESS,
-                title=message[:500],
-                summary=commit_data["message"][:1000],
-                related_commits=commit_data["sha"],
-            )
-            db.add(work_item)
+                db.add(work_item)
+                db.add(WorkItemCommit(work_item=work_item, github_repo=repo_name, sha=sha))
             tracked += 1
 
         db.commit()
@@ -177,13 +271,19 @@ class TobeAgent:
         return tracked
 
     @staticmethod
-    def _extract_issue_number(commit_message: str) -> int | None:
-        """커밋 메시지에서 Issue 번호 추출"""
-        for pattern in _ISSUE_PATTERNS:
-            match = pattern.search(commit_message)
-            if match:
-                return int(match.group(1))
-        return None
+    def _mark_progress(work_item: WorkItem, ref: IssueRef, committed_at: datetime | None) -> list[str]:
+        """
+        참조된 Issue 상태 갱신 - 닫기 키워드면 해결 처리, 이미 해결/종료된 항목은 되돌리지 않음
+        Returns: 실제 변경된 필드
+        """
+        values = {"category": ItemCategory.IN_PROGRESS}
+        if work_item.status not in (ItemStatus.RESOLVED, ItemStatus.CLOSED):
+            if ref.closes:
+                values["status"] = ItemStatus.RESOLVED
+                values["resolved_at"] = committed_at
+            else:
+                values["status"] = ItemStatus.IN_PROGRESS
+        return work_item.apply_changes(values)
 
 
 # 싱글톤
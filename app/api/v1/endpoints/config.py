@@ -6,7 +6,7 @@ import logging
 from typing import Optional
 
 from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, selectinload
 
 from ....core.database import get_db
 from ....models.git_provider import GitProvider, ProviderType
@@ -21,7 +21,7 @@ from ....schemas.config import (
     SetupStatusResponse,
 )
 from ....services import config_service
-from ....services.github_service import GitHubService
+from ....services.github_service import create_github_service_from_provider
 
 logger = logging.getLogger(__name__)
 
@@ -47,6 +47,7 @@ def create_git_provider(data: GitProviderCreate, db: Session = Depends(get_db)):
         base_url=data.base_url,
         token=data.token,
         org_name=data.org_name,
+        api_mode=data.api_mode,
         is_active=data.is_active,
     )
     db.add(provider)
@@ -104,11 +105,8 @@ def sync_repos(provider_id: int, db: Session = Depends(get_db)):
     if provider.provider_type != ProviderType.GITHUB:
         raise HTTPException(status_code=400, detail="현재 GitHub만 지원합니다.")
 
-    github = GitHubService(
-        token=provider.token,
-        org_name=provider.org_name,
-        base_url=provider.base_url,
-    )
+    # 클라이언트는 Agent 실행과 같은 (API 주소, 토큰) 풀에서 재사용
+    github = create_github_service_from_provider(provider)
     repos = github.get_org_repos()
 
     added = 0
@@ -220,8 +218,8 @@ def delete_repository(repo_id: int, db: Session = Depends(get_db)):
 
 @router.get("/recipients", response_model=list[RecipientResponse])
 def list_recipients(db: Session = Depends(get_db)):
-    """수신자 목록 조회"""
-    return db.query(Recipient).order_by(Recipient.id).all()
+    """수신자 목록 조회 (보고서 유형은 한 번에 로딩)"""
+    return db.query(Recipient).options(selectinload(Recipient.report_type_links)).order_by(Recipient.id).all()
 
 
 @router.post("/recipients", response_model=RecipientResponse, status_code=201)
@@ -239,6 +237,7 @@ def create_recipient(data: RecipientCreate, db: Session = Depends(get_db)):
     )
     db.add(recipient)
     db.commit()
+    config_service.invalidate_recipient_cache()
     db.refresh(recipient)
     return recipient
 
@@ -272,6 +271,7 @@ def update_recipient(recipient_id: int, data: RecipientUpdate, db: Session = Dep
         setattr(recipient, key, value)
 
     db.commit()
+    config_service.invalidate_recipient_cache()
     db.refresh(recipient)
     return recipient
 
@@ -285,6 +285,7 @@ def delete_recipient(recipient_id: int, db: Session = Depends(get_db)):
 
     db.delete(recipient)
     db.commit()
+    config_service.invalidate_recipient_cache()
     return {"message": f"'{recipient.name}' 수신자가 삭제되었습니다."}
 
 
@@ -333,6 +334,7 @@ def update_setting(key: str, data: AppSettingUpdate, db: Session = Depends(get_d
         db.add(setting)
 
     db.commit()
+    config_service.invalidate_settings_cache()
     db.refresh(setting)
     return setting
 
@@ -357,6 +359,7 @@ def bulk_update_settings(data: AppSettingBulkUpdate, db: Session = Depends(get_d
         results.append(setting)
 
     db.commit()
+    config_service.invalidate_settings_cache()
     for s in results:
         db.refresh(s)
     return results
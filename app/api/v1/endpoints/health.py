@@ -12,6 +12,9 @@ from ....core.scheduler import scheduler
 from ....models.issue import WorkItem, ItemCategory
 from ....models.report import Report, ReportStatus
 from ....models.agent_log import AgentLog
+from ....services.http_cache import get_response_cache
+from ....services.github_service import get_client_pool_status
+from ....services import outbox_service, webhook_service
 
 router = APIRouter()
 
@@ -33,6 +36,7 @@ def health_check(db: Session = Depends(get_db)):
         "database": {
             "work_items": work_item_count,
             "reports": report_count,
+            "email_outbox": outbox_service.get_outbox_status(db),
         },
         "scheduler": {
             "running": scheduler.running,
@@ -45,6 +49,9 @@ def health_check(db: Session = Depends(get_db)):
                 for job in jobs
             ],
         },
+        "github_cache": get_response_cache().stats(),
+        "github_clients": get_client_pool_status(),
+        "webhooks": webhook_service.get_webhook_status(),
     }
 
 
@@ -0,0 +1,45 @@
+"""
+백그라운드 작업 API 엔드포인트
+"""
+
+from fastapi import APIRouter, Depends, HTTPException, Query
+from sqlalchemy.orm import Session
+
+from ....core.database import get_db
+from ....models.background_job import BackgroundJob
+from ....schemas.job import JobResponse, JobSubmitResponse
+from ....services import job_service
+
+router = APIRouter(prefix="/jobs", tags=["jobs"])
+
+
+def submit_job(db: Session, job_type: str, label: str) -> JobSubmitResponse:
+    """작업 등록 (같은 종류가 대기/실행 중이면 기존 작업 반환) - 트리거 엔드포인트 공통"""
+    job, created = job_service.submit(db, job_type)
+    return JobSubmitResponse(
+        job_id=job.id,
+        status=job.status,
+        deduplicated=not created,
+        message=(
+            f"{label} 작업이 등록되었습니다." if created
+            else f"{label} 작업이 이미 진행 중입니다."
+        ) + f" 진행 상황: /api/v1/jobs/{job.id}",
+    )
+
+
+@router.get("", response_model=list[JobResponse])
+def list_jobs(
+    limit: int = Query(default=20, le=100),
+    db: Session = Depends(get_db),
+):
+    """최근 백그라운드 작업 목록"""
+    return job_service.list_jobs(db, limit=limit)
+
+
+@router.get("/{job_id}", response_model=JobResponse)
+def get_job(job_id: int, db: Session = Depends(get_db)) -> BackgroundJob:
+    """백그라운드 작업 상태/진행률 조회"""
+    job = job_service.get_job(db, job_id)
+    if not job:
+        raise HTTPException(status_code=404, detail="작업을 찾을 수 없습니다.")
+    return job
@@ -8,8 +8,9 @@ from sqlalchemy.orm import Session
 from ....core.database import get_db
 from ....models.report import ReportType
 from ....schemas.report import ReportResponse, ReportListResponse
+from ....schemas.job import JobSubmitResponse
 from ....services.report_service import get_report_service
-from ....agents.report_agent import get_report_agent
+from .jobs import submit_job
 
 router = APIRouter(prefix="/reports", tags=["reports"])
 
@@ -24,10 +25,11 @@ def list_reports(
     """보고서 목록 조회"""
     service = get_report_service()
     reports = service.get_reports(db, report_type=report_type, limit=limit, offset=offset)
+    item_counts = service.get_item_counts(db, [r.id for r in reports])
     result = []
     for r in reports:
         item = ReportListResponse.model_validate(r)
-        item.item_count = len(r.items)
+        item.item_count = item_counts.get(r.id, 0)
         result.append(item)
     return result
 
@@ -42,16 +44,8 @@ def get_report(report_id: int, db: Session = Depends(get_db)):
     return report
 
 
-@router.post("/trigger/{report_type}")
-def trigger_report(report_type: ReportType):
-    """보고서 수동 생성/발송 트리거"""
-    agent = get_report_agent()
-
-    if report_type == ReportType.DAILY:
-        agent.send_daily_report()
-    elif report_type == ReportType.WEEKLY:
-        agent.send_weekly_report()
-    elif report_type == ReportType.MONTHLY:
-        agent.send_monthly_report()
-
-    return {"message": f"{report_type.value} 보고서 생성/발송이 트리거되었습니다."}
+@router.post("/trigger/{report_type}", response_model=JobSubmitResponse, status_code=202)
+def trigger_report(report_type: ReportType, db: Session = Depends(get_db)):
+    """보고서 수동 생성/발송 트리거 (백그라운드 실행, /jobs/{id}로 진행률 조회)"""
+    job_type = f"{report_type.value.lower()}_report"
+    return submit_job(db, job_type, f"{report_type.value} 보고서 생성/발송")
@@ -0,0 +1,61 @@
+"""
+GitHub 웹훅 엔드포인트
+"""
+
+import json
+from urllib.parse import parse_qs
+
+from fastapi import APIRouter, Header, HTTPException, Request
+
+from ....core.config import settings
+from ....services import webhook_service
+from ....services.webhook_service import WebhookEvent
+
+router = APIRouter(prefix="/webhooks", tags=["webhooks"])
+
+
+@router.post("/github", status_code=202)
+async def github_webhook(
+    request: Request,
+    x_github_event: str = Header(default=""),
+    x_github_delivery: str = Header(default=""),
+    x_hub_signature_256: str = Header(default=None),
+):
+    """
+    GitHub issues/push 이벤트 수신 (서명 검증 후 대기열 등록, 반영은 백그라운드)
+    - Content type: application/json 또는 application/x-www-form-urlencoded (GitHub 기본값, payload= 필드)
+    """
+    if not settings.github_webhook_secret:
+        raise HTTPException(status_code=503, detail="GITHUB_WEBHOOK_SECRET 미설정")
+
+    body = await request.body()
+    if not webhook_service.verify_signature(settings.github_webhook_secret, body, x_hub_signature_256):
+        raise HTTPException(status_code=401, detail="서명 검증 실패")
+
+    if x_github_event == "ping":
+        return {"message": "pong"}
+    if x_github_event not in webhook_service.SUPPORTED_EVENTS:
+        return {"message": f"무시된 이벤트: {x_github_event}"}
+
+    try:
+        payload = _parse_payload(request.headers.get("content-type", ""), body)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=f"잘못된 페이로드: {e}")
+
+    queued = webhook_service.enqueue(WebhookEvent(x_github_event, x_github_delivery, payload))
+    if not queued:
+        raise HTTPException(status_code=503, detail="웹훅 대기열이 가득 찼습니다.")
+    return {"message": "queued", "delivery": x_github_delivery}
+
+
+def _parse_payload(content_type: str, body: bytes) -> dict:
+    """웹훅 본문 → payload dict (form 형식은 payload 필드의 JSON)"""
+    if content_type.startswith("application/x-www-form-urlencoded"):
+        fields = parse_qs(body.decode("utf-8"))
+        if "payload" not in fields:
+            raise ValueError("form 본문에 payload 필드가 없습니다.")
+        body = fields["payload"][0]
+    payload = json.loads(body)
+    if not isinstance(payload, dict):
+        raise ValueError("JSON 객체가 아닙니다.")
+    return payload
@@ -2,14 +2,16 @@
 업무 항목 API 엔드포인트
 """
 
-from fastapi import APIRouter, Depends, Query
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Depends, HTTPException, Query
+from sqlalchemy.orm import Session, selectinload
 
 from ....core.database import get_db
 from ....models.issue import WorkItem, ItemCategory, ItemStatus
-from ....schemas.work_item import WorkItemResponse
-from ....agents.qa_agent import get_qa_agent
-from ....agents.tobe_agent import get_tobe_agent
+from ....models.work_item_event import WorkItemEvent
+from ....schemas.work_item import WorkItemResponse, WorkItemEventResponse
+from ....schemas.job import JobSubmitResponse
+from ....services.job_service import JOB_WORK_ITEM_SCAN
+from .jobs import submit_job
 
 router = APIRouter(prefix="/work-items", tags=["work-items"])
 
@@ -24,7 +26,11 @@ def list_work_items(
     db: Session = Depends(get_db),
 ):
     """업무 항목 목록 조회"""
-    query = db.query(WorkItem).order_by(WorkItem.updated_at.desc())
+    query = (
+        db.query(WorkItem)
+        .options(selectinload(WorkItem.commits))
+        .order_by(WorkItem.updated_at.desc())
+    )
     if category:
         query = query.filter(WorkItem.category == category)
     if status:
@@ -34,11 +40,25 @@ def list_work_items(
     return query.offset(offset).limit(limit).all()
 
 
-@router.post("/scan")
-def trigger_scan():
-    """QA-Agent + Tobe-Agent 수동 스캔 트리거"""
-    qa = get_qa_agent()
-    tobe = get_tobe_agent()
-    qa.run()
-    tobe.run()
-    return {"message": "스캔이 완료되었습니다."}
+@router.get("/{item_id}/events", response_model=list[WorkItemEventResponse])
+def list_work_item_events(
+    item_id: int,
+    limit: int = Query(default=50, le=200),
+    db: Session = Depends(get_db),
+):
+    """업무 항목 변경 이력 조회 (최신순)"""
+    if db.get(WorkItem, item_id) is None:
+        raise HTTPException(status_code=404, detail="업무 항목을 찾을 수 없습니다.")
+    return (
+        db.query(WorkItemEvent)
+        .filter(WorkItemEvent.work_item_id == item_id)
+        .order_by(WorkItemEvent.created_at.desc(), WorkItemEvent.id.desc())
+        .limit(limit)
+        .all()
+    )
+
+
+@router.post("/scan", response_model=JobSubmitResponse, status_code=202)
+def trigger_scan(db: Session = Depends(get_db)):
+    """QA-Agent + Tobe-Agent 수동 스캔 트리거 (백그라운드 실행, /jobs/{id}로 진행률 조회)"""
+    return submit_job(db, JOB_WORK_ITEM_SCAN, "스캔")
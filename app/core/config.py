@@ -43,6 +43,9 @@ class Settings(BaseSettings):
     github_token: str = Field(default="", env="GITHUB_TOKEN")
     github_org: str = Field(default="", env="GITHUB_ORG")
 
+    # GitHub 웹훅 (설정 시 issues/push 이벤트 실시간 반영, 폴링은 저빈도 보정으로 전환)
+    github_webhook_secret: str = Field(default="", env="GITHUB_WEBHOOK_SECRET")
+
     # 스케줄러 - 일일보고 (매일 17:00)
     daily_report_hour: int = Field(default=17, env="DAILY_REPORT_HOUR")
     daily_report_minute: int = Field(default=0, env="DAILY_REPORT_MINUTE")
@@ -55,10 +58,26 @@ class Settings(BaseSettings):
     monthly_report_hour: int = Field(default=11, env="MONTHLY_REPORT_HOUR")
     monthly_report_minute: int = Field(default=0, env="MONTHLY_REPORT_MINUTE")
 
+    # 스케줄러 리더 선출 (PostgreSQL advisory lock, 락을 잡은 인스턴스만 작업 실행)
+    scheduler_lock_key: int = Field(default=7210601, env="SCHEDULER_LOCK_KEY")
+    scheduler_leader_retry_seconds: int = Field(default=30, env="SCHEDULER_LEADER_RETRY_SECONDS")
+
     # Newsletter report display
     max_projects_per_category: int = Field(default=5, env="MAX_PROJECTS_PER_CATEGORY")
     max_items_per_project: int = Field(default=3, env="MAX_ITEMS_PER_PROJECT")
 
+    # 템플릿 바이트코드 캐시 경로 (비우면 <BASE_DIR>/.jinja_cache)
+    template_cache_dir: str = Field(default="", env="TEMPLATE_CACHE_DIR")
+
+    # Agent 저장소 병렬 조회 (프로바이더당 스레드 수, 1이면 순차)
+    agent_scan_workers: int = Field(default=4, env="AGENT_SCAN_WORKERS")
+    # 조회 스레드 → DB 쓰기 사이 대기 페이지 수 (가득 차면 조회 일시 정지)
+    agent_scan_queue_pages: int = Field(default=8, env="AGENT_SCAN_QUEUE_PAGES")
+    # GitHub 목록 API 페이지 크기 (최대 100)
+    github_page_size: int = Field(default=100, env="GITHUB_PAGE_SIZE")
+    # (API 주소, 토큰)별로 유지할 유휴 GitHub 클라이언트 수 (keep-alive 연결 재사용)
+    github_client_pool_size: int = Field(default=8, env="GITHUB_CLIENT_POOL_SIZE")
+
     # 로깅
     log_level: str = Field(default="INFO", env="LOG_LEVEL")
 
@@ -0,0 +1,132 @@
+"""
+다중 인스턴스 리더 선출 (PostgreSQL advisory lock)
+- 락을 잡은 인스턴스만 스케줄러(Agent/보고서 작업)를 실행, 나머지는 API만 제공
+- 리더 연결이 끊기면 락이 해제되어 다른 인스턴스가 이어받음
+- PostgreSQL이 아니면(SQLite 등 단일 프로세스) 항상 리더
+"""
+
+import logging
+import threading
+from typing import Callable, Optional
+
+from sqlalchemy import text
+from sqlalchemy.engine import Connection, Engine
+
+logger = logging.getLogger(__name__)
+
+
+class LeaderElection:
+    """advisory lock 기반 리더 선출 (백그라운드 스레드에서 주기적으로 획득/유지 확인)"""
+
+    def __init__(
+        self,
+        engine: Engine,
+        lock_key: int,
+        on_elected: Callable[[], None],
+        on_demoted: Callable[[], None],
+        retry_seconds: int = 30,
+    ):
+        self.engine = engine
+        self.lock_key = lock_key
+        self.on_elected = on_elected
+        self.on_demoted = on_demoted
+        self.retry_seconds = retry_seconds
+        self.is_leader = False
+        self._conn: Optional[Connection] = None
+        self._stop = threading.Event()
+        # 락 연결은 선출 스레드와 작업 실행 스레드(confirm)가 함께 사용
+        self._conn_lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self):
+        if self.engine.dialect.name != "postgresql":
+            logger.info("PostgreSQL 아님 → 단일 인스턴스로 간주, 리더로 실행")
+            self._become_leader()
+            return
+        self._thread = threading.Thread(target=self._run, name="leader-election", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        with self._conn_lock:
+            if self._conn is not None:
+                try:
+                    self._conn.execute(text("SELECT pg_advisory_unlock(:key)"), {"key": self.lock_key})
+                    self._conn.commit()
+                except Exception:
+                    pass
+                self._release_connection()
+            self.is_leader = False
+
+    def confirm(self) -> bool:
+        """
+        작업 실행 직전 리더 여부 재확인
+        - 주기 확인(retry_seconds) 사이에 락 연결이 끊긴 경우를 즉시 반영 (끊겼으면 리더 해제)
+        """
+        if self._thread is None:
+            return self.is_leader
+        with self._conn_lock:
+            if self.is_leader:
+                self._check_alive()
+            return self.is_leader
+
+    def _run(self):
+        while not self._stop.is_set():
+            try:
+                with self._conn_lock:
+                    if self._stop.is_set():
+                        break
+                    if self.is_leader:
+                        self._check_alive()
+                    else:
+                        self._try_acquire()
+            except Exception as e:
+                logger.error(f"리더 선출 오류: {e}", exc_info=True)
+            self._stop.wait(self.retry_seconds)
+
+    def _try_acquire(self):
+        conn = self.engine.connect()
+        try:
+            acquired = conn.execute(
+                text("SELECT pg_try_advisory_lock(:key)"), {"key": self.lock_key}
+            ).scalar()
+            # 세션 레벨 락은 트랜잭션 종료 후에도 유지 (idle in transaction 방지)
+            conn.commit()
+        except Exception:
+            conn.close()
+            raise
+
+        if not acquired:
+            conn.close()
+            logger.debug("리더 락 획득 실패 → 팔로워 유지")
+            return
+
+        self._conn = conn
+        logger.info(f"리더 락 획득 (key={self.lock_key})")
+        self._become_leader()
+
+    def _check_alive(self):
+        """락을 보유한 연결이 살아있는지 확인, 끊겼으면 리더 해제"""
+        try:
+            self._conn.execute(text("SELECT 1"))
+            self._conn.commit()
+        except Exception as e:
+            logger.warning(f"리더 연결 끊김 → 리더 해제: {e}")
+            self._release_connection(invalidate=True)
+            self.is_leader = False
+            self.on_demoted()
+
+    def _become_leader(self):
+        self.is_leader = True
+        self.on_elected()
+
+    def _release_connection(self, invalidate: bool = False):
+        if self._conn is None:
+            return
+        try:
+            if invalidate:
+                self._conn.invalidate()
+            self._conn.close()
+        except Exception:
+            pass
+        self._conn = None
@@ -1,22 +1,30 @@
 """
 APScheduler 스케줄러 설정
+- 작업 정의는 DB(apscheduler_jobs)에 저장, 다중 인스턴스 중 리더 1개만 작업 실행
 """
 
 import calendar
+import functools
 import logging
 import threading
 from datetime import date
+from typing import Optional
 
+from apscheduler.jobstores.sqlalchemy import SQLAlchemyJobStore
 from apscheduler.schedulers.background import BackgroundScheduler
 from apscheduler.triggers.cron import CronTrigger
+from apscheduler.triggers.interval import IntervalTrigger
 from apscheduler.events import EVENT_JOB_ERROR, EVENT_JOB_EXECUTED
 
 from .config import settings
+from .database import engine
+from .leader import LeaderElection
 
 logger = logging.getLogger(__name__)
 
 scheduler = BackgroundScheduler(
     timezone="Asia/Seoul",
+    jobstores={"default": SQLAlchemyJobStore(engine=engine)},
     job_defaults={
         "coalesce": True,
         "max_instances": 1,
@@ -24,6 +32,9 @@ scheduler = BackgroundScheduler(
     },
 )
 
+_leader: Optional[LeaderElection] = None
+_initial_scan_started = False
+
 
 def _job_listener(event):
     """스케줄러 작업 실행 이벤트 리스너"""
@@ -35,23 +46,84 @@ def _job_listener(event):
 
 
 def run_initial_scan():
-    """앱 시작 시 초기 스캔 (별도 스레드)"""
-    from ..agents.qa_agent import get_qa_agent
-    from ..agents.tobe_agent import get_tobe_agent
+    """앱 시작 시 초기 스캔 (별도 스레드, 수동 스캔이 진행 중이면 건너뜀)"""
+    from ..services.job_service import run_scheduled, JOB_WORK_ITEM_SCAN
 
     logger.info("=== 초기 Agent 스캔 시작 ===")
     try:
-        qa_agent = get_qa_agent()
-        qa_agent.run()
-
-        tobe_agent = get_tobe_agent()
-        tobe_agent.run()
-
+        run_scheduled(JOB_WORK_ITEM_SCAN)
         logger.info("=== 초기 Agent 스캔 완료 ===")
     except Exception as e:
         logger.error(f"초기 스캔 오류: {e}", exc_info=True)
 
 
+def _leader_only(func):
+    """
+    작업 실행 직전 리더 재확인 → 리더가 아니면 건너뜀
+    - 리더 해제 시 scheduler.pause()는 이미 실행 시점이 된 작업을 막지 못함
+    - 이미 실행 중인 작업은 끝까지 진행 (중복 실행 최소화는 각 작업의 DB 잠금/멱등 처리에 의존)
+    """
+    @functools.wraps(func)
+    def wrapper():
+        if _leader is None or not _leader.confirm():
+            logger.warning(f"리더 아님 → 스케줄 작업 건너뜀: {func.__name__}")
+            return None
+        return func()
+    return wrapper
+
+
+# DB 작업 저장소는 함수 참조를 "모듈:이름"으로 저장 → 작업 함수는 모듈 레벨로 정의
+# (_leader_only는 functools.wraps로 이름을 유지 → 저장된 참조가 래퍼를 가리킴)
+# Agent/보고서 작업은 background_jobs에 등록 후 실행 → 다른 인스턴스의 수동 실행과 겹치면 건너뜀
+@_leader_only
+def run_qa_agent():
+    from ..agents.qa_agent import get_qa_agent
+    from ..services.job_service import run_scheduled, JOB_WORK_ITEM_SCAN
+    run_scheduled(JOB_WORK_ITEM_SCAN, lambda progress: get_qa_agent().run(progress=progress))
+
+
+@_leader_only
+def run_tobe_agent():
+    from ..agents.tobe_agent import get_tobe_agent
+    from ..services.job_service import run_scheduled, JOB_WORK_ITEM_SCAN
+    run_scheduled(JOB_WORK_ITEM_SCAN, lambda progress: get_tobe_agent().run(progress=progress))
+
+
+@_leader_only
+def send_daily_report():
+    from ..services.job_service import run_scheduled
+    run_scheduled("daily_report")
+
+
+@_leader_only
+def send_weekly_report():
+    from ..services.job_service import run_scheduled
+    run_scheduled("weekly_report")
+
+
+@_leader_only
+def send_monthly_report_if_last_friday():
+    """월간보고: 매주 금요일 실행 + 마지막 주 검증"""
+    from ..services.job_service import run_scheduled
+    if _is_last_friday_of_month():
+        run_scheduled("monthly_report")
+    else:
+        logger.debug("월간보고 스킵: 마지막 주 금요일이 아닙니다.")
+
+
+@_leader_only
+def drain_email_outbox():
+    from ..agents.report_agent import get_report_agent
+    get_report_agent().drain_outbox()
+
+
+@_leader_only
+def prune_response_cache():
+    """오래 사용되지 않은 GitHub 응답 캐시 정리"""
+    from ..services.http_cache import get_response_cache
+    get_response_cache().prune()
+
+
 def _is_last_friday_of_month() -> bool:
     """오늘이 이번 달 마지막 금요일인지 확인 (KST 기준)"""
     from .config import now_kst
@@ -78,14 +150,8 @@ def _safe_add_job(func, trigger, job_id, job_name):
 
 
 def setup_scheduler():
-    """스케줄러 초기화 및 작업 등록"""
-    from ..agents.qa_agent import get_qa_agent
-    from ..agents.tobe_agent import get_tobe_agent
-    from ..agents.report_agent import get_report_agent
-
-    qa_agent = get_qa_agent()
-    tobe_agent = get_tobe_agent()
-    report_agent = get_report_agent()
+    """스케줄러 초기화 및 작업 등록 (실행은 리더로 선출된 뒤 시작)"""
+    global _leader
 
     # 이벤트 리스너 등록
     scheduler.add_listener(_job_listener, EVENT_JOB_EXECUTED | EVENT_JOB_ERROR)
@@ -93,23 +159,34 @@ def setup_scheduler():
     # 스케줄러 timezone (CronTrigger에 명시적 전달 필수 - 컨테이너 UTC 대응)
     tz = "Asia/Seoul"
 
+    # 웹훅 사용 시 변경분은 실시간 반영 → 폴링은 업무 시작 및 일일보고 전 보정용으로만 실행
+    webhook_enabled = bool(settings.github_webhook_secret)
+    if webhook_enabled:
+        logger.info("  GitHub 웹훅 사용 → Agent 폴링은 1일 2회 보정 스캔으로 실행")
+
     # QA-Agent: 매 2시간 실행 (업무시간 내)
     _safe_add_job(
-        qa_agent.run,
-        CronTrigger(hour="8-18/2", minute=0, day_of_week="mon-fri", timezone=tz),
+        run_qa_agent,
+        CronTrigger(
+            hour="8,16" if webhook_enabled else "8-18/2",
+            minute=0, day_of_week="mon-fri", timezone=tz,
+        ),
         "qa_agent_scan", "QA-Agent Issues 스캔",
     )
 
     # Tobe-Agent: 매 1시간 실행 (업무시간 내)
     _safe_add_job(
-        tobe_agent.run,
-        CronTrigger(hour="8-18", minute=30, day_of_week="mon-fri", timezone=tz),
+        run_tobe_agent,
+        CronTrigger(
+            hour="8,16" if webhook_enabled else "8-18",
+            minute=30, day_of_week="mon-fri", timezone=tz,
+        ),
         "tobe_agent_track", "Tobe-Agent 진행사항 추적",
     )
 
     # 일일보고: 월~금
     _safe_add_job(
-        report_agent.send_daily_report,
+        send_daily_report,
         CronTrigger(
             hour=settings.daily_report_hour,
             minute=settings.daily_report_minute,
@@ -121,7 +198,7 @@ def setup_scheduler():
 
     # 주간보고: 금요일
     _safe_add_job(
-        report_agent.send_weekly_report,
+        send_weekly_report,
         CronTrigger(
             hour=settings.weekly_report_hour,
             minute=settings.weekly_report_minute,
@@ -131,15 +208,9 @@ def setup_scheduler():
         "weekly_report", "주간업무보고 발송",
     )
 
-    # 월간보고: 마지막주 금요일 (매주 금요일 실행 + 마지막 주 검증)
-    def _monthly_report_if_last_friday():
-        if _is_last_friday_of_month():
-            report_agent.send_monthly_report()
-        else:
-            logger.debug("월간보고 스킵: 마지막 주 금요일이 아닙니다.")
-
+    # 월간보고: 마지막주 금요일
     _safe_add_job(
-        _monthly_report_if_last_friday,
+        send_monthly_report_if_last_friday,
         CronTrigger(
             hour=settings.monthly_report_hour,
             minute=settings.monthly_report_minute,
@@ -149,25 +220,72 @@ def setup_scheduler():
         "monthly_report", "월간업무보고 발송",
     )
 
-    scheduler.start()
-    logger.info("스케줄러 시작 완료")
+    # 보고서 메일 발송 대기열 재시도: 매 1분
+    _safe_add_job(
+        drain_email_outbox,
+        IntervalTrigger(minutes=1, timezone=tz),
+        "email_outbox_drain", "보고서 메일 재발송 대기열 처리",
+    )
+
+    # GitHub 응답 캐시 정리: 매일 03:00
+    _safe_add_job(
+        prune_response_cache,
+        CronTrigger(hour=3, minute=0, timezone=tz),
+        "http_cache_prune", "GitHub 응답 캐시 정리",
+    )
+
+    _leader = LeaderElection(
+        engine,
+        lock_key=settings.scheduler_lock_key,
+        on_elected=_on_elected,
+        on_demoted=_on_demoted,
+        retry_seconds=settings.scheduler_leader_retry_seconds,
+    )
+    _leader.start()
+
+
+def _on_elected():
+    """리더 선출 → 스케줄러 시작 (재선출이면 재개)"""
+    global _initial_scan_started
+
+    if scheduler.running:
+        scheduler.resume()
+        logger.info("리더 재선출 → 스케줄러 재개")
+    else:
+        # 대기 중이던 작업이 DB 작업 저장소에 반영됨 (replace_existing)
+        scheduler.start()
+        logger.info("스케줄러 시작 완료 (리더)")
 
     # 등록된 작업 목록 출력
-    jobs = scheduler.get_jobs()
-    for job in jobs:
+    for job in scheduler.get_jobs():
         logger.info(f"  등록된 작업: {job.name} (다음 실행: {job.next_run_time})")
 
+    if _initial_scan_started:
+        return
+    _initial_scan_started = True
+
     # 초기 스캔을 별도 스레드에서 실행 (앱 시작 블로킹 방지)
     init_thread = threading.Thread(target=run_initial_scan, daemon=True)
     init_thread.start()
     logger.info("초기 Agent 스캔을 백그라운드에서 시작합니다.")
 
 
+def _on_demoted():
+    """리더 해제 → 작업 실행 중지 (다른 인스턴스가 이어받음)"""
+    if scheduler.running:
+        scheduler.pause()
+    logger.warning("리더 해제 → 스케줄러 일시 중지")
+
+
 def get_scheduler_status() -> dict:
     """스케줄러 상태 조회 (진단용)"""
+    from ..services.rate_limiter import get_rate_limit_status
+
     status = {
         "running": scheduler.running,
+        "leader": bool(_leader and _leader.is_leader),
         "jobs": [],
+        "rate_limits": get_rate_limit_status(),
     }
     if scheduler.running:
         for job in scheduler.get_jobs():
@@ -181,7 +299,9 @@ def get_scheduler_status() -> dict:
 
 
 def shutdown_scheduler():
-    """스케줄러 종료"""
+    """스케줄러 종료 (리더 락 반납)"""
+    if _leader is not None:
+        _leader.stop()
     if scheduler.running:
         scheduler.shutdown(wait=False)
         logger.info("스케줄러 종료 완료")
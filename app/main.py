@@ -14,7 +14,9 @@ from alembic import command as alembic_command
 from .core.config import settings, APP_VERSION
 from .core.logging_config import setup_logging
 from .core.scheduler import setup_scheduler, shutdown_scheduler
-from .api.v1.endpoints import health, reports, work_items, config
+from .services.github_service import close_client_pools
+from .services.template_service import warm_templates
+from .api.v1.endpoints import health, reports, work_items, config, jobs, webhooks
 
 # 로깅 설정 (파일 + 콘솔)
 setup_logging()
@@ -36,12 +38,19 @@ async def lifespan(app: FastAPI):
         logger.error(f"DB 마이그레이션 실패: {e}", exc_info=True)
         raise
 
+    # 보고서 템플릿 사전 컴파일 (실패해도 첫 렌더링 시 컴파일됨)
+    try:
+        warm_templates()
+    except Exception as e:
+        logger.warning(f"템플릿 사전 컴파일 실패: {e}")
+
     # 스케줄러 시작 (+ 초기 Agent 스캔)
     setup_scheduler()
 
     yield
 
     shutdown_scheduler()
+    close_client_pools()
     logger.info("StandUp Agent 종료")
 
 
@@ -57,6 +66,8 @@ app.include_router(health.router, prefix="/api/v1")
 app.include_router(reports.router, prefix="/api/v1")
 app.include_router(work_items.router, prefix="/api/v1")
 app.include_router(config.router, prefix="/api/v1")
+app.include_router(jobs.router, prefix="/api/v1")
+app.include_router(webhooks.router, prefix="/api/v1")
 
 
 @app.get("/")
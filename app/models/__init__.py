@@ -1,12 +1,21 @@
 from .issue import WorkItem
+from .work_item_commit import WorkItemCommit
 from .report import Report, ReportItem
 from .agent_log import AgentLog
 from .git_provider import GitProvider, ProviderType
 from .repository import Repository
-from .recipient import Recipient
+from .recipient import Recipient, RecipientReportType
 from .app_setting import AppSetting
+from .sync_cursor import SyncCursor
+from .http_cache import HttpCacheEntry
+from .email_outbox import EmailOutbox
+from .background_job import BackgroundJob
+from .report_aggregate import ReportAggregate
+from .work_item_event import WorkItemEvent
 
 __all__ = [
     "WorkItem", "Report", "ReportItem", "AgentLog",
     "GitProvider", "ProviderType", "Repository", "Recipient", "AppSetting",
+    "SyncCursor", "HttpCacheEntry", "WorkItemCommit", "EmailOutbox",
+    "BackgroundJob", "RecipientReportType", "ReportAggregate", "WorkItemEvent",
 ]
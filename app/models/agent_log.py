@@ -4,7 +4,7 @@ Agent 실행 이력 모델
 
 from datetime import datetime
 
-from sqlalchemy import String, Text, Integer, Float, DateTime, func
+from sqlalchemy import String, Text, Integer, Float, DateTime, Index, func
 from sqlalchemy.orm import Mapped, mapped_column
 
 from ..core.database import Base
@@ -13,6 +13,10 @@ from ..core.database import Base
 class AgentLog(Base):
     """Agent 실행 이력 테이블"""
     __tablename__ = "agent_logs"
+    __table_args__ = (
+        Index("ix_agent_logs_executed_at", "executed_at"),
+        Index("ix_agent_logs_agent_name_executed_at", "agent_name", "executed_at"),
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
 
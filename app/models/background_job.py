@@ -0,0 +1,59 @@
+"""
+백그라운드 작업 모델 - 수동 트리거(스캔/보고서) 실행 상태 및 진행률
+"""
+
+from datetime import datetime
+
+from sqlalchemy import String, Text, Integer, DateTime, Index, func, text
+from sqlalchemy.orm import Mapped, mapped_column
+
+from ..core.database import Base
+
+
+class JobStatus:
+    """작업 상태"""
+    QUEUED = "queued"        # 실행 대기
+    RUNNING = "running"      # 실행 중
+    SUCCEEDED = "succeeded"  # 완료
+    FAILED = "failed"        # 실패
+
+    ACTIVE = (QUEUED, RUNNING)
+
+
+class BackgroundJob(Base):
+    """백그라운드 작업 테이블"""
+    __tablename__ = "background_jobs"
+    __table_args__ = (
+        # 같은 종류의 작업은 대기/실행 중인 것이 최대 1개 (동시 트리거 병합)
+        Index(
+            "ux_background_jobs_active_type", "job_type",
+            unique=True,
+            postgresql_where=text("status IN ('queued', 'running')"),
+            sqlite_where=text("status IN ('queued', 'running')"),
+        ),
+        Index("ix_background_jobs_created_at", "created_at"),
+    )
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
+
+    # 작업 종류 (work_item_scan, daily_report, weekly_report, monthly_report)
+    job_type: Mapped[str] = mapped_column(String(50), nullable=False)
+    status: Mapped[str] = mapped_column(String(20), default=JobStatus.QUEUED, nullable=False)
+
+    # 진행률 (저장소 처리 횟수: 스캔 작업은 QA/Tobe Agent가 저장소마다 1회씩 → 저장소 수 × 2)
+    repos_done: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    repos_total: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    items_processed: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    error_message: Mapped[str | None] = mapped_column(Text, nullable=True)
+
+    # 타임스탬프
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime, server_default=func.now(), nullable=False
+    )
+    started_at: Mapped[datetime | None] = mapped_column(DateTime, nullable=True)
+    finished_at: Mapped[datetime | None] = mapped_column(DateTime, nullable=True)
+    # 마지막 진행 기록 시각 (실행 중 작업의 생존 확인)
+    heartbeat_at: Mapped[datetime | None] = mapped_column(DateTime, nullable=True)
+
+    def __repr__(self) -> str:
+        return f"<BackgroundJob(id={self.id}, job_type={self.job_type}, status={self.status})>"
@@ -0,0 +1,56 @@
+"""
+이메일 발송 대기열(outbox) 모델 - 보고서 × 수신자 단위 발송 상태
+"""
+
+from datetime import datetime
+
+from sqlalchemy import String, Text, Integer, DateTime, ForeignKey, Index, UniqueConstraint, func
+from sqlalchemy.orm import Mapped, mapped_column
+
+from ..core.database import Base
+
+
+class OutboxStatus:
+    """발송 상태"""
+    PENDING = "pending"    # 발송 대기 (next_attempt_at 이후 발송)
+    SENDING = "sending"    # 발송 중 (워커가 점유)
+    SENT = "sent"          # 발송 완료
+    FAILED = "failed"      # 재시도 한도 초과
+
+
+class EmailOutbox(Base):
+    """보고서 메일 발송 대기열 테이블"""
+    __tablename__ = "email_outbox"
+    __table_args__ = (
+        UniqueConstraint("report_id", "recipient", name="uq_email_outbox_report_recipient"),
+        Index("ix_email_outbox_status_next_attempt", "status", "next_attempt_at"),
+    )
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
+
+    # 보고서 / 수신자
+    report_id: Mapped[int] = mapped_column(
+        Integer, ForeignKey("reports.id", ondelete="CASCADE"), nullable=False
+    )
+    recipient: Mapped[str] = mapped_column(String(200), nullable=False)
+
+    # 발송 상태
+    status: Mapped[str] = mapped_column(String(20), default=OutboxStatus.PENDING, nullable=False)
+    attempts: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    # 다음 발송 시각 (발송 중(SENDING)에는 점유 만료 시각 - 지나면 중단으로 보고 복구)
+    next_attempt_at: Mapped[datetime] = mapped_column(DateTime, server_default=func.now(), nullable=False)
+    last_error: Mapped[str | None] = mapped_column(Text, nullable=True)
+    sent_at: Mapped[datetime | None] = mapped_column(DateTime, nullable=True)
+    # 발송 점유 시각 (앱 KST 기준, 중단 복구 판단용 - DB 시간대와 무관)
+    claimed_at: Mapped[datetime | None] = mapped_column(DateTime, nullable=True)
+
+    # 타임스탬프
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime, server_default=func.now(), nullable=False
+    )
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime, server_default=func.now(), onupdate=func.now(), nullable=False
+    )
+
+    def __repr__(self) -> str:
+        return f"<EmailOutbox(report_id={self.report_id}, recipient={self.recipient}, status={self.status})>"
@@ -26,6 +26,7 @@ class GitProvider(Base):
     base_url = Column(String(500), nullable=True)
     token = Column(String(500), nullable=False)
     org_name = Column(String(200), nullable=False)
+    api_mode = Column(String(20), default="rest", nullable=False)  # rest / graphql
     is_active = Column(Boolean, default=True, nullable=False)
     created_at = Column(DateTime, server_default=func.now())
     updated_at = Column(DateTime, server_default=func.now(), onupdate=func.now())
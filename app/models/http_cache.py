@@ -0,0 +1,40 @@
+"""
+GitHub 응답 캐시 모델 - 조건부 요청(ETag / Last-Modified)용
+"""
+
+from datetime import datetime
+
+from sqlalchemy import String, Text, Integer, DateTime, func
+from sqlalchemy.orm import Mapped, mapped_column
+
+from ..core.database import Base
+
+
+class HttpCacheEntry(Base):
+    """GitHub API 응답 캐시 테이블 (URL + 파라미터 + 토큰 단위)"""
+    __tablename__ = "http_cache_entries"
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
+
+    # 캐시 키 (sha256 hex) 및 원본 URL
+    cache_key: Mapped[str] = mapped_column(String(64), nullable=False, unique=True)
+    url: Mapped[str] = mapped_column(String(1000), nullable=False)
+
+    # 검증자
+    etag: Mapped[str | None] = mapped_column(String(200), nullable=True)
+    last_modified: Mapped[str | None] = mapped_column(String(100), nullable=True)
+
+    # 응답 본문 (JSON 원문) 및 다음 페이지 링크
+    body: Mapped[str] = mapped_column(Text, nullable=False)
+    next_url: Mapped[str | None] = mapped_column(String(1000), nullable=True)
+
+    # 타임스탬프
+    last_used_at: Mapped[datetime] = mapped_column(
+        DateTime, server_default=func.now(), nullable=False
+    )
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime, server_default=func.now(), onupdate=func.now(), nullable=False
+    )
+
+    def __repr__(self) -> str:
+        return f"<HttpCacheEntry(url={self.url[:60]}, etag={self.etag})>"
@@ -5,10 +5,11 @@
 import enum
 from datetime import datetime
 
-from sqlalchemy import String, Text, Integer, DateTime, Enum, func
-from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy import String, Text, Integer, DateTime, Enum, Index, func
+from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from ..core.database import Base
+from .work_item_commit import WorkItemCommit
 
 
 class ItemCategory(str, enum.Enum):
@@ -29,6 +30,11 @@ class ItemStatus(str, enum.Enum):
 class WorkItem(Base):
     """업무 항목 테이블"""
     __tablename__ = "work_items"
+    __table_args__ = (
+        Index("ix_work_items_repo_issue", "github_repo", "github_issue_number", unique=True),
+        Index("ix_work_items_updated_at", "updated_at"),
+        Index("ix_work_items_category_updated_at", "category", "updated_at"),
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
 
@@ -50,8 +56,8 @@ class WorkItem(Base):
     summary: Mapped[str | None] = mapped_column(Text, nullable=True)
     labels: Mapped[str | None] = mapped_column(String(500), nullable=True)
 
-    # 관련 커밋 (SHA 목록, 콤마 구분)
-    related_commits: Mapped[str | None] = mapped_column(Text, nullable=True)
+    # GitHub Issue 내용 해시 (정규화 필드 기준, 변경 없는 Issue는 갱신 생략)
+    content_hash: Mapped[str | None] = mapped_column(String(64), nullable=True)
 
     # 타임스탬프
     created_at: Mapped[datetime] = mapped_column(
@@ -62,5 +68,23 @@ class WorkItem(Base):
     )
     resolved_at: Mapped[datetime | None] = mapped_column(DateTime, nullable=True)
 
+    # 관련 커밋
+    commits: Mapped[list[WorkItemCommit]] = relationship(
+        WorkItemCommit, back_populates="work_item",
+        cascade="all, delete-orphan", order_by=WorkItemCommit.id,
+    )
+
+    @property
+    def related_commits(self) -> str | None:
+        """관련 커밋 SHA 목록 (콤마 구분, API 응답 호환용)"""
+        return ",".join(commit.sha for commit in self.commits) or None
+
+    def apply_changes(self, values: dict) -> list[str]:
+        """값이 다른 필드만 반영 (같은 값은 건너뜀 → 불필요한 UPDATE/변경 이력 방지)"""
+        changed = [field for field, value in values.items() if getattr(self, field) != value]
+        for field in changed:
+            setattr(self, field, values[field])
+        return changed
+
     def __repr__(self) -> str:
         return f"<WorkItem(id={self.id}, repo={self.github_repo}, title={self.title[:30]})>"
@@ -2,10 +2,32 @@
 Recipient 모델 - 보고서 수신자 관리
 """
 
-from sqlalchemy import Column, Integer, String, Boolean, DateTime, func
+from sqlalchemy import Column, Integer, String, Boolean, DateTime, ForeignKey, Index, func
+from sqlalchemy.orm import relationship
 
 from ..core.database import Base
 
+# 모든 보고서 유형 수신
+REPORT_TYPE_ALL = "all"
+
+
+class RecipientReportType(Base):
+    """수신자 ↔ 보고서 유형 연결 (유형별 수신자 조회용)"""
+    __tablename__ = "recipient_report_types"
+    __table_args__ = (
+        Index("ix_recipient_report_types_type_recipient", "report_type", "recipient_id"),
+    )
+
+    recipient_id = Column(
+        Integer, ForeignKey("recipients.id", ondelete="CASCADE"), primary_key=True
+    )
+    report_type = Column(String(20), primary_key=True)  # daily / weekly / monthly / all
+
+    recipient = relationship("Recipient", back_populates="report_type_links")
+
+    def __repr__(self):
+        return f"<RecipientReportType(recipient_id={self.recipient_id}, report_type='{self.report_type}')>"
+
 
 class Recipient(Base):
     """보고서 수신자"""
@@ -14,10 +36,29 @@ class Recipient(Base):
     id = Column(Integer, primary_key=True, autoincrement=True)
     name = Column(String(200), nullable=False)
     email = Column(String(300), nullable=False, unique=True)
-    report_types = Column(String(100), default="all", nullable=False)
     is_active = Column(Boolean, default=True, nullable=False)
     created_at = Column(DateTime, server_default=func.now())
     updated_at = Column(DateTime, server_default=func.now(), onupdate=func.now())
 
+    # Relationship
+    report_type_links = relationship(
+        RecipientReportType, back_populates="recipient",
+        cascade="all, delete-orphan", order_by=RecipientReportType.report_type,
+    )
+
+    @property
+    def report_types(self) -> str:
+        """수신 보고서 유형 (콤마 구분, API 호환용)"""
+        return ",".join(link.report_type for link in self.report_type_links)
+
+    @report_types.setter
+    def report_types(self, value: str):
+        types = dict.fromkeys(t.strip().lower() for t in (value or "").split(",") if t.strip())
+        existing = {link.report_type: link for link in self.report_type_links}
+        self.report_type_links = [
+            existing.get(report_type) or RecipientReportType(report_type=report_type)
+            for report_type in types
+        ]
+
     def __repr__(self):
         return f"<Recipient(id={self.id}, name='{self.name}', email='{self.email}')>"
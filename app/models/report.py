@@ -76,7 +76,7 @@ class ReportItem(Base):
 
     # 보고서 참조
     report_id: Mapped[int] = mapped_column(
-        Integer, ForeignKey("reports.id", ondelete="CASCADE"), nullable=False
+        Integer, ForeignKey("reports.id", ondelete="CASCADE"), nullable=False, index=True
     )
 
     # 항목 분류
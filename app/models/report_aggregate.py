@@ -0,0 +1,127 @@
+"""
+보고서 집계(rollup) 모델 - 일자 × 분류 × 저장소별 업무 항목 건수
+"""
+
+from datetime import date, datetime
+from itertools import chain
+
+from sqlalchemy import String, Integer, Date, DateTime, UniqueConstraint, delete, event, func, inspect, text
+from sqlalchemy.orm import Mapped, Session, mapped_column
+
+from ..core.config import now_kst
+from ..core.database import Base
+from .issue import WorkItem
+
+# 일자 단위 합계 행 (category=ALL, github_repo="") - 집계 완료된 일자 표시 겸용
+AGGREGATE_ALL = "all"
+
+# 집계 생성(배타) ↔ 업무 항목 쓰기(공유) 직렬화용 advisory lock 키 (스케줄러 리더 락과 별도)
+AGGREGATE_LOCK_KEY = 7210602
+
+
+class ReportAggregate(Base):
+    """일별 보고서 집계 테이블 (updated_at이 해당 일자인 항목 기준, 지난 일자만 생성)"""
+    __tablename__ = "report_aggregates"
+    __table_args__ = (
+        UniqueConstraint(
+            "aggregate_date", "category", "github_repo", name="uq_report_aggregates_date_category_repo"
+        ),
+    )
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
+
+    # 집계 키 (KST 일자, 분류 값 소문자, 저장소)
+    aggregate_date: Mapped[date] = mapped_column(Date, nullable=False)
+    category: Mapped[str] = mapped_column(String(20), nullable=False)
+    github_repo: Mapped[str] = mapped_column(String(200), nullable=False)
+
+    # 집계 값
+    item_count: Mapped[int] = mapped_column(Integer, nullable=False)
+    resolved_count: Mapped[int] = mapped_column(Integer, nullable=False)
+    last_updated_at: Mapped[datetime | None] = mapped_column(DateTime, nullable=True)
+
+    # 타임스탬프
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime, server_default=func.now(), nullable=False
+    )
+
+    def __repr__(self) -> str:
+        return f"<ReportAggregate({self.aggregate_date} {self.category}/{self.github_repo}: {self.item_count})>"
+
+
+def lock_report_aggregates(session: Session, exclusive: bool = False):
+    """
+    보고서 집계 advisory lock (트랜잭션 종료 시 해제, PostgreSQL 외에는 생략)
+    - 업무 항목 쓰기: 공유 → 쓰기끼리는 서로 막지 않음
+    - 집계 생성: 배타 → 진행 중인 쓰기가 커밋된 뒤 집계, 집계 커밋 전까지 새 쓰기는 대기
+    """
+    if session.get_bind().dialect.name != "postgresql":
+        return
+    lock_func = "pg_advisory_xact_lock" if exclusive else "pg_advisory_xact_lock_shared"
+    session.execute(text(f"SELECT {lock_func}(:key)"), {"key": AGGREGATE_LOCK_KEY})
+
+
+# 집계 값에 반영되는 필드 (updated_at 일자가 그대로여도 바뀌면 해당 일자 재집계)
+AGGREGATED_FIELDS = ("category", "github_repo", "status")
+
+
+def _moved_days(obj: WorkItem, now: datetime, deleted: bool) -> set[date]:
+    """
+    수정/삭제된 업무 항목이 집계에서 빠지거나 들어가는 일자
+    - 새 updated_at은 앱 시각(KST)으로 지정 → DB 시간대와 무관하게 보고서 일자 경계와 일치
+    """
+    state = inspect(obj)
+    old_updated_at = state.committed_state.get("updated_at", obj.updated_at)
+    old_day = old_updated_at.date() if isinstance(old_updated_at, datetime) else None
+    if deleted:
+        return {old_day}
+
+    history = state.attrs.updated_at.history
+    new_updated_at = history.added[0] if history.added else None
+    if new_updated_at is WorkItem.updated_at:
+        # updated_at 유지 (내용 해시만 갱신 등)
+        new_day = old_day
+    elif isinstance(new_updated_at, datetime):
+        new_day = new_updated_at.date()
+    else:
+        # 미지정(onupdate) 또는 now() 식 → 앱 시각으로 대체
+        obj.updated_at = now
+        new_day = now.date()
+
+    if new_day != old_day:
+        return {old_day, new_day}
+    if any(state.attrs[field].history.has_changes() for field in AGGREGATED_FIELDS):
+        return {old_day}
+    return set()
+
+
+@event.listens_for(Session, "before_flush")
+def _invalidate_moved_days(session: Session, flush_context, instances):
+    """
+    업무 항목 생성/수정/삭제로 집계가 바뀌는 지난 일자만 삭제 → 다음 보고서에서 재집계
+    - 오늘 일자는 집계하지 않으므로 오늘로 옮겨지는 일반 갱신은 무효화/lock 없음
+    - 무효화할 일자가 있으면 집계 생성과 같은 advisory lock(공유)을 커밋까지 유지 → 커밋 전 변경이 집계에 누락되지 않음
+    """
+    now = now_kst().replace(tzinfo=None)
+    days = set()
+    with session.no_autoflush:
+        for obj in session.new:
+            if not isinstance(obj, WorkItem):
+                continue
+            if isinstance(obj.updated_at, datetime):
+                days.add(obj.updated_at.date())
+            else:
+                obj.updated_at = now
+        for obj in chain(session.dirty, session.deleted):
+            if not isinstance(obj, WorkItem):
+                continue
+            deleted = obj in session.deleted
+            if deleted or session.is_modified(obj, include_collections=False):
+                days |= _moved_days(obj, now, deleted)
+
+    days = {day for day in days if day is not None and day < now.date()}
+    if not days:
+        return
+
+    lock_report_aggregates(session)
+    session.execute(delete(ReportAggregate).where(ReportAggregate.aggregate_date.in_(days)))
@@ -0,0 +1,37 @@
+"""
+동기화 커서 모델 - 저장소/스트림별 마지막 동기화 지점
+"""
+
+from datetime import datetime
+
+from sqlalchemy import String, Integer, DateTime, UniqueConstraint, func
+from sqlalchemy.orm import Mapped, mapped_column
+
+from ..core.database import Base
+
+
+class SyncCursor(Base):
+    """저장소별 증분 동기화 커서 테이블"""
+    __tablename__ = "sync_cursors"
+    __table_args__ = (
+        UniqueConstraint("provider_key", "repo_name", "stream", name="uq_sync_cursors_target"),
+    )
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
+
+    # 대상 (프로바이더 호스트/조직, 저장소, 스트림: issues / commits)
+    provider_key: Mapped[str] = mapped_column(String(300), nullable=False)
+    repo_name: Mapped[str] = mapped_column(String(200), nullable=False)
+    stream: Mapped[str] = mapped_column(String(20), nullable=False)
+
+    # 마지막으로 처리한 지점 (UTC, Issue updated_at / 커밋 일시)
+    cursor_at: Mapped[datetime] = mapped_column(DateTime, nullable=False)
+    cursor_sha: Mapped[str | None] = mapped_column(String(64), nullable=True)
+
+    # 타임스탬프
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime, server_default=func.now(), onupdate=func.now(), nullable=False
+    )
+
+    def __repr__(self) -> str:
+        return f"<SyncCursor({self.provider_key}/{self.repo_name}:{self.stream} @ {self.cursor_at})>"
@@ -0,0 +1,44 @@
+"""
+업무 항목 관련 커밋 모델
+"""
+
+from datetime import datetime
+from typing import TYPE_CHECKING
+
+from sqlalchemy import String, Integer, DateTime, ForeignKey, UniqueConstraint, func
+from sqlalchemy.orm import Mapped, mapped_column, relationship
+
+from ..core.database import Base
+
+if TYPE_CHECKING:
+    from .issue import WorkItem
+
+
+class WorkItemCommit(Base):
+    """업무 항목 ↔ 커밋 연결 테이블 (커밋 1개가 여러 Issue를 참조하면 항목별로 1행)"""
+    __tablename__ = "work_item_commits"
+    __table_args__ = (
+        UniqueConstraint("github_repo", "sha", "work_item_id", name="uq_work_item_commits_repo_sha_item"),
+    )
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
+
+    # 업무 항목 참조
+    work_item_id: Mapped[int] = mapped_column(
+        Integer, ForeignKey("work_items.id", ondelete="CASCADE"), nullable=False, index=True
+    )
+
+    # 커밋 정보
+    github_repo: Mapped[str] = mapped_column(String(200), nullable=False)
+    sha: Mapped[str] = mapped_column(String(64), nullable=False)
+
+    # 타임스탬프
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime, server_default=func.now(), nullable=False
+    )
+
+    # 관계
+    work_item: Mapped["WorkItem"] = relationship("WorkItem", back_populates="commits")
+
+    def __repr__(self) -> str:
+        return f"<WorkItemCommit(work_item_id={self.work_item_id}, repo={self.github_repo}, sha={self.sha})>"
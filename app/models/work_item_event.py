@@ -0,0 +1,95 @@
+"""
+업무 항목 변경 이력 모델 (append-only) - 실제 내용/상태가 바뀐 경우에만 기록
+"""
+
+from datetime import datetime
+
+from sqlalchemy import String, Integer, DateTime, ForeignKey, Index, event, func, inspect
+from sqlalchemy.orm import Mapped, Session, mapped_column, relationship
+
+from ..core.database import Base
+from .issue import WorkItem, ItemStatus
+from .work_item_commit import WorkItemCommit
+
+# 이력 유형
+EVENT_CREATED = "created"
+EVENT_UPDATED = "updated"
+EVENT_COMMIT_LINKED = "commit_linked"
+
+# 변경 감지 대상 필드
+TRACKED_FIELDS = ("category", "status", "title", "summary", "labels", "resolved_at")
+
+
+class WorkItemEvent(Base):
+    """업무 항목 변경 이력 테이블 (변경 후 분류/상태 스냅샷)"""
+    __tablename__ = "work_item_events"
+    __table_args__ = (
+        Index("ix_work_item_events_created_at", "created_at"),
+        Index("ix_work_item_events_item_created", "work_item_id", "created_at"),
+    )
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
+
+    # 업무 항목 참조
+    work_item_id: Mapped[int] = mapped_column(
+        Integer, ForeignKey("work_items.id", ondelete="CASCADE"), nullable=False
+    )
+
+    # 이력 내용 (분류/상태는 소문자 값)
+    event_type: Mapped[str] = mapped_column(String(20), nullable=False)
+    category: Mapped[str] = mapped_column(String(20), nullable=False)
+    status: Mapped[str] = mapped_column(String(20), nullable=False)
+    changed_fields: Mapped[str | None] = mapped_column(String(200), nullable=True)
+    commit_sha: Mapped[str | None] = mapped_column(String(64), nullable=True)
+
+    # 타임스탬프
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime, server_default=func.now(), nullable=False
+    )
+
+    # 관계
+    work_item: Mapped[WorkItem] = relationship(WorkItem)
+
+    def __repr__(self) -> str:
+        return f"<WorkItemEvent(work_item_id={self.work_item_id}, type={self.event_type})>"
+
+
+def _changed_fields(obj: WorkItem) -> list[str]:
+    """실제 값이 바뀐 추적 필드 (같은 값 재할당은 제외)"""
+    state = inspect(obj)
+    changed = []
+    for field in TRACKED_FIELDS:
+        history = state.attrs[field].history
+        if history.added and list(history.added) != list(history.deleted):
+            changed.append(field)
+    return changed
+
+
+def _snapshot(work_item: WorkItem, event_type: str, **values) -> WorkItemEvent:
+    return WorkItemEvent(
+        work_item=work_item,
+        event_type=event_type,
+        category=work_item.category.value,
+        status=(work_item.status or ItemStatus.OPEN).value,
+        **values,
+    )
+
+
+@event.listens_for(Session, "before_flush")
+def _record_work_item_events(session: Session, flush_context, instances):
+    """flush 직전 업무 항목 생성/변경/커밋 연결을 이력으로 추가"""
+    events = []
+    with session.no_autoflush:
+        for obj in session.new:
+            if isinstance(obj, WorkItem):
+                events.append(_snapshot(obj, EVENT_CREATED))
+            elif isinstance(obj, WorkItemCommit) and obj.work_item is not None \
+                    and obj.work_item not in session.new:
+                events.append(_snapshot(obj.work_item, EVENT_COMMIT_LINKED, commit_sha=obj.sha))
+        for obj in session.dirty:
+            if not isinstance(obj, WorkItem):
+                continue
+            changed = _changed_fields(obj)
+            if changed:
+                events.append(_snapshot(obj, EVENT_UPDATED, changed_fields=",".join(changed)))
+    session.add_all(events)
@@ -18,6 +18,7 @@ class GitProviderCreate(BaseModel):
     base_url: Optional[str] = Field(None, max_length=500)
     token: str = Field(..., max_length=500)
     org_name: str = Field(..., max_length=200)
+    api_mode: str = Field(default="rest", pattern="^(rest|graphql)$")
     is_active: bool = True
 
 
@@ -27,6 +28,7 @@ class GitProviderUpdate(BaseModel):
     base_url: Optional[str] = Field(None, max_length=500)
     token: Optional[str] = Field(None, max_length=500)
     org_name: Optional[str] = Field(None, max_length=200)
+    api_mode: Optional[str] = Field(None, pattern="^(rest|graphql)$")
     is_active: Optional[bool] = None
 
 
@@ -37,6 +39,7 @@ class GitProviderResponse(BaseModel):
     provider_type: str
     base_url: Optional[str]
     org_name: str
+    api_mode: str
     is_active: bool
     created_at: Optional[datetime]
     updated_at: Optional[datetime]
@@ -80,17 +83,20 @@ class RepositoryResponse(BaseModel):
 # Recipient
 # ============================================================
 
+# 수신 보고서 유형 (콤마 구분, 유형별 최대 20자 컬럼에 저장) - daily / weekly / monthly / all
+REPORT_TYPES_PATTERN = r"^(?i)\s*((daily|weekly|monthly|all)\s*(,\s*(daily|weekly|monthly|all)\s*)*)?$"
+
 class RecipientCreate(BaseModel):
     name: str = Field(..., max_length=200)
     email: EmailStr
-    report_types: str = Field(default="all", max_length=100)
+    report_types: str = Field(default="all", max_length=100, pattern=REPORT_TYPES_PATTERN)
     is_active: bool = True
 
 
 class RecipientUpdate(BaseModel):
     name: Optional[str] = Field(None, max_length=200)
     email: Optional[EmailStr] = None
-    report_types: Optional[str] = Field(None, max_length=100)
+    report_types: Optional[str] = Field(None, max_length=100, pattern=REPORT_TYPES_PATTERN)
     is_active: Optional[bool] = None
 
 
@@ -0,0 +1,30 @@
+"""
+백그라운드 작업 Pydantic 스키마
+"""
+
+from datetime import datetime
+from pydantic import BaseModel, Field
+
+
+class JobResponse(BaseModel):
+    id: int
+    job_type: str
+    status: str
+    # 저장소 처리 횟수 (스캔 작업은 Agent별로 저장소마다 1회씩 집계)
+    repos_done: int = Field(description="완료한 저장소 처리 횟수 (Agent × 저장소)")
+    repos_total: int = Field(description="전체 저장소 처리 횟수 (Agent × 저장소)")
+    items_processed: int
+    error_message: str | None
+    created_at: datetime
+    started_at: datetime | None
+    finished_at: datetime | None
+    heartbeat_at: datetime | None
+
+    model_config = {"from_attributes": True}
+
+
+class JobSubmitResponse(BaseModel):
+    job_id: int
+    status: str
+    deduplicated: bool
+    message: str
@@ -24,3 +24,16 @@ class WorkItemResponse(BaseModel):
     resolved_at: datetime | None
 
     model_config = {"from_attributes": True}
+
+
+class WorkItemEventResponse(BaseModel):
+    id: int
+    work_item_id: int
+    event_type: str
+    category: str
+    status: str
+    changed_fields: str | None
+    commit_sha: str | None
+    created_at: datetime
+
+    model_config = {"from_attributes": True}
@@ -1,26 +1,69 @@
 """
 설정 관리 서비스 - DB-first, .env fallback
+- app_settings는 한 번의 쿼리로 전체 로드 후 메모리 캐시 (쓰기 시 무효화, 다른 인스턴스의 변경은 TTL 후 반영)
+- 보고서 유형별 수신자도 같은 방식으로 캐시 (수신자 CRUD 시 무효화)
 """
 
+import time
 import logging
+import threading
 from typing import Optional
 
+from sqlalchemy import select
 from sqlalchemy.orm import Session
 
 from ..core.config import settings
 from ..models.git_provider import GitProvider
 from ..models.repository import Repository
-from ..models.recipient import Recipient
+from ..models.recipient import Recipient, RecipientReportType, REPORT_TYPE_ALL
 from ..models.app_setting import AppSetting
 
 logger = logging.getLogger(__name__)
 
+# 설정 캐시 유효 시간 (다중 인스턴스에서 다른 인스턴스의 변경 반영 지연 상한)
+SETTINGS_CACHE_TTL_SECONDS = 60
+
+_settings_cache: Optional[dict[str, str]] = None
+_settings_loaded_at = 0.0
+_settings_generation = 0
+_settings_lock = threading.Lock()
+
+# 보고서 유형별 수신자 캐시: report_type(None이면 전체) → (로드 시각, 이메일 목록)
+_recipient_routes: dict[Optional[str], tuple[float, list[str]]] = {}
+_recipient_generation = 0
+
+
+def _load_settings(db: Session) -> dict[str, str]:
+    """app_settings 전체 (key → value), TTL 내에는 메모리 캐시 사용"""
+    global _settings_cache, _settings_loaded_at
+
+    cache = _settings_cache
+    if cache is not None and time.monotonic() - _settings_loaded_at < SETTINGS_CACHE_TTL_SECONDS:
+        return cache
+
+    generation = _settings_generation
+    cache = dict(db.query(AppSetting.key, AppSetting.value).all())
+    with _settings_lock:
+        # 로드 중 무효화되었으면 저장하지 않음 (변경 전 값으로 덮어쓰기 방지)
+        if generation == _settings_generation:
+            _settings_cache = cache
+            _settings_loaded_at = time.monotonic()
+    return cache
+
+
+def invalidate_settings_cache():
+    """설정 변경 후 호출 - 다음 조회 시 DB에서 다시 로드"""
+    global _settings_cache, _settings_generation
+    with _settings_lock:
+        _settings_cache = None
+        _settings_generation += 1
+
 
 def get_setting(db: Session, key: str, default: str = None) -> Optional[str]:
     """DB에서 설정 조회, 없으면 .env fallback"""
-    row = db.query(AppSetting).filter(AppSetting.key == key).first()
-    if row:
-        return row.value
+    db_settings = _load_settings(db)
+    if key in db_settings:
+        return db_settings[key]
 
     # .env fallback
     env_map = {
@@ -34,6 +77,7 @@ def get_setting(db: Session, key: str, default: str = None) -> Optional[str]:
         "monthly_report_minute": str(settings.monthly_report_minute),
         "max_projects_per_category": str(settings.max_projects_per_category),
         "max_items_per_project": str(settings.max_items_per_project),
+        "agent_scan_workers": str(settings.agent_scan_workers),
     }
     return env_map.get(key, default)
 
@@ -58,22 +102,50 @@ def get_setting_bool(db: Session, key: str, default: bool = False) -> bool:
 
 
 def get_active_recipients(db: Session, report_type: str = None) -> list[str]:
-    """활성 수신자 이메일 목록 조회 (DB → .env fallback)"""
-    recipients = db.query(Recipient).filter(Recipient.is_active == True).all()  # noqa: E712
-
-    if recipients:
-        if report_type:
-            return [
-                r.email for r in recipients
-                if r.report_types == "all"
-                or report_type in [t.strip() for t in r.report_types.split(",")]
-            ]
-        return [r.email for r in recipients]
+    """활성 수신자 이메일 목록 조회 (DB → .env fallback, 유형별 결과는 캐시)"""
+    key = report_type.lower() if report_type else None
+    cached = _recipient_routes.get(key)
+    if cached is not None and time.monotonic() - cached[0] < SETTINGS_CACHE_TTL_SECONDS:
+        return list(cached[1])
+
+    generation = _recipient_generation
+    emails = _query_recipients(db, key)
+    with _settings_lock:
+        if generation == _recipient_generation:
+            _recipient_routes[key] = (time.monotonic(), emails)
+    return list(emails)
+
+
+def _query_recipients(db: Session, report_type: Optional[str]) -> list[str]:
+    """유형별 수신자 조회 (report_type 인덱스로 직접 조회, 활성 수신자가 없으면 .env)"""
+    query = db.query(Recipient.email).filter(Recipient.is_active == True)  # noqa: E712
+    if report_type:
+        matching = select(RecipientReportType.recipient_id).where(
+            RecipientReportType.report_type.in_((report_type, REPORT_TYPE_ALL))
+        )
+        query = query.filter(Recipient.id.in_(matching))
+    emails = [email for (email,) in query.order_by(Recipient.id)]
+    if emails:
+        return emails
+
+    # 활성 수신자가 하나라도 있으면 DB 설정을 따름 (해당 유형 수신자 없음)
+    if report_type and db.query(
+        db.query(Recipient.id).filter(Recipient.is_active == True).exists()  # noqa: E712
+    ).scalar():
+        return []
 
     # .env fallback
     return settings.recipient_list
 
 
+def invalidate_recipient_cache():
+    """수신자 변경 후 호출 - 유형별 수신자 캐시 초기화"""
+    global _recipient_generation
+    with _settings_lock:
+        _recipient_routes.clear()
+        _recipient_generation += 1
+
+
 def get_active_git_providers(db: Session) -> list[GitProvider]:
     """활성 Git 프로바이더 목록 조회"""
     return db.query(GitProvider).filter(GitProvider.is_active == True).all()  # noqa: E712
@@ -128,7 +200,7 @@ def seed_from_env(db: Session) -> dict:
         existing = db.query(Recipient).filter(Recipient.email == email).first()
         if not existing:
             name = email.split("@")[0]
-            recipient = Recipient(name=name, email=email)
+            recipient = Recipient(name=name, email=email, report_types=REPORT_TYPE_ALL)
             db.add(recipient)
             seeded.append(f"recipient: {email}")
         else:
@@ -146,6 +218,7 @@ def seed_from_env(db: Session) -> dict:
         ("monthly_report_minute", str(settings.monthly_report_minute), "int", "scheduler", "월간보고 시간 (분)"),
         ("max_projects_per_category", str(settings.max_projects_per_category), "int", "report", "카테고리당 최대 프로젝트 수"),
         ("max_items_per_project", str(settings.max_items_per_project), "int", "report", "프로젝트당 최대 항목 수"),
+        ("agent_scan_workers", str(settings.agent_scan_workers), "int", "agent", "프로바이더당 저장소 병렬 조회 수"),
     ]
 
     for key, value, value_type, category, description in setting_seeds:
@@ -167,5 +240,7 @@ def seed_from_env(db: Session) -> dict:
             skipped.append(f"setting: {key} (이미 존재)")
 
     db.commit()
+    invalidate_settings_cache()
+    invalidate_recipient_cache()
     logger.info(f"시드 완료: {len(seeded)}건 추가, {len(skipped)}건 건너뜀")
     return {"seeded": seeded, "skipped": skipped}
@@ -0,0 +1,59 @@
+"""
+증분 동기화 커서 서비스 - 저장소/스트림별 마지막 성공 지점 관리
+"""
+
+import logging
+from datetime import datetime, timezone
+from typing import Optional
+
+from sqlalchemy.orm import Session
+
+from ..models.sync_cursor import SyncCursor
+
+logger = logging.getLogger(__name__)
+
+STREAM_ISSUES = "issues"
+STREAM_COMMITS = "commits"
+
+
+def utc_naive(value: Optional[datetime] = None) -> datetime:
+    """UTC 기준 naive datetime 변환 (GitHub since 파라미터/DB 저장 형식)"""
+    if value is None:
+        return datetime.now(timezone.utc).replace(tzinfo=None)
+    if value.tzinfo is not None:
+        return value.astimezone(timezone.utc).replace(tzinfo=None)
+    return value
+
+
+def load_cursors(db: Session, stream: str) -> dict[tuple[str, str], SyncCursor]:
+    """스트림의 전체 커서를 한 번에 조회 → {(provider_key, repo_name): cursor}"""
+    cursors = db.query(SyncCursor).filter(SyncCursor.stream == stream).all()
+    return {(c.provider_key, c.repo_name): c for c in cursors}
+
+
+def advance_cursor(
+    db: Session,
+    cursors: dict[tuple[str, str], SyncCursor],
+    provider_key: str,
+    repo_name: str,
+    stream: str,
+    cursor_at: datetime,
+    cursor_sha: str = None,
+) -> None:
+    """커서 전진 (뒤로 가지 않음). 커밋은 호출자가 수행"""
+    cursor_at = utc_naive(cursor_at)
+    cursor = cursors.get((provider_key, repo_name))
+    if cursor is None:
+        cursor = SyncCursor(
+            provider_key=provider_key,
+            repo_name=repo_name,
+            stream=stream,
+            cursor_at=cursor_at,
+            cursor_sha=cursor_sha,
+        )
+        db.add(cursor)
+        cursors[(provider_key, repo_name)] = cursor
+    elif cursor_at > cursor.cursor_at:
+        cursor.cursor_at = cursor_at
+        if cursor_sha:
+            cursor.cursor_sha = cursor_sha
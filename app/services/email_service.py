@@ -1,15 +1,21 @@
 """
 Gmail SMTP 이메일 발송 서비스
+- 일괄 발송은 aiosmtplib 연결 풀로 수신자별 병렬 발송
 """
 
+import math
+import asyncio
 import logging
 import smtplib
+from concurrent.futures import ThreadPoolExecutor
 from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
 from email.header import Header
 from dataclasses import dataclass
 from typing import Optional
 
+import aiosmtplib
+
 from ..core.config import settings
 
 logger = logging.getLogger(__name__)
@@ -23,20 +29,40 @@ class SendResult:
     error_message: Optional[str] = None
 
 
+@dataclass(frozen=True)
+class PreparedMessage:
+    """직렬화된 메시지 (본문 base64 인코딩은 1회, 수신자별로 To 헤더만 앞에 추가)"""
+    payload: bytes
+
+    def for_recipient(self, recipient: str) -> bytes:
+        if "\r" in recipient or "\n" in recipient:
+            raise ValueError(f"잘못된 수신자 주소: {recipient!r}")
+        return b"To: " + recipient.encode("utf-8") + b"\r\n" + self.payload
+
+
 class EmailService:
     """Gmail SMTP 이메일 발송 서비스"""
 
     SMTP_SERVER = "smtp.gmail.com"
     SMTP_PORT = 587
     SMTP_TIMEOUT = 30  # 초
+    SMTP_POOL_SIZE = 3  # 일괄 발송 시 동시 연결 수
+    RECIPIENT_TIMEOUT = 30  # 수신자 1명 발송 제한 시간 (초)
 
     def __init__(
         self,
         sender_email: str = None,
-        app_password: str = None
+        app_password: str = None,
+        smtp_host: str = None,
+        smtp_port: int = None,
+        use_tls: bool = True,
     ):
         self.sender_email = sender_email or settings.gmail_address
         self.app_password = app_password or settings.gmail_app_password
+        # 로컬 SMTP 서버(aiosmtpd 등) 테스트 시 호스트/포트/TLS 지정
+        self.smtp_host = smtp_host or self.SMTP_SERVER
+        self.smtp_port = smtp_port or self.SMTP_PORT
+        self.use_tls = use_tls
 
         if not self.is_configured:
             logger.warning(
@@ -65,22 +91,13 @@ class EmailService:
             )
 
         try:
-            message = MIMEMultipart("alternative")
-            message["Subject"] = Header(subject, "utf-8")
-            message["From"] = f"{sender_name} <{self.sender_email}>"
-            message["To"] = recipient
-
-            html_part = MIMEText(html_content, "html", "utf-8")
-            message.attach(html_part)
+            message = self.prepare_message(subject, html_content, sender_name).for_recipient(recipient)
 
-            with smtplib.SMTP(self.SMTP_SERVER, self.SMTP_PORT, timeout=self.SMTP_TIMEOUT) as server:
-                server.starttls()
+            with smtplib.SMTP(self.smtp_host, self.smtp_port, timeout=self.SMTP_TIMEOUT) as server:
+                if self.use_tls:
+                    server.starttls()
                 server.login(self.sender_email, self.app_password)
-                server.sendmail(
-                    self.sender_email,
-                    recipient,
-                    message.as_string()
-                )
+                server.sendmail(self.sender_email, recipient, message)
 
             logger.info(f"이메일 발송 성공: {recipient}")
             return SendResult(recipient=recipient, success=True)
@@ -100,6 +117,15 @@ class EmailService:
             logger.error(f"이메일 발송 실패: {error_msg}")
             return SendResult(recipient=recipient, success=False, error_message=error_msg)
 
+    def batch_timeout_seconds(self, count: int) -> int:
+        """
+        일괄 발송 최악 소요 시간 (초)
+        - 연결/로그인 제한 시간 + 연결당 순차 발송 수 × (재연결 + 수신자별 제한 시간)
+        """
+        connect_seconds = self.SMTP_TIMEOUT * 2
+        rounds = math.ceil(count / self.SMTP_POOL_SIZE)
+        return connect_seconds + rounds * (connect_seconds + self.RECIPIENT_TIMEOUT)
+
     def send_batch(
         self,
         recipients: list[str],
@@ -107,62 +133,138 @@ class EmailService:
         html_content: str,
         sender_name: str = "StandUp Report"
     ) -> list[SendResult]:
-        """다수 수신자에게 일괄 발송 (SMTP 연결 재사용)"""
+        """다수 수신자에게 일괄 발송 (동기 호출용, 내부적으로 비동기 연결 풀 사용)"""
+        return _run_sync(self.send_batch_async(recipients, subject, html_content, sender_name))
+
+    async def send_batch_async(
+        self,
+        recipients: list[str],
+        subject: str,
+        html_content: str,
+        sender_name: str = "StandUp Report"
+    ) -> list[SendResult]:
+        """다수 수신자에게 일괄 발송 (SMTP 연결 풀로 병렬 발송, 결과는 수신자 순서)"""
         if not self.is_configured:
             return [
                 SendResult(recipient=r, success=False, error_message="Gmail 설정이 완료되지 않았습니다.")
                 for r in recipients
             ]
+        if not recipients:
+            return []
+
+        pool_size = min(self.SMTP_POOL_SIZE, len(recipients))
+        opened = await asyncio.gather(
+            *(self._connect() for _ in range(pool_size)), return_exceptions=True
+        )
+        pool = [conn for conn in opened if not isinstance(conn, BaseException)]
+
+        if not pool:
+            error = opened[0]
+            if isinstance(error, aiosmtplib.SMTPAuthenticationError):
+                error_msg = "Gmail 인증 실패. 앱 비밀번호를 확인하세요."
+                logger.error(f"SMTP 인증 실패: {error_msg}")
+            else:
+                error_msg = f"SMTP 연결 오류: {error}"
+                logger.error(error_msg)
+            return [SendResult(recipient=r, success=False, error_message=error_msg) for r in recipients]
+
+        idle: asyncio.Queue = asyncio.Queue()
+        for conn in pool:
+            idle.put_nowait(conn)
+
+        prepared = self.prepare_message(subject, html_content, sender_name)
+        try:
+            results = await asyncio.gather(
+                *(self._send_pooled(idle, r, prepared) for r in recipients)
+            )
+        finally:
+            for conn in pool:
+                await self._disconnect(conn)
 
-        results = []
+        success_count = sum(1 for r in results if r.success)
+        logger.info(
+            f"일괄 발송 완료: {success_count}/{len(recipients)} 성공 (연결 {len(pool)}개)"
+        )
+        return list(results)
+
+    async def _connect(self, conn: aiosmtplib.SMTP = None) -> aiosmtplib.SMTP:
+        """SMTP 연결 + 로그인 (conn을 주면 재연결)"""
+        if conn is None:
+            conn = aiosmtplib.SMTP(
+                hostname=self.smtp_host,
+                port=self.smtp_port,
+                start_tls=self.use_tls,
+                timeout=self.SMTP_TIMEOUT,
+            )
+        await conn.connect()
+        await conn.login(self.sender_email, self.app_password)
+        return conn
+
+    @staticmethod
+    async def _disconnect(conn: aiosmtplib.SMTP):
+        if not conn.is_connected:
+            return
         try:
-            with smtplib.SMTP(self.SMTP_SERVER, self.SMTP_PORT, timeout=self.SMTP_TIMEOUT) as server:
-                server.starttls()
-                server.login(self.sender_email, self.app_password)
+            await conn.quit()
+        except Exception:
+            conn.close()
 
-                for recipient in recipients:
-                    try:
-                        message = MIMEMultipart("alternative")
-                        message["Subject"] = Header(subject, "utf-8")
-                        message["From"] = f"{sender_name} <{self.sender_email}>"
-                        message["To"] = recipient
-
-                        html_part = MIMEText(html_content, "html", "utf-8")
-                        message.attach(html_part)
-
-                        server.sendmail(self.sender_email, recipient, message.as_string())
-                        results.append(SendResult(recipient=recipient, success=True))
-                        logger.info(f"이메일 발송 성공: {recipient}")
-
-                    except smtplib.SMTPRecipientsRefused:
-                        error_msg = f"수신자 거부: {recipient}"
-                        logger.error(f"이메일 발송 실패: {error_msg}")
-                        results.append(SendResult(recipient=recipient, success=False, error_message=error_msg))
-                    except Exception as e:
-                        error_msg = str(e)
-                        logger.error(f"이메일 발송 실패 ({recipient}): {error_msg}")
-                        results.append(SendResult(recipient=recipient, success=False, error_message=error_msg))
+    async def _send_pooled(
+        self,
+        idle: asyncio.Queue,
+        recipient: str,
+        prepared: PreparedMessage,
+    ) -> SendResult:
+        """풀에서 연결을 빌려 수신자 1명에게 발송 (수신자별 타임아웃)"""
+        conn = await idle.get()
+        try:
+            if not conn.is_connected:
+                await self._connect(conn)
 
-        except smtplib.SMTPAuthenticationError:
-            error_msg = "Gmail 인증 실패. 앱 비밀번호를 확인하세요."
-            logger.error(f"SMTP 인증 실패: {error_msg}")
-            processed = {r.recipient for r in results}
-            results.extend(
-                SendResult(recipient=r, success=False, error_message=error_msg)
-                for r in recipients if r not in processed
-            )
-        except Exception as e:
-            error_msg = f"SMTP 연결 오류: {e}"
-            logger.error(error_msg)
-            processed = {r.recipient for r in results}
-            results.extend(
-                SendResult(recipient=r, success=False, error_message=error_msg)
-                for r in recipients if r not in processed
+            await asyncio.wait_for(
+                conn.sendmail(self.sender_email, [recipient], prepared.for_recipient(recipient)),
+                timeout=self.RECIPIENT_TIMEOUT,
             )
+            logger.info(f"이메일 발송 성공: {recipient}")
+            return SendResult(recipient=recipient, success=True)
 
-        success_count = sum(1 for r in results if r.success)
-        logger.info(f"일괄 발송 완료: {success_count}/{len(recipients)} 성공")
-        return results
+        except aiosmtplib.SMTPRecipientsRefused:
+            error_msg = f"수신자 거부: {recipient}"
+        except aiosmtplib.SMTPAuthenticationError:
+            error_msg = "Gmail 인증 실패. 앱 비밀번호를 확인하세요."
+        except asyncio.TimeoutError:
+            error_msg = f"발송 시간 초과 ({self.RECIPIENT_TIMEOUT}초)"
+            # 응답 대기 중인 연결은 재사용 불가 → 다음 사용 시 재연결
+            conn.close()
+        except Exception as e:
+            error_msg = str(e)
+            if isinstance(e, aiosmtplib.SMTPServerDisconnected):
+                conn.close()
+        finally:
+            idle.put_nowait(conn)
+
+        logger.error(f"이메일 발송 실패 ({recipient}): {error_msg}")
+        return SendResult(recipient=recipient, success=False, error_message=error_msg)
+
+    def prepare_message(self, subject: str, html_content: str, sender_name: str = "StandUp Report") -> PreparedMessage:
+        """수신자 공통 MIME 메시지를 한 번만 직렬화 (To 헤더 제외)"""
+        message = MIMEMultipart("alternative")
+        message["Subject"] = Header(subject, "utf-8")
+        message["From"] = f"{sender_name} <{self.sender_email}>"
+
+        html_part = MIMEText(html_content, "html", "utf-8")
+        message.attach(html_part)
+        return PreparedMessage(message.as_bytes(policy=message.policy.clone(linesep="\r\n")))
+
+
+def _run_sync(coro):
+    """동기 코드(스케줄러 스레드 등)에서 코루틴 실행 - 이벤트 루프가 돌고 있으면 별도 스레드에서 실행"""
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(coro)
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        return executor.submit(asyncio.run, coro).result()
 
 
 # 싱글톤
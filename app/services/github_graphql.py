@@ -0,0 +1,180 @@
+"""
+GitHub GraphQL 배치 조회 서비스
+저장소 여러 개를 alias로 묶어 한 번의 쿼리로 issues/commits를 조회
+"""
+
+import time
+import logging
+from datetime import datetime
+from typing import Iterator, Optional
+
+from github import GithubException
+
+from .github_service import GitHubService, decode_unicode_escapes, parse_timestamp, _format_since
+from .cursor_service import STREAM_ISSUES, STREAM_COMMITS
+from .rate_limiter import get_token_budget, is_rate_limited, PRIORITY_HIGH
+
+logger = logging.getLogger(__name__)
+
+_ISSUE_FIELDS = """
+    pageInfo { hasNextPage endCursor }
+    nodes {
+        number title body state url createdAt updatedAt closedAt
+        labels(first: 20) { nodes { name } }
+    }
+"""
+
+_COMMIT_FIELDS = """
+    pageInfo { hasNextPage endCursor }
+    nodes { oid message url author { name date } }
+"""
+
+
+class GitHubGraphQLService(GitHubService):
+    """GraphQL 기반 GitHub 조회 서비스 (REST와 동일한 dict 형식 반환)"""
+
+    API_MODE = "graphql"
+    BATCH_SIZE = 10
+
+    def iter_issue_pages(
+        self, repo_name: str, since: datetime = None, state: str = "all"
+    ) -> Iterator[list[dict]]:
+        """저장소의 Issues를 페이지 단위로 조회 (state는 all만 지원)"""
+        for _, page in self.iter_batch(STREAM_ISSUES, [(repo_name, since)]):
+            yield page
+
+    def iter_commit_pages(self, repo_name: str, since: datetime = None) -> Iterator[list[dict]]:
+        """저장소의 기본 브랜치 커밋을 페이지 단위로 조회 (개수 제한 없음)"""
+        for _, page in self.iter_batch(STREAM_COMMITS, [(repo_name, since)]):
+            yield page
+
+    def iter_batch(
+        self, stream: str, targets: list[tuple[str, Optional[datetime]]]
+    ) -> Iterator[tuple[str, list[dict]]]:
+        """
+        alias 쿼리로 저장소 여러 개를 동시 조회, 다음 페이지가 있는 저장소만 이어서 조회
+        → 응답마다 (repo_name, 페이지 결과) 반환, 조회 실패 시 예외 전파
+        """
+        # (repo_name, since, after cursor)
+        pending = [(repo_name, since, None) for repo_name, since in targets]
+
+        while pending:
+            data = self._query_batch(stream, pending)
+
+            next_pending = []
+            for index, (repo_name, since, _) in enumerate(pending):
+                connection = self._extract_connection(stream, data.get(f"r{index}"))
+                if connection is None:
+                    continue
+
+                if stream == STREAM_ISSUES:
+                    page = [self._issue_from_node(n) for n in connection["nodes"]]
+                else:
+                    page = [self._commit_from_node(n) for n in connection["nodes"]]
+                if page:
+                    yield repo_name, page
+
+                page_info = connection["pageInfo"]
+                if page_info["hasNextPage"]:
+                    next_pending.append((repo_name, since, page_info["endCursor"]))
+            pending = next_pending
+
+    def _query_batch(self, stream: str, pending: list[tuple[str, Optional[datetime], Optional[str]]]) -> dict:
+        """저장소별 alias(r0, r1, ...)로 구성한 쿼리 실행"""
+        var_defs = []
+        fields = []
+        variables = {}
+        since_type = "DateTime" if stream == STREAM_ISSUES else "GitTimestamp"
+
+        for index, (repo_name, since, after) in enumerate(pending):
+            var_defs.append(f"$o{index}: String!, $n{index}: String!, $s{index}: {since_type}, $c{index}: String")
+            variables.update({
+                f"o{index}": self.org_name,
+                f"n{index}": repo_name,
+                f"s{index}": _format_since(since) if since else None,
+                f"c{index}": after,
+            })
+            if stream == STREAM_ISSUES:
+                body = (
+                    f"issues(first: {self.page_size}, after: $c{index}, filterBy: {{since: $s{index}}}, "
+                    f"orderBy: {{field: UPDATED_AT, direction: DESC}}) {{ {_ISSUE_FIELDS} }}"
+                )
+            else:
+                body = (
+                    f"defaultBranchRef {{ target {{ ... on Commit {{ "
+                    f"history(first: {self.page_size}, after: $c{index}, since: $s{index}) {{ {_COMMIT_FIELDS} }} "
+                    f"}} }} }}"
+                )
+            fields.append(f"r{index}: repository(owner: $o{index}, name: $n{index}) {{ {body} }}")
+
+        query = f"query({', '.join(var_defs)}) {{ {' '.join(fields)} }}"
+
+        budget = get_token_budget(self.token, "graphql")
+        for attempt in range(self.MAX_RETRIES + 1):
+            budget.acquire(PRIORITY_HIGH)
+            started = time.time()
+            try:
+                with self.borrow_client() as client:
+                    requester = client.requester
+                    headers, response = requester.requestJsonAndCheck(
+                        "POST", requester.graphql_url, input={"query": query, "variables": variables}
+                    )
+            except GithubException as e:
+                budget.update(e.headers)
+                message = e.data.get("message") if isinstance(e.data, dict) else ""
+                if attempt < self.MAX_RETRIES and is_rate_limited(e.status, e.headers, message):
+                    delay = budget.backoff(attempt, e.headers)
+                    logger.warning(f"GitHub GraphQL rate limit ({e.status}) → {delay:.1f}초 후 재시도")
+                    time.sleep(delay)
+                    continue
+                raise
+            finally:
+                self._record_request(time.time() - started)
+            budget.update(headers)
+            break
+
+        # 존재하지 않는 저장소 등은 부분 오류로 반환됨 → 나머지 결과는 사용
+        for error in response.get("errors") or []:
+            logger.warning(f"GraphQL 부분 오류: {error.get('message')}")
+        return response.get("data") or {}
+
+    @staticmethod
+    def _extract_connection(stream: str, repo_data: Optional[dict]) -> Optional[dict]:
+        """저장소 응답에서 issues / history connection 추출"""
+        if not repo_data:
+            return None
+        if stream == STREAM_ISSUES:
+            return repo_data.get("issues")
+        branch = repo_data.get("defaultBranchRef")
+        if not branch or not branch.get("target"):
+            # 빈 저장소
+            return None
+        return branch["target"].get("history")
+
+    def _issue_from_node(self, node: dict) -> dict:
+        """GraphQL Issue 노드 → 내부 Issue dict"""
+        labels = [label["name"] for label in node["labels"]["nodes"]]
+        return {
+            "number": node["number"],
+            "title": decode_unicode_escapes(node["title"]),
+            "body": decode_unicode_escapes(node.get("body") or ""),
+            "state": node["state"].lower(),
+            "labels": labels,
+            "category": self._classify_issue(labels),
+            "url": node["url"],
+            "created_at": parse_timestamp(node.get("createdAt")),
+            "updated_at": parse_timestamp(node.get("updatedAt")),
+            "closed_at": parse_timestamp(node.get("closedAt")),
+        }
+
+    @staticmethod
+    def _commit_from_node(node: dict) -> dict:
+        """GraphQL Commit 노드 → 내부 커밋 dict"""
+        author = node.get("author")
+        return {
+            "sha": node["oid"][:8],
+            "message": decode_unicode_escapes(node["message"]),
+            "author": author["name"] if author and author.get("name") else "unknown",
+            "date": parse_timestamp(author.get("date")) if author else None,
+            "url": node["url"],
+        }
@@ -3,27 +3,158 @@ GitHub API 연동 서비스
 """
 
 import re
+import json
+import time
+import hashlib
 import logging
+import threading
+from contextlib import contextmanager
 from datetime import datetime, timezone
-from typing import Optional
+from typing import Any, Iterator, Optional
 
 from github import Github, GithubException
 
 from ..core.config import settings
 from ..models.issue import ItemCategory
+from .http_cache import get_response_cache
+from .cursor_service import STREAM_ISSUES
+from .rate_limiter import get_token_budget, is_rate_limited, PRIORITY_HIGH, PRIORITY_LOW
 
 logger = logging.getLogger(__name__)
 
 _UNICODE_ESCAPE_RE = re.compile(r'\\u([0-9a-fA-F]{4})')
+_NEXT_LINK_RE = re.compile(r'<([^>]+)>;\s*rel="next"')
 
 
-def _decode_unicode_escapes(text: str) -> str:
+def decode_unicode_escapes(text: str) -> str:
     """Decode literal \\uXXXX escape sequences to actual unicode characters"""
     if not text or "\\u" not in text:
         return text
     return _UNICODE_ESCAPE_RE.sub(lambda m: chr(int(m.group(1), 16)), text)
 
 
+def parse_timestamp(value: Optional[str]) -> Optional[datetime]:
+    """GitHub ISO 8601 타임스탬프 → timezone-aware datetime"""
+    if not value:
+        return None
+    return datetime.fromisoformat(value.replace("Z", "+00:00"))
+
+
+def _format_since(since: datetime) -> str:
+    """since 파라미터 (초 단위 고정 → 동일 커서면 동일 URL로 캐시 적중)"""
+    if since.tzinfo is not None:
+        since = since.astimezone(timezone.utc)
+    return since.strftime("%Y-%m-%dT%H:%M:%SZ")
+
+
+def _parse_next_link(link_header: Optional[str]) -> Optional[str]:
+    """Link 헤더에서 rel="next" URL 추출"""
+    if not link_header:
+        return None
+    match = _NEXT_LINK_RE.search(link_header)
+    return match.group(1) if match else None
+
+
+class GitHubClientPool:
+    """
+    (API 주소, 토큰)별 PyGithub 클라이언트 풀 - 프로세스 전역으로 실행/프로바이더/서비스 간 재사용
+    - PyGithub 연결은 스레드 간 동시 사용 불가 → 요청마다 유휴 클라이언트를 빌려 쓰고 반납
+    - 클라이언트마다 keep-alive 세션 유지 → TLS 핸드셰이크/DNS 조회를 반복 실행 간 재사용
+    """
+
+    def __init__(self, base_url: Optional[str], token: str, key: str, max_idle: int):
+        self.base_url = base_url
+        self._token = token
+        self._key = key
+        self._max_idle = max(1, max_idle)
+        self._idle: list[Github] = []
+        self._lock = threading.Lock()
+        self._created = 0
+        self._borrowed = 0
+
+    def _create(self) -> Github:
+        # PyGithub 내장 재시도 비활성화 → 레이트 리밋 대기/백오프는 TokenBudget에서만 처리
+        if self.base_url:
+            return Github(base_url=self.base_url, login_or_token=self._token, retry=None)
+        return Github(self._token, retry=None)
+
+    @contextmanager
+    def borrow(self) -> Iterator[Github]:
+        """유휴 클라이언트 대여 (없으면 생성), 반납 시 max_idle 초과분은 종료"""
+        with self._lock:
+            client = self._idle.pop() if self._idle else None
+            self._borrowed += 1
+            if client is None:
+                self._created += 1
+        if client is None:
+            client = self._create()
+        try:
+            yield client
+        finally:
+            with self._lock:
+                keep = len(self._idle) < self._max_idle
+                if keep:
+                    self._idle.append(client)
+            if not keep:
+                client.close()
+
+    def close(self):
+        """유휴 클라이언트 연결 종료"""
+        with self._lock:
+            idle, self._idle = self._idle, []
+        for client in idle:
+            client.close()
+
+    def status(self) -> dict:
+        with self._lock:
+            return {
+                "base_url": self.base_url or "https://api.github.com",
+                "token": self._key[:8],
+                "idle": len(self._idle),
+                "created": self._created,
+                "borrowed": self._borrowed,
+            }
+
+
+_client_pools: dict[tuple[str, str], GitHubClientPool] = {}
+_client_pools_lock = threading.Lock()
+
+
+def get_client_pool(token: str, base_url: str = None) -> GitHubClientPool:
+    """(API 주소, 토큰 해시)별 클라이언트 풀 싱글톤"""
+    key = hashlib.sha256((token or "").encode()).hexdigest()
+    with _client_pools_lock:
+        pool = _client_pools.get((base_url or "", key))
+        if pool is None:
+            pool = GitHubClientPool(base_url, token, key, settings.github_client_pool_size)
+            _client_pools[(base_url or "", key)] = pool
+        return pool
+
+
+def get_client_pool_status() -> list[dict]:
+    """전체 클라이언트 풀 상태 (진단용, 토큰은 해시 앞 8자리만)"""
+    with _client_pools_lock:
+        pools = list(_client_pools.values())
+    return [pool.status() for pool in pools]
+
+
+def close_client_pools():
+    """앱 종료 시 유휴 연결 정리"""
+    with _client_pools_lock:
+        pools = list(_client_pools.values())
+    for pool in pools:
+        pool.close()
+
+
+def _loads_error(output: str) -> dict:
+    """에러 응답 본문 파싱 (JSON이 아니면 메시지로 감쌈)"""
+    try:
+        data = json.loads(output) if output else None
+    except ValueError:
+        return {"message": output[:200]}
+    return data if isinstance(data, dict) else {"message": str(data)}
+
+
 class GitHubService:
     """GitHub Issues/Commits 조회 서비스"""
 
@@ -31,113 +162,247 @@ class GitHubService:
     PLANNED_LABELS = {"enhancement", "feature", "refactor", "improvement", "planned"}
     REQUIRED_LABELS = {"bug", "request", "urgent", "hotfix", "required"}
 
-    def __init__(self, token: str = None, org_name: str = None, base_url: str = None):
+    # 목록 API 최대 페이지 크기 (GitHub 제한)
+    MAX_PAGE_SIZE = 100
+
+    # rate limit(403/429) 재시도 횟수
+    MAX_RETRIES = 3
+
+    # 조회 방식 및 요청 1회당 저장소 수 (REST는 저장소별 개별 요청)
+    API_MODE = "rest"
+    BATCH_SIZE = 1
+
+    def __init__(
+        self, token: str = None, org_name: str = None, base_url: str = None, page_size: int = None
+    ):
         self.token = token or settings.github_token
         self.org_name = org_name or settings.github_org
         self.base_url = base_url
-        self._client: Optional[Github] = None
-
-    @property
-    def client(self) -> Github:
-        if self._client is None:
-            if not self.token:
-                raise ValueError("GITHUB_TOKEN이 설정되지 않았습니다.")
-            if self.base_url:
-                self._client = Github(base_url=self.base_url, login_or_token=self.token)
-            else:
-                self._client = Github(self.token)
-        return self._client
+        self.page_size = min(self.MAX_PAGE_SIZE, max(1, page_size or settings.github_page_size))
+        # 요청 수/소요 시간 누적 (REST vs GraphQL 비교용)
+        self._stats_lock = threading.Lock()
+        self._request_count = 0
+        self._request_seconds = 0.0
+
+    @contextmanager
+    def borrow_client(self) -> Iterator[Github]:
+        """같은 (API 주소, 토큰)의 공유 풀에서 PyGithub 클라이언트 대여"""
+        if not self.token:
+            raise ValueError("GITHUB_TOKEN이 설정되지 않았습니다.")
+        with get_client_pool(self.token, self.base_url).borrow() as client:
+            yield client
 
     @property
     def is_configured(self) -> bool:
         return bool(self.token)
 
+    @property
+    def provider_key(self) -> str:
+        """동기화 커서 식별용 프로바이더 키 (API 호스트/조직)"""
+        return f"{self.base_url or 'https://api.github.com'}/{self.org_name}"
+
+    def request_stats(self) -> tuple[int, float]:
+        """누적 (API 요청 수, 요청 소요초)"""
+        with self._stats_lock:
+            return self._request_count, self._request_seconds
+
+    def _record_request(self, seconds: float):
+        with self._stats_lock:
+            self._request_count += 1
+            self._request_seconds += seconds
+
+    def iter_batch(
+        self, stream: str, targets: list[tuple[str, Optional[datetime]]]
+    ) -> Iterator[tuple[str, list[dict]]]:
+        """
+        여러 저장소의 issues/commits를 페이지 단위로 조회 → (repo_name, 페이지 결과) 순차 반환
+        REST는 저장소별로 개별 조회 (BATCH_SIZE = 1), 조회 실패 시 예외 전파
+        """
+        iter_pages = self.iter_issue_pages if stream == STREAM_ISSUES else self.iter_commit_pages
+        for repo_name, since in targets:
+            for page in iter_pages(repo_name, since=since):
+                yield repo_name, page
+
+    def iter_org_repo_pages(self) -> Iterator[list[dict]]:
+        """조직의 저장소 목록을 페이지 단위로 조회"""
+        for page in self._iter_pages(
+            f"/users/{self.org_name}/repos", {"per_page": self.page_size}, PRIORITY_LOW
+        ):
+            if page:
+                yield [
+                    {
+                        "name": repo["name"],
+                        "full_name": repo["full_name"],
+                        "url": repo["html_url"],
+                        "updated_at": parse_timestamp(repo.get("updated_at")),
+                    }
+                    for repo in page
+                ]
+
+    def iter_issue_pages(
+        self, repo_name: str, since: datetime = None, state: str = "all"
+    ) -> Iterator[list[dict]]:
+        """저장소의 Issues를 페이지 단위로 조회 (PR 제외, 최근 갱신순)"""
+        params = {
+            "state": state,
+            "sort": "updated",
+            "direction": "desc",
+            "per_page": self.page_size,
+        }
+        if since:
+            params["since"] = _format_since(since)
+
+        for page in self._iter_pages(f"/repos/{self.org_name}/{repo_name}/issues", params):
+            issues = [self.issue_from_json(issue) for issue in page if "pull_request" not in issue]
+            if issues:
+                yield issues
+
+    def iter_commit_pages(self, repo_name: str, since: datetime = None) -> Iterator[list[dict]]:
+        """저장소의 커밋을 페이지 단위로 조회 (개수 제한 없음, 빈 저장소는 결과 없음)"""
+        params = {"per_page": self.page_size}
+        if since:
+            params["since"] = _format_since(since)
+
+        try:
+            for page in self._iter_pages(f"/repos/{self.org_name}/{repo_name}/commits", params):
+                if page:
+                    yield [self._commit_from_json(commit) for commit in page]
+        except GithubException as e:
+            if e.status != 409:
+                raise
+            # Empty repository
+            logger.debug(f"빈 저장소 건너뜀: {repo_name}")
+
     def get_org_repos(self) -> list[dict]:
         """조직의 전체 저장소 목록 조회"""
         try:
-            user = self.client.get_user(self.org_name)
-            repos = user.get_repos()
-            return [
-                {
-                    "name": repo.name,
-                    "full_name": repo.full_name,
-                    "url": repo.html_url,
-                    "updated_at": repo.updated_at,
-                }
-                for repo in repos
-            ]
+            return [repo for page in self.iter_org_repo_pages() for repo in page]
         except GithubException as e:
             logger.error(f"저장소 목록 조회 실패: {e}")
             return []
 
     def get_issues(self, repo_name: str, since: datetime = None, state: str = "all") -> list[dict]:
-        """저장소의 Issues 조회"""
+        """저장소의 Issues 조회 (전체 목록, 대량 조회는 iter_issue_pages 사용)"""
         try:
-            repo = self.client.get_repo(f"{self.org_name}/{repo_name}")
-            kwargs = {"state": state, "sort": "updated", "direction": "desc"}
-            if since:
-                kwargs["since"] = since
-
-            issues = repo.get_issues(**kwargs)
-            result = []
-            for issue in issues:
-                if issue.pull_request:
-                    continue
-
-                labels = [label.name for label in issue.labels]
-                category = self._classify_issue(labels)
-
-                result.append({
-                    "number": issue.number,
-                    "title": _decode_unicode_escapes(issue.title),
-                    "body": _decode_unicode_escapes(issue.body or ""),
-                    "state": issue.state,
-                    "labels": labels,
-                    "category": category,
-                    "url": issue.html_url,
-                    "created_at": issue.created_at,
-                    "updated_at": issue.updated_at,
-                    "closed_at": issue.closed_at,
-                })
-
-            return result
-
+            return [
+                issue for page in self.iter_issue_pages(repo_name, since=since, state=state)
+                for issue in page
+            ]
         except GithubException as e:
             logger.error(f"Issues 조회 실패 ({repo_name}): {e}")
             return []
 
-    def get_recent_commits(self, repo_name: str, since: datetime = None, max_count: int = 50) -> list[dict]:
-        """저장소의 최근 커밋 조회"""
+    def get_recent_commits(
+        self, repo_name: str, since: datetime = None, max_count: Optional[int] = None
+    ) -> list[dict]:
+        """저장소의 최근 커밋 조회 (max_count 미지정 시 since 이후 전체)"""
+        result = []
         try:
-            repo = self.client.get_repo(f"{self.org_name}/{repo_name}")
-            kwargs = {}
-            if since:
-                kwargs["since"] = since
-
-            commits = repo.get_commits(**kwargs)
-            result = []
-            count = 0
-            for commit in commits:
-                if count >= max_count:
-                    break
-                result.append({
-                    "sha": commit.sha[:8],
-                    "message": _decode_unicode_escapes(commit.commit.message),
-                    "author": commit.commit.author.name if commit.commit.author else "unknown",
-                    "date": commit.commit.author.date if commit.commit.author else None,
-                    "url": commit.html_url,
-                })
-                count += 1
-
-            return result
-
+            for page in self.iter_commit_pages(repo_name, since=since):
+                result.extend(page)
+                if max_count is not None and len(result) >= max_count:
+                    return result[:max_count]
         except GithubException as e:
-            if e.status == 409:
-                # Empty repository
-                logger.debug(f"빈 저장소 건너뜀: {repo_name}")
-            else:
-                logger.error(f"커밋 조회 실패 ({repo_name}): {e}")
+            logger.error(f"커밋 조회 실패 ({repo_name}): {e}")
             return []
+        return result
+
+    @staticmethod
+    def _commit_from_json(commit: dict) -> dict:
+        """REST Commit JSON → 내부 커밋 dict"""
+        author = commit["commit"].get("author")
+        return {
+            "sha": commit["sha"][:8],
+            "message": decode_unicode_escapes(commit["commit"]["message"]),
+            "author": author["name"] if author else "unknown",
+            "date": parse_timestamp(author["date"]) if author else None,
+            "url": commit["html_url"],
+        }
+
+    def issue_from_json(self, issue: dict) -> dict:
+        """REST Issue JSON (API 응답/웹훅 payload) → 내부 Issue dict"""
+        labels = [label["name"] for label in issue.get("labels", [])]
+        return {
+            "number": issue["number"],
+            "title": decode_unicode_escapes(issue["title"]),
+            "body": decode_unicode_escapes(issue.get("body") or ""),
+            "state": issue["state"],
+            "labels": labels,
+            "category": self._classify_issue(labels),
+            "url": issue["html_url"],
+            "created_at": parse_timestamp(issue.get("created_at")),
+            "updated_at": parse_timestamp(issue.get("updated_at")),
+            "closed_at": parse_timestamp(issue.get("closed_at")),
+        }
+
+    def _iter_pages(
+        self, url: str, params: dict = None, priority: str = PRIORITY_HIGH
+    ) -> Iterator[list]:
+        """목록 API를 페이지 단위로 조회 (Link rel=next 추적)"""
+        while url:
+            page, url = self._conditional_get(url, params, priority)
+            # next 링크에는 쿼리 파라미터가 이미 포함됨
+            params = None
+            yield page or []
+
+    def _conditional_get(
+        self, url: str, params: dict = None, priority: str = PRIORITY_HIGH
+    ) -> tuple[Any, Optional[str]]:
+        """
+        ETag / Last-Modified 기반 조건부 GET (토큰 예산 대기 + rate limit 재시도)
+        Returns: (JSON 응답, 다음 페이지 URL)
+        """
+        cache = get_response_cache()
+        key = cache.make_key(self.token, url, params)
+        cached = cache.get(key)
+
+        headers = {}
+        if cached:
+            if cached.etag:
+                headers["If-None-Match"] = cached.etag
+            if cached.last_modified:
+                headers["If-Modified-Since"] = cached.last_modified
+
+        budget = get_token_budget(self.token, "core")
+        for attempt in range(self.MAX_RETRIES + 1):
+            budget.acquire(priority)
+            started = time.time()
+            # 요청 동안만 클라이언트 대여 (재시도 대기 중에는 다른 스레드가 사용)
+            with self.borrow_client() as client:
+                requester = client.requester
+                status, response_headers, output = requester.requestJson(
+                    "GET", url, parameters=params, headers=headers
+                )
+            self._record_request(time.time() - started)
+            budget.update(response_headers)
+
+            error = _loads_error(output) if status >= 400 else None
+            if (
+                error is not None
+                and attempt < self.MAX_RETRIES
+                and is_rate_limited(status, response_headers, error.get("message"))
+            ):
+                delay = budget.backoff(attempt, response_headers)
+                logger.warning(f"GitHub rate limit ({status}) → {delay:.1f}초 후 재시도: {url}")
+                time.sleep(delay)
+                continue
+            break
+
+        if status == 304 and cached:
+            cache.mark_not_modified(key)
+            return json.loads(cached.body), cached.next_url
+
+        if error is not None:
+            raise requester.createException(status, response_headers, error)
+        data = json.loads(output) if output else None
+
+        next_url = _parse_next_link(response_headers.get("link"))
+        etag = response_headers.get("etag")
+        last_modified = response_headers.get("last-modified")
+        if etag or last_modified:
+            cache.put(key, url, etag, last_modified, output, next_url)
+
+        return data, next_url
 
     def _classify_issue(self, labels: list[str]) -> ItemCategory:
         """Issue Label 기반 분류"""
@@ -152,8 +417,12 @@ class GitHubService:
 
 
 def create_github_service_from_provider(provider) -> GitHubService:
-    """GitProvider 엔티티로부터 GitHubService 생성"""
-    return GitHubService(
+    """GitProvider 엔티티로부터 GitHubService 생성 (api_mode에 따라 REST/GraphQL)"""
+    service_class = GitHubService
+    if getattr(provider, "api_mode", "rest") == "graphql":
+        from .github_graphql import GitHubGraphQLService
+        service_class = GitHubGraphQLService
+    return service_class(
         token=provider.token,
         org_name=provider.org_name,
         base_url=provider.base_url,
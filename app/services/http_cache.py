@@ -0,0 +1,148 @@
+"""
+GitHub 응답 캐시 서비스 - 조건부 요청(ETag / Last-Modified)
+변경 없는 리소스는 304로 응답되어 rate limit을 소모하지 않음
+"""
+
+import hashlib
+import json
+import logging
+import threading
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Optional
+
+from sqlalchemy import func
+from sqlalchemy.exc import IntegrityError
+
+from ..core.database import SessionLocal
+from ..models.http_cache import HttpCacheEntry
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class CachedResponse:
+    """캐시된 응답 스냅샷 (세션과 분리된 값 객체)"""
+    etag: Optional[str]
+    last_modified: Optional[str]
+    body: str
+    next_url: Optional[str]
+
+
+class ResponseCache:
+    """DB 기반 영속 응답 캐시 (스레드마다 짧은 세션 사용)"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._counters = {"hits": 0, "misses": 0, "not_modified": 0, "stored": 0}
+
+    @staticmethod
+    def make_key(token: str, url: str, params: dict = None) -> str:
+        """토큰 + URL + 정렬된 파라미터 기반 캐시 키"""
+        token_hash = hashlib.sha256((token or "").encode()).hexdigest()
+        raw = json.dumps([token_hash, url, sorted((params or {}).items())], default=str)
+        return hashlib.sha256(raw.encode()).hexdigest()
+
+    def _count(self, name: str):
+        with self._lock:
+            self._counters[name] += 1
+
+    def get(self, key: str) -> Optional[CachedResponse]:
+        """캐시 조회 (hit/miss 집계)"""
+        db = SessionLocal()
+        try:
+            entry = db.query(HttpCacheEntry).filter(HttpCacheEntry.cache_key == key).first()
+            if entry is None:
+                self._count("misses")
+                return None
+            self._count("hits")
+            return CachedResponse(
+                etag=entry.etag,
+                last_modified=entry.last_modified,
+                body=entry.body,
+                next_url=entry.next_url,
+            )
+        finally:
+            db.close()
+
+    def mark_not_modified(self, key: str):
+        """304 응답 기록 및 사용 시각 갱신"""
+        self._count("not_modified")
+        db = SessionLocal()
+        try:
+            db.query(HttpCacheEntry).filter(HttpCacheEntry.cache_key == key).update(
+                {HttpCacheEntry.last_used_at: func.now()}, synchronize_session=False
+            )
+            db.commit()
+        except Exception as e:
+            db.rollback()
+            logger.debug(f"응답 캐시 갱신 실패: {e}")
+        finally:
+            db.close()
+
+    def put(
+        self,
+        key: str,
+        url: str,
+        etag: Optional[str],
+        last_modified: Optional[str],
+        body: str,
+        next_url: Optional[str],
+    ):
+        """응답 저장 (있으면 갱신)"""
+        db = SessionLocal()
+        try:
+            entry = db.query(HttpCacheEntry).filter(HttpCacheEntry.cache_key == key).first()
+            if entry is None:
+                entry = HttpCacheEntry(cache_key=key, url=url[:1000])
+                db.add(entry)
+            entry.etag = etag
+            entry.last_modified = last_modified
+            entry.body = body
+            entry.next_url = next_url[:1000] if next_url else None
+            entry.last_used_at = datetime.now()
+            db.commit()
+            self._count("stored")
+        except IntegrityError:
+            # 동일 키를 다른 스레드가 먼저 저장한 경우
+            db.rollback()
+        except Exception as e:
+            db.rollback()
+            logger.warning(f"응답 캐시 저장 실패 ({url}): {e}")
+        finally:
+            db.close()
+
+    def prune(self, max_age_days: int = 7) -> int:
+        """max_age_days 동안 사용되지 않은 항목 삭제"""
+        cutoff = datetime.now() - timedelta(days=max_age_days)
+        db = SessionLocal()
+        try:
+            deleted = db.query(HttpCacheEntry).filter(
+                HttpCacheEntry.last_used_at < cutoff
+            ).delete(synchronize_session=False)
+            db.commit()
+            logger.info(f"응답 캐시 정리: {deleted}건 삭제")
+            return deleted
+        finally:
+            db.close()
+
+    def stats(self) -> dict:
+        """프로세스 기동 이후 캐시 통계"""
+        with self._lock:
+            counters = dict(self._counters)
+        lookups = counters["hits"] + counters["misses"]
+        counters["not_modified_rate"] = (
+            round(counters["not_modified"] / lookups, 3) if lookups else 0.0
+        )
+        return counters
+
+
+# 싱글톤
+_cache: Optional[ResponseCache] = None
+
+
+def get_response_cache() -> ResponseCache:
+    global _cache
+    if _cache is None:
+        _cache = ResponseCache()
+    return _cache
@@ -0,0 +1,239 @@
+"""
+백그라운드 작업 서비스
+- 수동 트리거(스캔/보고서)를 요청 스레드 밖의 작업 스레드에서 실행하고 진행률을 DB에 기록
+- 같은 종류의 작업이 대기/실행 중이면 새로 만들지 않고 기존 작업을 반환 (동시 트리거 병합)
+- 스케줄 실행도 같은 테이블에 등록 → 수동 실행과 스케줄 실행이 인스턴스 간에도 겹치지 않음
+"""
+
+import time
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+from typing import Callable, Optional
+
+from sqlalchemy import func
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+from ..core.config import now_kst
+from ..core.database import SessionLocal
+from ..models.background_job import BackgroundJob, JobStatus
+
+logger = logging.getLogger(__name__)
+
+JOB_WORK_ITEM_SCAN = "work_item_scan"
+
+# 대기/실행 상태에서 이 시간 이상 진행 기록(heartbeat)이 없는 작업은 중단(프로세스 재시작 등)된 것으로 보고 실패 처리
+STALE_JOB_MINUTES = 30
+
+# 페이지 단위 heartbeat 기록 최소 간격 (초) - 페이지마다 DB 쓰기 방지
+HEARTBEAT_SECONDS = 60
+
+_executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="background-job")
+
+
+def _now() -> datetime:
+    """DB 저장용 KST naive 시각"""
+    return now_kst().replace(tzinfo=None)
+
+
+class JobProgress:
+    """실행 중인 작업의 진행률 기록 (Agent에서 저장소 단위로 호출)"""
+
+    def __init__(self, job_id: int):
+        self.job_id = job_id
+        self.error: Optional[str] = None
+        self._last_beat = time.monotonic()
+
+    def add_total(self, repos: int):
+        """처리할 저장소 수 추가 (Agent마다 호출 → 스캔 작업은 Agent × 저장소)"""
+        self._increment(repos_total=repos)
+
+    def advance(self, items: int = 0, repos: int = 1):
+        """저장소 처리 완료 (처리 항목 수 누적)"""
+        self._increment(repos_done=repos, items_processed=items)
+
+    def heartbeat(self):
+        """처리 중임을 기록 (큰 저장소의 페이지 처리 중 호출, HEARTBEAT_SECONDS 간격으로만 기록)"""
+        if time.monotonic() - self._last_beat >= HEARTBEAT_SECONDS:
+            self._increment()
+
+    def fail(self, message: str):
+        """Agent 내부에서 처리된 오류를 작업 실패로 기록"""
+        self.error = message[:1000]
+
+    def _increment(self, **deltas):
+        """진행률 누적 + heartbeat 갱신"""
+        self._last_beat = time.monotonic()
+        values = {
+            getattr(BackgroundJob, column): getattr(BackgroundJob, column) + delta
+            for column, delta in deltas.items()
+        }
+        values[BackgroundJob.heartbeat_at] = _now()
+        db = SessionLocal()
+        try:
+            db.query(BackgroundJob).filter(BackgroundJob.id == self.job_id).update(
+                values, synchronize_session=False,
+            )
+            db.commit()
+        except Exception as e:
+            db.rollback()
+            logger.warning(f"작업 진행률 기록 실패 (job={self.job_id}): {e}")
+        finally:
+            db.close()
+
+
+def _run_work_item_scan(progress: JobProgress):
+    from ..agents.qa_agent import get_qa_agent
+    from ..agents.tobe_agent import get_tobe_agent
+    get_qa_agent().run(progress=progress)
+    get_tobe_agent().run(progress=progress)
+
+
+def _run_report(report_type: str) -> Callable[[JobProgress], None]:
+    def _run(progress: JobProgress):
+        from ..agents.report_agent import get_report_agent
+        getattr(get_report_agent(), f"send_{report_type}_report")(progress=progress)
+    return _run
+
+
+JOB_RUNNERS: dict[str, Callable[[JobProgress], None]] = {
+    JOB_WORK_ITEM_SCAN: _run_work_item_scan,
+    "daily_report": _run_report("daily"),
+    "weekly_report": _run_report("weekly"),
+    "monthly_report": _run_report("monthly"),
+}
+
+
+def submit(db: Session, job_type: str) -> tuple[BackgroundJob, bool]:
+    """
+    작업 등록 후 백그라운드 실행
+    Returns: (작업, 신규 생성 여부) - 같은 종류가 대기/실행 중이면 기존 작업
+    """
+    if job_type not in JOB_RUNNERS:
+        raise ValueError(f"알 수 없는 작업 종류: {job_type}")
+
+    job, created = _register(db, job_type)
+    if not created:
+        return job, False
+
+    db.refresh(job)
+    _executor.submit(_execute, job.id, job_type)
+    logger.info(f"백그라운드 작업 등록: {job_type} (job={job.id})")
+    return job, True
+
+
+def run_scheduled(job_type: str, runner: Callable[[JobProgress], None] = None) -> Optional[int]:
+    """
+    스케줄 작업을 등록 후 현재 스레드에서 실행 (수동 트리거와 같은 중복 방지 적용)
+    - 같은 종류가 대기/실행 중이면 (다른 인스턴스의 수동 실행 포함) 건너뜀
+    - runner: 작업 종류의 일부만 실행할 때 지정 (예: 스캔 작업 중 QA-Agent만)
+    Returns: 실행한 작업 ID (건너뛰면 None)
+    """
+    db = SessionLocal()
+    try:
+        job, created = _register(db, job_type)
+        job_id = job.id
+    finally:
+        db.close()
+
+    if not created:
+        logger.info(f"스케줄 작업 건너뜀: {job_type} 진행 중 (job={job_id})")
+        return None
+    _execute(job_id, job_type, runner)
+    return job_id
+
+
+def _register(db: Session, job_type: str) -> tuple[BackgroundJob, bool]:
+    """작업 등록 (같은 종류가 대기/실행 중이면 기존 작업). Returns: (작업, 신규 생성 여부)"""
+    _fail_stale_jobs(db)
+
+    active = _get_active(db, job_type)
+    if active:
+        return active, False
+
+    job = BackgroundJob(job_type=job_type, status=JobStatus.QUEUED, created_at=_now())
+    db.add(job)
+    try:
+        db.commit()
+    except IntegrityError:
+        # 다른 요청(인스턴스)이 먼저 등록 → 해당 작업으로 병합
+        db.rollback()
+        active = _get_active(db, job_type)
+        if active:
+            return active, False
+        raise
+    return job, True
+
+
+def get_job(db: Session, job_id: int) -> Optional[BackgroundJob]:
+    return db.get(BackgroundJob, job_id)
+
+
+def list_jobs(db: Session, limit: int = 20) -> list[BackgroundJob]:
+    return db.query(BackgroundJob).order_by(BackgroundJob.created_at.desc(), BackgroundJob.id.desc()).limit(limit).all()
+
+
+def _get_active(db: Session, job_type: str) -> Optional[BackgroundJob]:
+    return (
+        db.query(BackgroundJob)
+        .filter(BackgroundJob.job_type == job_type, BackgroundJob.status.in_(JobStatus.ACTIVE))
+        .first()
+    )
+
+
+def _fail_stale_jobs(db: Session) -> int:
+    """
+    진행 기록 없이 대기/실행 상태로 남은 작업을 실패 처리 (새 작업 등록이 막히지 않도록)
+    - 실행 중 작업은 마지막 heartbeat 기준 → 오래 걸려도 진행 중이면 유지
+    """
+    cutoff = _now() - timedelta(minutes=STALE_JOB_MINUTES)
+    count = (
+        db.query(BackgroundJob)
+        .filter(
+            BackgroundJob.status.in_(JobStatus.ACTIVE),
+            func.coalesce(BackgroundJob.heartbeat_at, BackgroundJob.started_at, BackgroundJob.created_at) < cutoff,
+        )
+        .update(
+            {
+                BackgroundJob.status: JobStatus.FAILED,
+                BackgroundJob.error_message: f"작업 중단 ({STALE_JOB_MINUTES}분 이상 진행 기록 없음)",
+                BackgroundJob.finished_at: _now(),
+            },
+            synchronize_session=False,
+        )
+    )
+    if count:
+        db.commit()
+        logger.warning(f"중단된 백그라운드 작업 {count}건 실패 처리")
+    return count
+
+
+def _execute(job_id: int, job_type: str, runner: Callable[[JobProgress], None] = None):
+    """작업 스레드(스케줄 작업은 스케줄러 스레드)에서 실행"""
+    started_at = _now()
+    _set_status(job_id, JobStatus.RUNNING, started_at=started_at, heartbeat_at=started_at)
+    progress = JobProgress(job_id)
+    try:
+        (runner or JOB_RUNNERS[job_type])(progress)
+    except Exception as e:
+        logger.error(f"백그라운드 작업 오류 ({job_type}, job={job_id}): {e}", exc_info=True)
+        progress.fail(str(e))
+
+    if progress.error:
+        _set_status(job_id, JobStatus.FAILED, finished_at=_now(), error_message=progress.error)
+    else:
+        _set_status(job_id, JobStatus.SUCCEEDED, finished_at=_now())
+    logger.info(f"백그라운드 작업 종료: {job_type} (job={job_id}, {'실패' if progress.error else '완료'})")
+
+
+def _set_status(job_id: int, status: str, **values):
+    db = SessionLocal()
+    try:
+        job = db.get(BackgroundJob, job_id)
+        job.status = status
+        for key, value in values.items():
+            setattr(job, key, value)
+        db.commit()
+    finally:
+        db.close()
@@ -0,0 +1,219 @@
+"""
+보고서 메일 발송 대기열(outbox) 서비스
+- 보고서 × 수신자 단위로 발송 상태를 DB에 기록 (재기동 후에도 재시도 유지)
+- 재시도는 실패한 수신자에게만 발송 (이미 받은 수신자에게 중복 발송하지 않음)
+"""
+
+import random
+import logging
+from datetime import datetime, timedelta
+
+from sqlalchemy import func, or_
+from sqlalchemy.orm import Session
+
+from ..core.config import now_kst
+from ..models.email_outbox import EmailOutbox, OutboxStatus
+from ..models.report import Report, ReportStatus
+from . import config_service
+from .email_service import EmailService, get_email_service, get_email_service_with_config
+
+logger = logging.getLogger(__name__)
+
+# 재시도 간격 (분) - 첫 발송 실패 후 5분, 15분, 30분 뒤 재시도, 이후 FAILED
+RETRY_INTERVALS_MINUTES = [5, 15, 30]
+MAX_ATTEMPTS = len(RETRY_INTERVALS_MINUTES) + 1
+
+# 발송 점유 만료 여유 시간 - 일괄 발송 최악 소요 시간에 더함 (만료된 발송 중 행은 중단으로 보고 복구)
+SENDING_LEASE_MARGIN_MINUTES = 5
+
+
+def _now() -> datetime:
+    """DB 저장용 KST naive 시각"""
+    return now_kst().replace(tzinfo=None)
+
+
+def _retry_delay(attempts: int) -> timedelta:
+    """attempts회 실패 후 다음 시도까지 대기 (jitter 포함)"""
+    minutes = RETRY_INTERVALS_MINUTES[min(attempts - 1, len(RETRY_INTERVALS_MINUTES) - 1)]
+    return timedelta(minutes=minutes, seconds=random.uniform(0, 30))
+
+
+def resolve_email_service(db: Session) -> EmailService:
+    """DB Gmail 설정 → .env fallback"""
+    gmail_config = config_service.get_gmail_config(db)
+    if gmail_config["address"] and gmail_config["password"]:
+        return get_email_service_with_config(gmail_config["address"], gmail_config["password"])
+    return get_email_service()
+
+
+def enqueue(db: Session, report: Report, recipients: list[str]) -> int:
+    """보고서 수신자를 대기열에 등록 (이미 등록된 수신자는 건너뜀). 신규 건수 반환"""
+    existing = {
+        recipient for (recipient,) in db.query(EmailOutbox.recipient).filter(
+            EmailOutbox.report_id == report.id
+        )
+    }
+    now = _now()
+    new_rows = [
+        EmailOutbox(report_id=report.id, recipient=recipient, status=OutboxStatus.PENDING, next_attempt_at=now)
+        for recipient in dict.fromkeys(recipients)
+        if recipient not in existing
+    ]
+    db.add_all(new_rows)
+    db.commit()
+    return len(new_rows)
+
+
+def deliver_report(db: Session, report: Report, email_service: EmailService = None) -> int:
+    """보고서의 발송 시점이 된 수신자에게 발송 후 보고서 상태 갱신. 발송 시도 건수 반환"""
+    now = _now()
+    rows = (
+        db.query(EmailOutbox)
+        .filter(
+            EmailOutbox.report_id == report.id,
+            EmailOutbox.status == OutboxStatus.PENDING,
+            EmailOutbox.next_attempt_at <= now,
+        )
+        .with_for_update(skip_locked=True)
+        .all()
+    )
+    if not rows:
+        return 0
+
+    # 점유 표시 후 커밋 - 만료 시각은 일괄 발송 최악 소요 시간 기준 (발송 중 종료되면 만료 후 복구)
+    email_service = email_service or resolve_email_service(db)
+    lease_until = now + timedelta(
+        seconds=email_service.batch_timeout_seconds(len(rows)), minutes=SENDING_LEASE_MARGIN_MINUTES
+    )
+    for row in rows:
+        row.status = OutboxStatus.SENDING
+        row.claimed_at = now
+        row.next_attempt_at = lease_until
+    if any(row.attempts for row in rows):
+        report.retry_count += 1
+    db.commit()
+    results = email_service.send_batch(
+        recipients=[row.recipient for row in rows],
+        subject=report.subject,
+        html_content=report.content_html,
+    )
+
+    now = _now()
+    by_recipient = {result.recipient: result for result in results}
+    for row in rows:
+        result = by_recipient.get(row.recipient)
+        row.attempts += 1
+        if result and result.success:
+            row.status = OutboxStatus.SENT
+            row.sent_at = now
+            row.last_error = None
+        else:
+            row.last_error = result.error_message if result else "발송 결과 없음"
+            if row.attempts >= MAX_ATTEMPTS:
+                row.status = OutboxStatus.FAILED
+            else:
+                row.status = OutboxStatus.PENDING
+                row.next_attempt_at = now + _retry_delay(row.attempts)
+
+    _update_report_status(db, report)
+    db.commit()
+    return len(rows)
+
+
+def _update_report_status(db: Session, report: Report):
+    """수신자별 발송 상태로 보고서 상태 결정"""
+    rows = db.query(EmailOutbox).filter(EmailOutbox.report_id == report.id).all()
+    sent = [row for row in rows if row.status == OutboxStatus.SENT]
+    pending = [row for row in rows if row.status in (OutboxStatus.PENDING, OutboxStatus.SENDING)]
+    failed = [row for row in rows if row.status == OutboxStatus.FAILED]
+
+    if sent and len(sent) == len(rows):
+        report.status = ReportStatus.SENT
+        report.sent_at = max(row.sent_at for row in sent)
+        report.error_message = None
+        logger.info(f"보고서 발송 완료: {report.subject}")
+        return
+
+    if sent:
+        report.status = ReportStatus.PARTIAL_SENT
+        report.sent_at = report.sent_at or min(row.sent_at for row in sent)
+    else:
+        report.status = ReportStatus.FAILED
+
+    unsent = pending + failed
+    first_error = next((row.last_error for row in unsent if row.last_error), "알 수 없는 오류")
+    report.error_message = (
+        f"미발송 {len(unsent)}/{len(rows)} (재시도 대기 {len(pending)}, 실패 {len(failed)}): "
+        f"{[row.recipient for row in unsent]} - {first_error}"
+    )[:2000]
+
+    if pending:
+        next_at = min(row.next_attempt_at for row in pending)
+        logger.warning(
+            f"보고서 #{report.id} 일부 미발송 {len(unsent)}/{len(rows)} → "
+            f"다음 재시도 {next_at.strftime('%H:%M:%S')}"
+        )
+    else:
+        logger.error(f"보고서 #{report.id} 최대 재시도 횟수({MAX_ATTEMPTS - 1}) 초과. 재시도 중단.")
+
+
+def _recover_stale_sending(db: Session) -> int:
+    """
+    점유 만료 시각이 지난 발송 중 행 복구 (발송 중 프로세스 종료 등)
+    - 중단도 1회 시도로 계산 → 계속 중단되는 행도 MAX_ATTEMPTS 후 FAILED
+    """
+    now = _now()
+    rows = (
+        db.query(EmailOutbox)
+        .filter(
+            EmailOutbox.status == OutboxStatus.SENDING,
+            or_(EmailOutbox.claimed_at.is_(None), EmailOutbox.next_attempt_at < now),
+        )
+        .with_for_update(skip_locked=True)
+        .all()
+    )
+    if not rows:
+        db.commit()
+        return 0
+
+    for row in rows:
+        row.attempts += 1
+        row.last_error = "발송 중단 (점유 만료)"
+        if row.attempts >= MAX_ATTEMPTS:
+            row.status = OutboxStatus.FAILED
+        else:
+            row.status = OutboxStatus.PENDING
+            row.next_attempt_at = now
+    for report in db.query(Report).filter(Report.id.in_({row.report_id for row in rows})):
+        _update_report_status(db, report)
+    db.commit()
+    logger.warning(f"발송 중단 건 복구: {len(rows)}건")
+    return len(rows)
+
+
+def drain(db: Session) -> dict:
+    """발송 시점이 된 대기열 전체 처리 (스케줄러에서 주기적으로 호출)"""
+    recovered = _recover_stale_sending(db)
+
+    report_ids = [
+        report_id for (report_id,) in db.query(EmailOutbox.report_id)
+        .filter(EmailOutbox.status == OutboxStatus.PENDING, EmailOutbox.next_attempt_at <= _now())
+        .distinct()
+    ]
+    if not report_ids:
+        return {"reports": 0, "attempted": 0, "recovered": recovered}
+
+    email_service = resolve_email_service(db)
+    attempted = 0
+    for report in db.query(Report).filter(Report.id.in_(report_ids)).order_by(Report.id):
+        logger.info(f"=== 보고서 #{report.id} 재발송 시작 ===")
+        attempted += deliver_report(db, report, email_service)
+        logger.info(f"=== 보고서 #{report.id} 재발송 결과: {report.status.value} ===")
+
+    return {"reports": len(report_ids), "attempted": attempted, "recovered": recovered}
+
+
+def get_outbox_status(db: Session) -> dict:
+    """상태별 대기열 건수 (진단용)"""
+    rows = db.query(EmailOutbox.status, func.count(EmailOutbox.id)).group_by(EmailOutbox.status).all()
+    return dict(rows)
@@ -0,0 +1,160 @@
+"""
+GitHub 토큰별 Rate Limit 예산 관리
+- X-RateLimit-* 헤더로 남은 예산 추적, 예산이 줄면 reset까지 요청 간격 분산
+- 403/429(secondary rate limit)는 Retry-After 또는 지수 백오프 + jitter
+- 우선순위: 보고서에 필요한 조회(HIGH)는 예약분까지 사용, 나머지(LOW)는 예약분 전에 대기
+"""
+
+import time
+import random
+import hashlib
+import logging
+import threading
+from typing import Optional
+
+from github import RateLimitExceededException
+
+logger = logging.getLogger(__name__)
+
+PRIORITY_HIGH = "high"
+PRIORITY_LOW = "low"
+
+
+class TokenBudget:
+    """토큰 + 리소스(core/graphql) 단위 요청 예산"""
+
+    # 남은 예산이 limit의 이 비율 아래로 떨어지면 reset까지 균등 분산
+    SPREAD_RATIO = 0.2
+    # LOW 우선순위 요청이 남겨두는 예약분 비율
+    LOW_RESERVE_RATIO = 0.1
+    # 대기 상한 (넘으면 RateLimitExceededException)
+    MAX_WAIT_SECONDS = 300
+    # 백오프 기본값 (초)
+    BACKOFF_BASE_SECONDS = 5
+    BACKOFF_MAX_SECONDS = 120
+
+    def __init__(self, key: str, resource: str):
+        self.key = key
+        self.resource = resource
+        self._lock = threading.Lock()
+        self.limit: Optional[int] = None
+        self.remaining: Optional[int] = None
+        self.reset_at: Optional[float] = None
+        self._blocked_until = 0.0
+        self._next_slot = 0.0
+        self.waits = 0
+        self.backoffs = 0
+
+    def acquire(self, priority: str = PRIORITY_HIGH):
+        """요청 전 호출 - 필요한 만큼 대기 후 예산 1 차감"""
+        with self._lock:
+            now = time.time()
+            wait = max(0.0, self._blocked_until - now)
+
+            if self.remaining is not None and self.reset_at and self.reset_at > now:
+                window = self.reset_at - now
+                reserve = int((self.limit or 0) * self.LOW_RESERVE_RATIO) if priority == PRIORITY_LOW else 0
+                usable = self.remaining - reserve
+
+                if usable <= 0:
+                    # 예산 소진 → reset까지 대기
+                    wait = max(wait, window + random.uniform(0, 1))
+                elif self.limit and self.remaining < self.limit * self.SPREAD_RATIO:
+                    # 예산 부족 → 남은 요청을 reset까지 균등 분산
+                    interval = window / usable
+                    slot = max(self._next_slot, now)
+                    wait = max(wait, slot - now)
+                    self._next_slot = slot + interval
+                self.remaining -= 1
+
+            if wait > self.MAX_WAIT_SECONDS:
+                raise RateLimitExceededException(
+                    403, {"message": f"rate limit budget exhausted ({self.resource}), retry in {int(wait)}s"}, None
+                )
+            if wait > 0:
+                self.waits += 1
+
+        if wait > 0:
+            logger.info(f"Rate limit 대기 ({self.resource}, {priority}): {wait:.1f}초")
+            time.sleep(wait)
+
+    def update(self, headers: Optional[dict]):
+        """응답 헤더로 예산 갱신 (헤더 키는 소문자)"""
+        if not headers or "x-ratelimit-remaining" not in headers:
+            return
+        with self._lock:
+            try:
+                self.remaining = int(headers["x-ratelimit-remaining"])
+                self.limit = int(headers.get("x-ratelimit-limit", self.limit or 0)) or self.limit
+                self.reset_at = float(headers.get("x-ratelimit-reset", self.reset_at or 0)) or self.reset_at
+            except (TypeError, ValueError):
+                pass
+
+    def backoff(self, attempt: int, headers: Optional[dict]) -> float:
+        """403/429 응답 후 재시도까지 대기 시간 계산 및 차단 설정"""
+        headers = headers or {}
+        now = time.time()
+        if headers.get("retry-after"):
+            try:
+                delay = float(headers["retry-after"])
+            except ValueError:
+                delay = self.BACKOFF_BASE_SECONDS
+        elif headers.get("x-ratelimit-remaining") == "0" and headers.get("x-ratelimit-reset"):
+            delay = max(0.0, float(headers["x-ratelimit-reset"]) - now)
+        else:
+            delay = min(self.BACKOFF_MAX_SECONDS, self.BACKOFF_BASE_SECONDS * (2 ** attempt))
+        delay += random.uniform(0, delay * 0.1 + 1)
+
+        with self._lock:
+            self._blocked_until = max(self._blocked_until, now + delay)
+            self.backoffs += 1
+        return delay
+
+    def status(self) -> dict:
+        with self._lock:
+            return {
+                "token": self.key[:8],
+                "resource": self.resource,
+                "limit": self.limit,
+                "remaining": self.remaining,
+                "reset_in_seconds": max(0, int(self.reset_at - time.time())) if self.reset_at else None,
+                "blocked_seconds": max(0, int(self._blocked_until - time.time())),
+                "waits": self.waits,
+                "backoffs": self.backoffs,
+            }
+
+
+def is_rate_limited(status: int, headers: Optional[dict], message: str = "") -> bool:
+    """403/429 중 rate limit에 의한 거절인지 판별"""
+    if status == 429:
+        return True
+    if status != 403:
+        return False
+    headers = headers or {}
+    return (
+        "retry-after" in headers
+        or headers.get("x-ratelimit-remaining") == "0"
+        or "rate limit" in (message or "").lower()
+    )
+
+
+_budgets: dict[tuple[str, str], TokenBudget] = {}
+_budgets_lock = threading.Lock()
+
+
+def get_token_budget(token: str, resource: str = "core") -> TokenBudget:
+    """토큰/리소스별 예산 싱글톤"""
+    key = hashlib.sha256((token or "").encode()).hexdigest()
+    with _budgets_lock:
+        budget = _budgets.get((key, resource))
+        if budget is None:
+            budget = TokenBudget(key, resource)
+            _budgets[(key, resource)] = budget
+        return budget
+
+
+def get_rate_limit_status() -> list[dict]:
+    """전체 토큰 예산 상태 (진단용, 토큰은 해시 앞 8자리만)"""
+    with _budgets_lock:
+        budgets = list(_budgets.values())
+    return [budget.status() for budget in budgets]
@@ -4,54 +4,345 @@
 
 import logging
 from collections import defaultdict
-from datetime import datetime, timedelta
+from datetime import date, datetime, time, timedelta
 
+from sqlalchemy import String, case, cast, func, insert, literal, select, tuple_
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
-from jinja2 import Environment, FileSystemLoader, select_autoescape
 
-from ..core.config import settings, now_kst
+from ..core.config import settings, now_kst, KST
 from ..models.issue import WorkItem, ItemCategory, ItemStatus
 from ..models.report import Report, ReportItem, ReportType, ReportStatus
+from ..models.report_aggregate import ReportAggregate, AGGREGATE_ALL, lock_report_aggregates
 from ..services import config_service
+from .template_service import get_template
 
 logger = logging.getLogger(__name__)
 
-# Jinja2 템플릿 환경
-_template_dir = settings.BASE_DIR / "app" / "templates"
-_jinja_env = Environment(
-    loader=FileSystemLoader(str(_template_dir)),
-    autoescape=select_autoescape(["html"]),
+# 템플릿에 필요한 컬럼만 조회 (summary 등 대용량 Text 제외)
+_ITEM_COLUMNS = (
+    WorkItem.id,
+    WorkItem.github_repo,
+    WorkItem.github_issue_number,
+    WorkItem.github_issue_url,
+    WorkItem.category,
+    WorkItem.status,
+    WorkItem.title,
+    WorkItem.labels,
+    WorkItem.created_at,
+    WorkItem.updated_at,
 )
 
+_REPORT_CATEGORIES = (ItemCategory.PLANNED, ItemCategory.REQUIRED, ItemCategory.IN_PROGRESS)
 
-def _group_by_project(items, max_projects, max_items):
-    """항목을 프로젝트별로 그룹핑하고 상위 N건만 추출"""
-    by_repo = defaultdict(list)
-    for item in items:
-        by_repo[item.github_repo].append(item)
 
-    # 건수 내림차순 정렬
-    sorted_repos = sorted(by_repo.items(), key=lambda x: len(x[1]), reverse=True)
+def _period_filter(period_start: datetime, period_end: datetime):
+    return (WorkItem.updated_at >= period_start, WorkItem.updated_at <= period_end)
 
+
+def _resolved_flag():
+    return case((WorkItem.status.in_((ItemStatus.RESOLVED, ItemStatus.CLOSED)), 1), else_=0)
+
+
+def _project_groups_query(period_start: datetime, period_end: datetime, max_projects: int, max_items: int):
+    """
+    분류/프로젝트 그룹핑 + 상위 프로젝트 + 프로젝트별 상위 항목 선택을 단일 쿼리로 구성 (윈도우 함수)
+    - 표시 프로젝트: 상위 max_items건
+    - 그 외 프로젝트: 건수 집계용 대표 1건
+    """
+    partition = (WorkItem.category, WorkItem.github_repo)
+    resolved = _resolved_flag()
+    ranked = (
+        select(
+            *_ITEM_COLUMNS,
+            func.row_number().over(
+                partition_by=partition, order_by=(WorkItem.updated_at.desc(), WorkItem.id.desc())
+            ).label("item_rank"),
+            func.count().over(partition_by=partition).label("repo_count"),
+            func.max(WorkItem.updated_at).over(partition_by=partition).label("repo_last_updated"),
+            func.sum(resolved).over().label("resolved_count"),
+        )
+        .where(*_period_filter(period_start, period_end))
+        .subquery("ranked")
+    )
+    # 건수 내림차순, 동률은 최근 갱신 순 (프로젝트 내 행은 같은 순위)
+    repo_ranked = select(
+        ranked,
+        func.dense_rank().over(
+            partition_by=ranked.c.category,
+            order_by=(
+                ranked.c.repo_count.desc(),
+                ranked.c.repo_last_updated.desc(),
+                ranked.c.github_repo,
+            ),
+        ).label("repo_rank"),
+    ).subquery("repo_ranked")
+
+    return (
+        select(repo_ranked)
+        .where(
+            (repo_ranked.c.item_rank == 1)
+            | ((repo_ranked.c.repo_rank <= max_projects) & (repo_ranked.c.item_rank <= max_items))
+        )
+        .order_by(repo_ranked.c.category, repo_ranked.c.repo_rank, repo_ranked.c.item_rank)
+    )
+
+
+def _group_by_project(rows, max_projects, max_items):
+    """단일 분류의 쿼리 결과(프로젝트 순위/항목 순위 정렬)를 템플릿 그룹 구조로 변환"""
     visible_groups = []
-    for repo, repo_items in sorted_repos[:max_projects]:
-        visible_groups.append({
-            "repo": repo,
-            "total_count": len(repo_items),
-            "top_items": repo_items[:max_items],
-            "remaining_count": max(0, len(repo_items) - max_items),
-        })
-
-    hidden_repos = sorted_repos[max_projects:]
-    hidden_projects_count = len(hidden_repos)
-    hidden_items_count = sum(len(repo_items) for _, repo_items in hidden_repos)
+    hidden_projects_count = 0
+    hidden_items_count = 0
+    total_count = 0
+
+    for row in rows:
+        if row.item_rank == 1:
+            total_count += row.repo_count
+            if row.repo_rank > max_projects:
+                hidden_projects_count += 1
+                hidden_items_count += row.repo_count
+                continue
+            visible_groups.append({
+                "repo": row.github_repo,
+                "total_count": row.repo_count,
+                "top_items": [],
+                "remaining_count": max(0, row.repo_count - max_items),
+            })
+        if row.item_rank <= max_items:
+            visible_groups[-1]["top_items"].append(row)
 
     return {
         "groups": visible_groups,
-        "total_count": len(items),
+        "total_count": total_count,
         "hidden_projects_count": hidden_projects_count,
         "hidden_items_count": hidden_items_count,
-        "project_count": len(sorted_repos),
+        "project_count": len(visible_groups) + hidden_projects_count,
+    }
+
+
+def build_report_groups(
+    db: Session, period_start: datetime, period_end: datetime, max_projects: int, max_items: int
+) -> dict:
+    """
+    보고서 템플릿용 집계
+    Returns: {"total_count", "project_count", "resolved_count", 분류별 그룹}
+    """
+    rows = db.execute(_project_groups_query(period_start, period_end, max_projects, max_items)).all()
+
+    by_category = defaultdict(list)
+    for row in rows:
+        by_category[row.category].append(row)
+
+    grouped = {
+        category: _group_by_project(by_category[category], max_projects, max_items)
+        for category in _REPORT_CATEGORIES
+    }
+    return {
+        "total_count": sum(group["total_count"] for group in grouped.values()),
+        "project_count": len({row.github_repo for row in rows}),
+        "resolved_count": rows[0].resolved_count if rows else 0,
+        **grouped,
+    }
+
+
+def _day_start(day: date) -> datetime:
+    """KST 일자 시작 시각"""
+    return datetime.combine(day, time.min, tzinfo=KST)
+
+
+def _repo_totals_query(start: datetime, end: datetime, include_end: bool):
+    """기간 내 분류/저장소별 (건수, 해결 건수, 최근 갱신)"""
+    end_filter = WorkItem.updated_at <= end if include_end else WorkItem.updated_at < end
+    return (
+        select(
+            WorkItem.category,
+            WorkItem.github_repo,
+            func.count().label("item_count"),
+            func.sum(_resolved_flag()).label("resolved_count"),
+            func.max(WorkItem.updated_at).label("last_updated_at"),
+        )
+        .where(WorkItem.updated_at >= start, end_filter)
+        .group_by(WorkItem.category, WorkItem.github_repo)
+    )
+
+
+def materialize_report_aggregates(db: Session, first_day: date, last_day: date) -> int:
+    """
+    지난 일자의 분류/저장소별 집계를 report_aggregates에 기록 (이미 집계된 일자는 건너뜀)
+    - 오늘 이후 일자는 아직 변할 수 있으므로 집계하지 않음
+    Returns: 새로 집계한 일자 수
+    """
+    last_day = min(last_day, now_kst().date() - timedelta(days=1))
+    if first_day > last_day:
+        return 0
+
+    def _missing_days() -> list[date]:
+        done = {
+            day for (day,) in db.query(ReportAggregate.aggregate_date).filter(
+                ReportAggregate.aggregate_date >= first_day,
+                ReportAggregate.aggregate_date <= last_day,
+                ReportAggregate.category == AGGREGATE_ALL,
+            )
+        }
+        days = (first_day + timedelta(days=offset) for offset in range((last_day - first_day).days + 1))
+        return [day for day in days if day not in done]
+
+    if not _missing_days():
+        return 0
+
+    # 진행 중인 항목 쓰기 커밋 대기 후 다시 확인 (배타 lock은 커밋/롤백 시 해제)
+    lock_report_aggregates(db, exclusive=True)
+    missing = _missing_days()
+    if not missing:
+        db.commit()
+        return 0
+
+    for day in missing:
+        start = _day_start(day)
+        rows = db.execute(_repo_totals_query(start, start + timedelta(days=1), include_end=False)).all()
+        db.add_all(
+            ReportAggregate(
+                aggregate_date=day,
+                category=row.category.value,
+                github_repo=row.github_repo,
+                item_count=row.item_count,
+                resolved_count=row.resolved_count or 0,
+                last_updated_at=row.last_updated_at,
+            )
+            for row in rows
+        )
+        # 일자 합계 행 (항목이 없는 일자도 집계 완료로 표시)
+        db.add(ReportAggregate(
+            aggregate_date=day,
+            category=AGGREGATE_ALL,
+            github_repo="",
+            item_count=sum(row.item_count for row in rows),
+            resolved_count=sum(row.resolved_count or 0 for row in rows),
+            last_updated_at=max((row.last_updated_at for row in rows), default=None),
+        ))
+    try:
+        db.commit()
+    except IntegrityError:
+        # 다른 보고서 생성이 같은 일자를 먼저 집계
+        db.rollback()
+        logger.info(f"보고서 집계 동시 생성 감지 ({first_day}~{last_day}) → 기존 집계 사용")
+        return 0
+
+    logger.info(f"보고서 일별 집계 생성: {len(missing)}일 ({missing[0]}~{missing[-1]})")
+    return len(missing)
+
+
+def build_rollup_report_groups(
+    db: Session, period_start: datetime, period_end: datetime, max_projects: int, max_items: int
+) -> dict:
+    """
+    주간/월간 보고서용 집계 - 지난 일자는 report_aggregates, 오늘(period_end 당일)만 work_items에서 집계
+    - 결과 구조/순위는 build_report_groups와 동일, 상위 항목은 표시할 프로젝트만 조회
+    - 기간 시작이 자정이 아니거나 집계가 준비되지 않으면 build_report_groups로 대체
+    """
+    split = period_end.replace(hour=0, minute=0, second=0, microsecond=0)
+    if period_start != period_start.replace(hour=0, minute=0, second=0, microsecond=0) or split <= period_start:
+        return build_report_groups(db, period_start, period_end, max_projects, max_items)
+
+    first_day = period_start.date()
+    last_day = split.date() - timedelta(days=1)
+    materialize_report_aggregates(db, first_day, last_day)
+
+    day_range = (ReportAggregate.aggregate_date >= first_day, ReportAggregate.aggregate_date <= last_day)
+    days_done = db.query(func.count(ReportAggregate.id)).filter(
+        *day_range, ReportAggregate.category == AGGREGATE_ALL
+    ).scalar()
+    if days_done != (last_day - first_day).days + 1:
+        return build_report_groups(db, period_start, period_end, max_projects, max_items)
+
+    # (분류, 저장소) → [건수, 해결 건수, 최근 갱신]
+    totals: dict[tuple[ItemCategory, str], list] = {}
+
+    def _merge(category, repo, item_count, resolved_count, last_updated_at):
+        entry = totals.setdefault((category, repo), [0, 0, None])
+        entry[0] += item_count
+        entry[1] += resolved_count or 0
+        if last_updated_at is not None and (entry[2] is None or last_updated_at > entry[2]):
+            entry[2] = last_updated_at
+
+    rollups = db.execute(
+        select(
+            ReportAggregate.category,
+            ReportAggregate.github_repo,
+            func.sum(ReportAggregate.item_count),
+            func.sum(ReportAggregate.resolved_count),
+            func.max(ReportAggregate.last_updated_at),
+        )
+        .where(*day_range, ReportAggregate.category != AGGREGATE_ALL)
+        .group_by(ReportAggregate.category, ReportAggregate.github_repo)
+    ).all()
+    for category, repo, item_count, resolved_count, last_updated_at in rollups:
+        _merge(ItemCategory(category), repo, item_count, resolved_count, last_updated_at)
+
+    # 마지막 집계 이후 변경분 (오늘)
+    for row in db.execute(_repo_totals_query(split, period_end, include_end=True)).all():
+        _merge(row.category, row.github_repo, row.item_count, row.resolved_count, row.last_updated_at)
+
+    # 분류별 저장소 순위: 건수 내림차순, 동률은 최근 갱신 순 (_project_groups_query와 동일)
+    ranked_repos = {category: [] for category in _REPORT_CATEGORIES}
+    for (category, repo), (item_count, _, last_updated_at) in totals.items():
+        if category in ranked_repos:
+            ranked_repos[category].append((repo, item_count, last_updated_at))
+    for repos in ranked_repos.values():
+        repos.sort(key=lambda r: r[0])
+        repos.sort(key=lambda r: (r[1], r[2] or datetime.min), reverse=True)
+
+    visible = [
+        (category, repo)
+        for category, repos in ranked_repos.items()
+        for repo, _, _ in repos[:max_projects]
+    ]
+    top_items = defaultdict(list)
+    if visible and max_items > 0:
+        ranked = (
+            select(
+                *_ITEM_COLUMNS,
+                func.row_number().over(
+                    partition_by=(WorkItem.category, WorkItem.github_repo),
+                    order_by=(WorkItem.updated_at.desc(), WorkItem.id.desc()),
+                ).label("item_rank"),
+            )
+            .where(
+                *_period_filter(period_start, period_end),
+                tuple_(WorkItem.category, WorkItem.github_repo).in_(visible),
+            )
+            .subquery("ranked")
+        )
+        for row in db.execute(
+            select(ranked).where(ranked.c.item_rank <= max_items).order_by(ranked.c.item_rank)
+        ).all():
+            top_items[(row.category, row.github_repo)].append(row)
+
+    grouped = {}
+    for category, repos in ranked_repos.items():
+        hidden = repos[max_projects:]
+        groups = [
+            {
+                "repo": repo,
+                "total_count": item_count,
+                "top_items": top_items[(category, repo)],
+                "remaining_count": max(0, item_count - max_items),
+            }
+            for repo, item_count, _ in repos[:max_projects]
+        ]
+        grouped[category] = {
+            "groups": groups,
+            "total_count": sum(r[1] for r in repos),
+            "hidden_projects_count": len(hidden),
+            "hidden_items_count": sum(r[1] for r in hidden),
+            "project_count": len(repos),
+        }
+
+    return {
+        "total_count": sum(group["total_count"] for group in grouped.values()),
+        "project_count": len({repo for (_, repo), entry in totals.items() if entry[0]}),
+        "resolved_count": sum(entry[1] for entry in totals.values()),
+        **grouped,
     }
 
 
@@ -69,6 +360,10 @@ class ReportService:
         )
         period_end = now
 
+        # 지난 일자 집계 선반영 (이번 주/이번 달 보고서가 재사용)
+        week_start = (now - timedelta(days=now.weekday())).date()
+        materialize_report_aggregates(db, min(week_start, now.date().replace(day=1)), now.date())
+
         return self._generate_report(
             db=db,
             report_type=ReportType.DAILY,
@@ -93,6 +388,7 @@ class ReportService:
             period_end=period_end,
             subject=f"[주간업무보고] {period_start.strftime('%m/%d')}~{week_str}",
             template_name="weekly_report.html",
+            use_rollups=True,
         )
 
     def generate_monthly_report(self, db: Session) -> Report:
@@ -108,6 +404,7 @@ class ReportService:
             period_end=period_end,
             subject=f"[월간업무보고] {now.strftime('%Y년 %m월')}",
             template_name="monthly_report.html",
+            use_rollups=True,
         )
 
     def _generate_report(
@@ -118,8 +415,9 @@ class ReportService:
         period_end: datetime,
         subject: str,
         template_name: str,
+        use_rollups: bool = False,
     ) -> Report:
-        """보고서 공통 생성 로직"""
+        """보고서 공통 생성 로직 (use_rollups: 지난 일자는 일별 집계 재사용)"""
         # DB-first, .env fallback
         max_projects = config_service.get_setting_int(db, "max_projects_per_category", settings.max_projects_per_category)
         max_items = config_service.get_setting_int(db, "max_items_per_project", settings.max_items_per_project)
@@ -128,46 +426,23 @@ class ReportService:
         recipients = config_service.get_active_recipients(db, report_type.value.lower())
         recipients_str = ",".join(recipients)
 
-        # 기간 내 업무 항목 조회
-        items = (
-            db.query(WorkItem)
-            .filter(WorkItem.updated_at >= period_start)
-            .filter(WorkItem.updated_at <= period_end)
-            .order_by(WorkItem.category, WorkItem.updated_at.desc())
-            .all()
-        )
-
-        # 분류별 분리
-        planned = [i for i in items if i.category == ItemCategory.PLANNED]
-        required = [i for i in items if i.category == ItemCategory.REQUIRED]
-        in_progress = [i for i in items if i.category == ItemCategory.IN_PROGRESS]
-
-        # 프로젝트별 그룹핑
-        planned_grouped = _group_by_project(planned, max_projects, max_items)
-        required_grouped = _group_by_project(required, max_projects, max_items)
-        progress_grouped = _group_by_project(in_progress, max_projects, max_items)
-
-        # 완료 건수
-        resolved_count = sum(
-            1 for i in items
-            if i.status in (ItemStatus.RESOLVED, ItemStatus.CLOSED)
-        )
-
-        # 전체 프로젝트 수
-        all_repos = set(i.github_repo for i in items)
+        # 분류/프로젝트별 집계 및 상위 항목 선택 (SQL 윈도우 함수)
+        build_groups = build_rollup_report_groups if use_rollups else build_report_groups
+        summary = build_groups(db, period_start, period_end, max_projects, max_items)
+        total_count = summary["total_count"]
 
         # HTML 렌더링
-        template = _jinja_env.get_template(template_name)
+        template = get_template(template_name)
         html_content = template.render(
             report_type=report_type.value,
             period_start=period_start,
             period_end=period_end,
-            total_count=len(items),
-            project_count=len(all_repos),
-            resolved_count=resolved_count,
-            planned=planned_grouped,
-            required=required_grouped,
-            in_progress=progress_grouped,
+            total_count=total_count,
+            project_count=summary["project_count"],
+            resolved_count=summary["resolved_count"],
+            planned=summary[ItemCategory.PLANNED],
+            required=summary[ItemCategory.REQUIRED],
+            in_progress=summary[ItemCategory.IN_PROGRESS],
             generated_at=now_kst(),
         )
 
@@ -182,25 +457,44 @@ class ReportService:
             content_html=html_content,
         )
 
-        # ReportItem 엔티티 생성
-        for item in items:
-            report_item = ReportItem(
-                category=item.category.value,
-                project_name=item.github_repo,
-                title=item.title,
-                detail=item.summary,
-                source_type="issue" if item.github_issue_number else "commit",
-                source_ref=item.github_issue_url or "",
-            )
-            report.items.append(report_item)
-
         db.add(report)
+        db.flush()
+
+        # ReportItem은 INSERT ... SELECT로 DB 내부에서 생성 (항목을 메모리에 올리지 않음)
+        db.execute(
+            insert(ReportItem).from_select(
+                ["report_id", "category", "project_name", "title", "detail", "source_type", "source_ref"],
+                select(
+                    literal(report.id),
+                    func.lower(cast(WorkItem.category, String)),
+                    WorkItem.github_repo,
+                    WorkItem.title,
+                    WorkItem.summary,
+                    case((WorkItem.github_issue_number.isnot(None), "issue"), else_="commit"),
+                    func.coalesce(WorkItem.github_issue_url, ""),
+                )
+                .where(*_period_filter(period_start, period_end))
+                .order_by(WorkItem.category, WorkItem.updated_at.desc()),
+            )
+        )
         db.commit()
         db.refresh(report)
 
-        logger.info(f"보고서 생성 완료: {subject} (항목 {len(items)}건)")
+        logger.info(f"보고서 생성 완료: {subject} (항목 {total_count}건)")
         return report
 
+    def get_item_counts(self, db: Session, report_ids: list[int]) -> dict[int, int]:
+        """보고서별 항목 수 (항목 로딩 없이 집계)"""
+        if not report_ids:
+            return {}
+        rows = (
+            db.query(ReportItem.report_id, func.count(ReportItem.id))
+            .filter(ReportItem.report_id.in_(report_ids))
+            .group_by(ReportItem.report_id)
+            .all()
+        )
+        return dict(rows)
+
     def get_report(self, db: Session, report_id: int) -> Report | None:
         """보고서 조회"""
         return db.query(Report).filter(Report.id == report_id).first()
@@ -0,0 +1,74 @@
+"""
+보고서 템플릿 서비스
+- 컴파일된 템플릿을 바이트코드 캐시(파일)로 보관해 재기동 시 파싱/컴파일 생략
+- 공통 CSS는 환경 생성 시 한 번 읽어 전역 변수로 주입
+"""
+
+import logging
+from pathlib import Path
+from typing import Optional
+
+from jinja2 import Environment, FileSystemBytecodeCache, FileSystemLoader, select_autoescape
+from markupsafe import Markup
+
+from ..core.config import settings
+
+logger = logging.getLogger(__name__)
+
+TEMPLATE_DIR = settings.BASE_DIR / "app" / "templates"
+
+# 기동 시 미리 컴파일할 보고서 템플릿
+REPORT_TEMPLATES = ("daily_report.html", "weekly_report.html", "monthly_report.html")
+
+
+def _cache_dir() -> Path:
+    return Path(settings.template_cache_dir) if settings.template_cache_dir else settings.BASE_DIR / ".jinja_cache"
+
+
+def _create_environment() -> Environment:
+    bytecode_cache = None
+    cache_dir = _cache_dir()
+    try:
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        bytecode_cache = FileSystemBytecodeCache(str(cache_dir))
+    except OSError as e:
+        logger.warning(f"템플릿 캐시 디렉터리 생성 실패 ({cache_dir}): {e} → 메모리 캐시만 사용")
+
+    env = Environment(
+        loader=FileSystemLoader(str(TEMPLATE_DIR)),
+        autoescape=select_autoescape(["html"]),
+        bytecode_cache=bytecode_cache,
+        # 배포 후 템플릿은 변경되지 않으므로 렌더링마다 파일 변경 확인하지 않음
+        auto_reload=False,
+    )
+    env.globals["report_css"] = Markup((TEMPLATE_DIR / "report_base.css").read_text(encoding="utf-8"))
+    return env
+
+
+# 싱글톤
+_env: Optional[Environment] = None
+
+
+def get_template_env() -> Environment:
+    global _env
+    if _env is None:
+        _env = _create_environment()
+    return _env
+
+
+def get_template(name: str):
+    """컴파일된 템플릿 조회 (환경 내 LRU 캐시 + 바이트코드 캐시)"""
+    return get_template_env().get_template(name)
+
+
+def warm_templates() -> int:
+    """보고서 템플릿 사전 컴파일 (앱 기동 / 이미지 빌드 시 호출)"""
+    env = get_template_env()
+    for name in ("_report_base.html", *REPORT_TEMPLATES):
+        env.get_template(name)
+    logger.info(f"보고서 템플릿 사전 컴파일 완료: {len(REPORT_TEMPLATES)}개")
+    return len(REPORT_TEMPLATES)
+
+
+if __name__ == "__main__":
+    warm_templates()
@@ -0,0 +1,184 @@
+"""
+GitHub 웹훅 수신 서비스
+- 서명(X-Hub-Signature-256) 검증 후 이벤트를 대기열에 넣고 즉시 응답, 작업 스레드 1개가 순서대로 반영
+- issues → QA-Agent와 동일한 분류/upsert, push(기본 브랜치) → Tobe-Agent와 동일한 커밋 반영
+- 대기열이 가득 차거나 처리에 실패한 이벤트는 버림 (저빈도 폴링이 보정)
+"""
+
+import hmac
+import queue
+import hashlib
+import logging
+import threading
+from dataclasses import dataclass
+from typing import Optional
+
+from sqlalchemy.orm import Session
+
+from ..core.database import SessionLocal
+from . import config_service
+from .github_service import (
+    GitHubService, get_github_service, create_github_service_from_provider,
+    decode_unicode_escapes, parse_timestamp,
+)
+
+logger = logging.getLogger(__name__)
+
+SUPPORTED_EVENTS = ("issues", "push")
+QUEUE_SIZE = 1000
+
+# issues 이벤트 중 반영 대상 action (deleted/transferred 등은 폴링 보정에 맡김)
+_ISSUE_ACTIONS = {"opened", "edited", "closed", "reopened", "labeled", "unlabeled"}
+
+
+@dataclass
+class WebhookEvent:
+    """수신된 웹훅 이벤트"""
+    event: str
+    delivery_id: str
+    payload: dict
+
+
+_queue: "queue.Queue[WebhookEvent]" = queue.Queue(maxsize=QUEUE_SIZE)
+_worker: Optional[threading.Thread] = None
+_worker_lock = threading.Lock()
+# 처리 현황 카운터 (요청 스레드들과 작업 스레드가 함께 갱신 → _stats_lock으로 보호)
+_stats = {"received": 0, "processed": 0, "ignored": 0, "dropped": 0, "failed": 0}
+_stats_lock = threading.Lock()
+
+
+def _count(name: str):
+    with _stats_lock:
+        _stats[name] += 1
+
+
+def verify_signature(secret: str, body: bytes, signature: Optional[str]) -> bool:
+    """X-Hub-Signature-256 (sha256=<hex>) 검증"""
+    if not secret or not signature or not signature.startswith("sha256="):
+        return False
+    expected = hmac.new(secret.encode(), body, hashlib.sha256).hexdigest()
+    return hmac.compare_digest(expected, signature[len("sha256="):])
+
+
+def enqueue(event: WebhookEvent) -> bool:
+    """이벤트를 대기열에 등록 (대기열이 가득 차면 False)"""
+    _ensure_worker()
+    _count("received")
+    try:
+        _queue.put_nowait(event)
+        return True
+    except queue.Full:
+        _count("dropped")
+        logger.warning(f"웹훅 대기열 가득 참 → 이벤트 버림 ({event.event}, {event.delivery_id})")
+        return False
+
+
+def get_webhook_status() -> dict:
+    """웹훅 처리 현황 (진단용)"""
+    with _stats_lock:
+        stats = dict(_stats)
+    return {**stats, "queued": _queue.qsize()}
+
+
+def _ensure_worker():
+    global _worker
+    with _worker_lock:
+        if _worker is None or not _worker.is_alive():
+            _worker = threading.Thread(target=_run_worker, name="webhook-worker", daemon=True)
+            _worker.start()
+
+
+def _run_worker():
+    while True:
+        event = _queue.get()
+        try:
+            if process(event):
+                _count("processed")
+            else:
+                _count("ignored")
+        except Exception as e:
+            _count("failed")
+            logger.error(f"웹훅 처리 오류 ({event.event}, {event.delivery_id}): {e}", exc_info=True)
+        finally:
+            _queue.task_done()
+
+
+def process(event: WebhookEvent) -> bool:
+    """이벤트 1건을 WorkItem에 반영. 반영 대상이 아니면 False"""
+    from ..agents.qa_agent import get_qa_agent
+    from ..agents.tobe_agent import get_tobe_agent
+
+    payload = event.payload
+    repository = payload.get("repository") or {}
+    repo_name = repository.get("name")
+    owner = (repository.get("owner") or {}).get("login")
+    if not repo_name or not owner:
+        return False
+
+    db = SessionLocal()
+    try:
+        github = _resolve_service(db, owner, repo_name)
+        if github is None:
+            logger.debug(f"웹훅 무시: 추적 대상 아님 ({owner}/{repo_name})")
+            return False
+
+        if event.event == "issues":
+            issue = payload.get("issue")
+            if payload.get("action") not in _ISSUE_ACTIONS or not issue or issue.get("pull_request"):
+                return False
+            new, updated, unchanged = get_qa_agent().apply_issues(
+                db, repo_name, [github.issue_from_json(issue)]
+            )
+            logger.info(
+                f"웹훅 issues 반영: {repo_name}#{issue['number']} "
+                f"(신규 {new}, 갱신 {updated}, 미변경 {unchanged})"
+            )
+            return True
+
+        if event.event == "push":
+            default_branch = repository.get("default_branch")
+            if payload.get("ref") != f"refs/heads/{default_branch}":
+                return False
+            commits = [_commit_from_push(commit) for commit in payload.get("commits") or []]
+            tracked = get_tobe_agent().apply_commits(db, repo_name, commits)
+            logger.info(f"웹훅 push 반영: {repo_name} (커밋 {len(commits)}건, 추적 {tracked}건)")
+            return True
+
+        return False
+    except Exception:
+        db.rollback()
+        raise
+    finally:
+        db.close()
+
+
+def _resolve_service(db: Session, owner: str, repo_name: str) -> Optional[GitHubService]:
+    """이벤트 저장소가 스캔 대상이면 해당 프로바이더의 서비스 반환 (폴링과 동일한 대상 규칙)"""
+    providers = config_service.get_active_git_providers(db)
+    if providers:
+        for provider in providers:
+            if (provider.org_name or "").lower() != owner.lower():
+                continue
+            repos = config_service.get_active_repositories(db, provider.id)
+            if repos and repo_name not in {repo.repo_name for repo in repos}:
+                continue
+            return create_github_service_from_provider(provider)
+        return None
+
+    # .env fallback: 조직 전체
+    github = get_github_service()
+    if github.org_name and github.org_name.lower() == owner.lower():
+        return github
+    return None
+
+
+def _commit_from_push(commit: dict) -> dict:
+    """push 이벤트 커밋 → 내부 커밋 dict"""
+    author = commit.get("author") or {}
+    return {
+        "sha": commit["id"][:8],
+        "message": decode_unicode_escapes(commit.get("message") or ""),
+        "author": author.get("name") or "unknown",
+        "date": parse_timestamp(commit.get("timestamp")),
+        "url": commit.get("url"),
+    }
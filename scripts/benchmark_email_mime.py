@@ -0,0 +1,75 @@
+"""
+보고서 메일 MIME 생성 벤치마크 - 수신자별 생성 vs 1회 직렬화 + To 헤더 추가
+Usage: python -m scripts.benchmark_email_mime [수신자 수]
+       (월간보고 템플릿을 합성 데이터로 렌더링해 사용, 실제 발송 없음)
+"""
+
+import sys
+import os
+import time
+import logging
+import tracemalloc
+from email.header import Header
+from email.mime.multipart import MIMEMultipart
+from email.mime.text import MIMEText
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+logging.basicConfig(level=logging.INFO, format="%(asctime)s [%(levelname)s] %(message)s")
+logger = logging.getLogger(__name__)
+
+DEFAULT_RECIPIENTS = 200
+SENDER = "standup@example.com"
+SUBJECT = "[월간업무보고] 2026년 10월"
+
+
+def _per_recipient(recipients, html_content):
+    """기존 방식: 수신자마다 MIME 객체 생성 + 직렬화"""
+    for recipient in recipients:
+        message = MIMEMultipart("alternative")
+        message["Subject"] = Header(SUBJECT, "utf-8")
+        message["From"] = f"StandUp Report <{SENDER}>"
+        message["To"] = recipient
+        message.attach(MIMEText(html_content, "html", "utf-8"))
+        yield message.as_string()
+
+
+def _prepared_once(recipients, html_content):
+    """현재 방식: 1회 직렬화 후 수신자별 To 헤더만 추가"""
+    from app.services.email_service import EmailService
+
+    prepared = EmailService(SENDER, "unused").prepare_message(SUBJECT, html_content)
+    for recipient in recipients:
+        yield prepared.for_recipient(recipient)
+
+
+def _measure(func, *args):
+    tracemalloc.start()
+    started = time.perf_counter()
+    # 발송 경로와 같이 수신자별 메시지는 발송 후 바로 해제
+    total = sum(len(payload) for payload in func(*args))
+    elapsed = time.perf_counter() - started
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed, peak, total
+
+
+def main():
+    from app.services.template_service import get_template
+    from scripts.benchmark_templates import _synthetic_context
+
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_RECIPIENTS
+    recipients = [f"member{i}@example.com" for i in range(count)]
+    html_content = get_template("monthly_report.html").render(**_synthetic_context(projects=5, items=10))
+
+    logger.info(f"=== MIME 생성 벤치마크: 수신자 {count}명, 본문 {len(html_content.encode()) / 1024:.1f}KB ===")
+    for label, func in (("수신자별 생성", _per_recipient), ("1회 직렬화", _prepared_once)):
+        elapsed, peak, total = _measure(func, recipients, html_content)
+        logger.info(
+            f"  {label:10s} CPU {elapsed * 1000:8.1f}ms | 메모리 최대 {peak / 1024 / 1024:6.2f}MB | "
+            f"전송 데이터 {total / 1024 / 1024:6.2f}MB"
+        )
+
+
+if __name__ == "__main__":
+    main()
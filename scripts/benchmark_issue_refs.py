@@ -0,0 +1,103 @@
+"""
+커밋 메시지 Issue 참조 추출 벤치마크
+- legacy: 패턴 4개를 순서대로 search (첫 번호 1개만, 첫 패턴이 항상 먼저 매치)
+- single: #번호 기준 finditer + 번호 앞 닫기 키워드 확인 (전체 번호 + 닫기/참조 구분)
+Usage: python -m scripts.benchmark_issue_refs [커밋 수]
+"""
+
+import os
+import re
+import sys
+import time
+import random
+import logging
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+logging.basicConfig(level=logging.INFO, format="%(asctime)s [%(levelname)s] %(message)s")
+logger = logging.getLogger(__name__)
+
+DEFAULT_COMMITS = 50000
+
+_LEGACY_PATTERNS = [
+    re.compile(r"#(\d+)"),
+    re.compile(r"[Cc]loses?\s+#(\d+)"),
+    re.compile(r"[Ff]ixes?\s+#(\d+)"),
+    re.compile(r"[Rr]esolves?\s+#(\d+)"),
+]
+
+_SUBJECTS = [
+    "로그인 세션 만료 처리 개선",
+    "Refactor report grouping query",
+    "Update dependencies",
+    "보고서 메일 템플릿 정리",
+    "Handle empty repositories in scan",
+    "Merge pull request",
+]
+_TRAILERS = [
+    "", "", "",
+    "Closes #{a}",
+    "fixes #{a}",
+    "Resolves #{a}, refs #{b}",
+    "(#{a})",
+    "refs #{a} #{b}",
+    "Fixed: #{a}\n\nCloses #{b}",
+    "see org/other#{a}",
+]
+
+
+def legacy_extract(message: str):
+    for pattern in _LEGACY_PATTERNS:
+        match = pattern.search(message)
+        if match:
+            return int(match.group(1))
+    return None
+
+
+def build_corpus(size: int, seed: int = 42) -> list[str]:
+    """실제 커밋 메시지 형태를 흉내 낸 합성 코퍼스 (본문 길이/참조 수 다양)"""
+    rng = random.Random(seed)
+    corpus = []
+    for _ in range(size):
+        subject = rng.choice(_SUBJECTS)
+        body = "\n".join(
+            f"- {rng.choice(_SUBJECTS)} 관련 변경 {rng.randint(1, 99)}" for _ in range(rng.randint(0, 6))
+        )
+        trailer = rng.choice(_TRAILERS).format(a=rng.randint(1, 500), b=rng.randint(1, 500))
+        corpus.append("\n\n".join(part for part in (subject, body, trailer) if part))
+    return corpus
+
+
+def main():
+    from app.agents.tobe_agent import extract_issue_refs
+
+    size = int(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_COMMITS
+    corpus = build_corpus(size)
+
+    started = time.perf_counter()
+    legacy = [legacy_extract(message) for message in corpus]
+    legacy_seconds = time.perf_counter() - started
+
+    started = time.perf_counter()
+    single = [extract_issue_refs(message) for message in corpus]
+    single_seconds = time.perf_counter() - started
+
+    legacy_linked = sum(1 for number in legacy if number)
+    single_linked = sum(1 for refs in single if refs)
+    single_refs = sum(len(refs) for refs in single)
+    closing_refs = sum(1 for refs in single for ref in refs if ref.closes)
+    multi = sum(1 for refs in single if len(refs) > 1)
+
+    logger.info(f"커밋 {size}건")
+    logger.info(
+        f"  legacy: {legacy_seconds * 1000:.1f}ms ({legacy_seconds / size * 1e6:.2f}us/건) "
+        f"| 연결 커밋 {legacy_linked}, 참조 {legacy_linked}, 닫기 구분 불가"
+    )
+    logger.info(
+        f"  single: {single_seconds * 1000:.1f}ms ({single_seconds / size * 1e6:.2f}us/건) "
+        f"| 연결 커밋 {single_linked}, 참조 {single_refs} (다중 참조 커밋 {multi}), 닫기 {closing_refs}"
+    )
+
+
+if __name__ == "__main__":
+    main()
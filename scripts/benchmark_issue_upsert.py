@@ -0,0 +1,138 @@
+"""
+QA-Agent Issue 저장 처리량 벤치마크 (건/초)
+- legacy: Issue마다 SELECT 1회 + 전 필드 재할당 (저장소 단위 커밋)
+- batch: QAAgent.apply_issues (저장소 키 일괄 조회 + 내용 해시 비교 + 배치 커밋)
+Usage: python -m scripts.benchmark_issue_upsert [건수 ...]
+       (기본 2000 10000, SQLite 임시 DB 사용 - PostgreSQL은 왕복 지연만큼 legacy 차이가 더 큼)
+"""
+
+import sys
+import os
+import time
+import logging
+from datetime import datetime, timedelta, timezone
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+os.environ["DATABASE_URL"] = "sqlite:///./benchmark_upsert.db"
+
+logging.basicConfig(level=logging.INFO, format="%(asctime)s [%(levelname)s] %(message)s")
+logger = logging.getLogger(__name__)
+
+DEFAULT_SIZES = [2_000, 10_000]
+REPO_NAME = "benchmark-repo"
+CHANGED_RATIO = 10  # 재스캔 시 10건 중 1건 내용 변경
+
+
+def _issues(size, revision=0):
+    """GitHubService.issue_from_json 형태의 합성 Issue (revision이 바뀐 Issue는 제목 변경)"""
+    from app.models.issue import ItemCategory
+
+    categories = [ItemCategory.PLANNED, ItemCategory.REQUIRED, ItemCategory.IN_PROGRESS]
+    now = datetime.now(timezone.utc)
+    issues = []
+    for number in range(1, size + 1):
+        closed = number % 4 == 0
+        suffix = f" r{revision}" if revision and number % CHANGED_RATIO == 0 else ""
+        issues.append({
+            "number": number,
+            "title": f"Issue {number}{suffix}",
+            "body": "내용 " * 40,
+            "state": "closed" if closed else "open",
+            "labels": ["bug"] if number % 2 else ["enhancement"],
+            "category": categories[number % len(categories)],
+            "url": f"https://github.com/org/{REPO_NAME}/issues/{number}",
+            "created_at": now - timedelta(days=30),
+            "updated_at": now - timedelta(minutes=number),
+            "closed_at": now - timedelta(minutes=number) if closed else None,
+        })
+    return issues
+
+
+def legacy_upsert(db, repo_name, issues):
+    """기존 방식: Issue마다 개별 SELECT 후 전 필드 재할당"""
+    from app.models.issue import WorkItem, ItemStatus
+
+    for issue_data in issues:
+        existing = (
+            db.query(WorkItem)
+            .filter(WorkItem.github_repo == repo_name, WorkItem.github_issue_number == issue_data["number"])
+            .first()
+        )
+        if existing:
+            existing.title = issue_data["title"]
+            existing.summary = issue_data["body"][:1000] if issue_data["body"] else None
+            existing.labels = ",".join(issue_data["labels"])
+            existing.category = issue_data["category"]
+            if issue_data["state"] == "closed" and existing.status != ItemStatus.CLOSED:
+                existing.status = ItemStatus.CLOSED
+                existing.resolved_at = issue_data["closed_at"]
+        else:
+            closed = issue_data["state"] == "closed"
+            db.add(WorkItem(
+                github_repo=repo_name,
+                github_issue_number=issue_data["number"],
+                github_issue_url=issue_data["url"],
+                category=issue_data["category"],
+                status=ItemStatus.CLOSED if closed else ItemStatus.OPEN,
+                title=issue_data["title"],
+                summary=issue_data["body"][:1000] if issue_data["body"] else None,
+                labels=",".join(issue_data["labels"]),
+                resolved_at=issue_data["closed_at"] if closed else None,
+            ))
+    db.commit()
+
+
+def _reset(db):
+    from app.models.issue import WorkItem
+    from app.models.work_item_event import WorkItemEvent
+
+    db.query(WorkItemEvent).delete()
+    db.query(WorkItem).delete()
+    db.commit()
+
+
+def _rate(func, db, issues):
+    started = time.perf_counter()
+    func(db, REPO_NAME, issues)
+    elapsed = time.perf_counter() - started
+    return len(issues) / elapsed
+
+
+def main():
+    from app.core.database import engine, Base, SessionLocal
+    from app.agents.qa_agent import get_qa_agent
+    import app.models  # noqa: F401
+
+    sizes = [int(arg) for arg in sys.argv[1:]] or DEFAULT_SIZES
+    Base.metadata.create_all(bind=engine)
+    batch_upsert = get_qa_agent().apply_issues
+    logging.getLogger("app.agents.qa_agent").setLevel(logging.WARNING)
+
+    logger.info("=== QA-Agent Issue 저장 처리량 벤치마크 (건/초) ===")
+    db = SessionLocal()
+    try:
+        for size in sizes:
+            initial, rescan = _issues(size), _issues(size, revision=1)
+            results = {}
+            for name, func in (("legacy", legacy_upsert), ("batch", batch_upsert)):
+                _reset(db)
+                results[name] = (
+                    _rate(func, db, initial),            # 초기 스캔 (전부 신규)
+                    _rate(func, db, rescan),             # 재스캔 (10% 변경)
+                    _rate(func, db, rescan),             # 재스캔 (변경 없음)
+                )
+            for name, (first, changed, unchanged) in results.items():
+                logger.info(
+                    f"  {size:>6,}건 {name:>6}: 초기 {first:9,.0f}건/초 | "
+                    f"재스캔(10% 변경) {changed:9,.0f}건/초 | 재스캔(변경 없음) {unchanged:9,.0f}건/초"
+                )
+    finally:
+        db.close()
+        engine.dispose()
+        if os.path.exists("./benchmark_upsert.db"):
+            os.remove("./benchmark_upsert.db")
+
+
+if __name__ == "__main__":
+    main()
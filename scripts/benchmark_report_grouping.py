@@ -0,0 +1,167 @@
+"""
+보고서 그룹핑 벤치마크 - Python 그룹핑 vs SQL 윈도우 함수
+Usage: python -m scripts.benchmark_report_grouping [건수 ...]
+       (기본 1000 10000 100000, SQLite 임시 DB 사용)
+"""
+
+import sys
+import os
+import time
+import logging
+from collections import defaultdict
+from datetime import datetime, timedelta
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+os.environ["DATABASE_URL"] = "sqlite:///./benchmark_report.db"
+
+logging.basicConfig(level=logging.INFO, format="%(asctime)s [%(levelname)s] %(message)s")
+logger = logging.getLogger(__name__)
+
+DEFAULT_SIZES = [1_000, 10_000, 100_000]
+REPO_COUNT = 60
+MAX_PROJECTS = 10
+MAX_ITEMS = 5
+ROUNDS = 3
+
+
+def _python_grouping(db, period_start, period_end, max_projects, max_items):
+    """기존 방식: 기간 내 전체 항목 로딩 후 Python에서 그룹핑"""
+    from app.models.issue import WorkItem, ItemCategory, ItemStatus
+
+    items = (
+        db.query(WorkItem)
+        .filter(WorkItem.updated_at >= period_start)
+        .filter(WorkItem.updated_at <= period_end)
+        .order_by(WorkItem.category, WorkItem.updated_at.desc())
+        .all()
+    )
+
+    def group(category_items):
+        by_repo = defaultdict(list)
+        for item in category_items:
+            by_repo[item.github_repo].append(item)
+        sorted_repos = sorted(by_repo.items(), key=lambda x: len(x[1]), reverse=True)
+        hidden = sorted_repos[max_projects:]
+        return {
+            "groups": [
+                {
+                    "repo": repo,
+                    "total_count": len(repo_items),
+                    "top_items": repo_items[:max_items],
+                    "remaining_count": max(0, len(repo_items) - max_items),
+                }
+                for repo, repo_items in sorted_repos[:max_projects]
+            ],
+            "total_count": len(category_items),
+            "hidden_projects_count": len(hidden),
+            "hidden_items_count": sum(len(repo_items) for _, repo_items in hidden),
+            "project_count": len(sorted_repos),
+        }
+
+    result = {
+        category: group([i for i in items if i.category == category])
+        for category in (ItemCategory.PLANNED, ItemCategory.REQUIRED, ItemCategory.IN_PROGRESS)
+    }
+    result["total_count"] = len(items)
+    result["project_count"] = len({i.github_repo for i in items})
+    result["resolved_count"] = sum(
+        1 for i in items if i.status in (ItemStatus.RESOLVED, ItemStatus.CLOSED)
+    )
+    return result
+
+
+def _summary_key(result):
+    """두 구현 결과 비교용 (건수/프로젝트 목록)"""
+    from app.models.issue import ItemCategory
+
+    key = [result["total_count"], result["project_count"], result["resolved_count"]]
+    for category in (ItemCategory.PLANNED, ItemCategory.REQUIRED, ItemCategory.IN_PROGRESS):
+        group = result[category]
+        key.append((
+            group["total_count"], group["hidden_projects_count"], group["hidden_items_count"],
+            sorted((g["repo"], g["total_count"], len(g["top_items"])) for g in group["groups"]),
+        ))
+    return key
+
+
+def _seed(db, size):
+    from app.models.issue import WorkItem, ItemCategory, ItemStatus
+
+    db.query(WorkItem).delete()
+    now = datetime.now()
+    categories = list(ItemCategory)
+    statuses = list(ItemStatus)
+    batch = []
+    for i in range(size):
+        batch.append({
+            "github_repo": f"repo-{(i * 7919) % REPO_COUNT}",
+            "github_issue_number": i,
+            "category": categories[i % len(categories)],
+            "status": statuses[i % len(statuses)],
+            "title": f"업무 항목 {i}",
+            "summary": "내용 " * 50,
+            "labels": "bug,enhancement",
+            "updated_at": now - timedelta(seconds=i * 13),
+        })
+        if len(batch) >= 10_000:
+            db.bulk_insert_mappings(WorkItem, batch)
+            batch = []
+    if batch:
+        db.bulk_insert_mappings(WorkItem, batch)
+    db.commit()
+
+
+def _measure(func, *args):
+    best = None
+    result = None
+    for _ in range(ROUNDS):
+        started = time.perf_counter()
+        result = func(*args)
+        elapsed = time.perf_counter() - started
+        best = elapsed if best is None else min(best, elapsed)
+    return best, result
+
+
+def main():
+    from sqlalchemy import text
+    from app.core.database import engine, Base, SessionLocal
+    from app.services.report_service import build_report_groups
+    import app.models  # noqa: F401
+
+    sizes = [int(arg) for arg in sys.argv[1:]] or DEFAULT_SIZES
+    Base.metadata.create_all(bind=engine)
+
+    logger.info("=== 보고서 그룹핑 벤치마크 ===")
+    logger.info(f"저장소 {REPO_COUNT}개, 상위 프로젝트 {MAX_PROJECTS}, 프로젝트당 {MAX_ITEMS}건, {ROUNDS}회 중 최소")
+    db = SessionLocal()
+    try:
+        for size in sizes:
+            _seed(db, size)
+            db.execute(text("ANALYZE"))
+            period_end = datetime.now()
+            period_start = period_end - timedelta(days=365)
+
+            python_seconds, python_result = _measure(
+                _python_grouping, db, period_start, period_end, MAX_PROJECTS, MAX_ITEMS
+            )
+            db.expunge_all()
+            sql_seconds, sql_result = _measure(
+                build_report_groups, db, period_start, period_end, MAX_PROJECTS, MAX_ITEMS
+            )
+
+            match = _summary_key(python_result) == _summary_key(sql_result)
+            logger.info(
+                f"  {size:>7,}건: Python {python_seconds * 1000:8.1f}ms | "
+                f"SQL {sql_seconds * 1000:8.1f}ms | "
+                f"x{python_seconds / sql_seconds:.1f} | 결과 일치: {'OK' if match else 'MISMATCH'}"
+            )
+    finally:
+        db.close()
+        engine.dispose()
+        if os.path.exists("./benchmark_report.db"):
+            os.remove("./benchmark_report.db")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,172 @@
+"""
+보고서 일별 집계(rollup) 벤치마크 - 월간 기간 전체 윈도우 집계 vs 지난 일자 집계 재사용
+Usage: python -m scripts.benchmark_report_rollups [건수 ...]
+       (기본 10000 100000, 최근 30일 분포, SQLite 임시 DB 사용)
+"""
+
+import sys
+import os
+import time
+import logging
+from datetime import timedelta
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+os.environ["DATABASE_URL"] = "sqlite:///./benchmark_rollup.db"
+
+logging.basicConfig(level=logging.INFO, format="%(asctime)s [%(levelname)s] %(message)s")
+logger = logging.getLogger(__name__)
+
+DEFAULT_SIZES = [10_000, 100_000]
+REPO_COUNT = 60
+PERIOD_DAYS = 30
+MAX_PROJECTS = 10
+MAX_ITEMS = 5
+ROUNDS = 3
+
+
+def _summary_key(result):
+    """두 구현 결과 비교용 (건수, 프로젝트 순서, 상위 항목 ID)"""
+    from app.models.issue import ItemCategory
+
+    key = [result["total_count"], result["project_count"], result["resolved_count"]]
+    for category in (ItemCategory.PLANNED, ItemCategory.REQUIRED, ItemCategory.IN_PROGRESS):
+        group = result[category]
+        key.append((
+            group["total_count"], group["project_count"],
+            group["hidden_projects_count"], group["hidden_items_count"],
+            [
+                (g["repo"], g["total_count"], g["remaining_count"], [item.id for item in g["top_items"]])
+                for g in group["groups"]
+            ],
+        ))
+    return key
+
+
+def _seed(db, size, now):
+    from app.models.issue import WorkItem, ItemCategory, ItemStatus
+    from app.models.report_aggregate import ReportAggregate
+
+    db.query(ReportAggregate).delete()
+    db.query(WorkItem).delete()
+    categories = list(ItemCategory)
+    statuses = list(ItemStatus)
+    spacing = PERIOD_DAYS * 86400 / size
+    batch = []
+    for i in range(size):
+        batch.append({
+            "github_repo": f"repo-{(i * 7919) % REPO_COUNT}",
+            "github_issue_number": i,
+            "category": categories[i % len(categories)],
+            "status": statuses[i % len(statuses)],
+            "title": f"업무 항목 {i}",
+            "summary": "내용 " * 50,
+            "labels": "bug,enhancement",
+            "updated_at": now - timedelta(seconds=int(i * spacing)),
+        })
+        if len(batch) >= 10_000:
+            db.bulk_insert_mappings(WorkItem, batch)
+            batch = []
+    if batch:
+        db.bulk_insert_mappings(WorkItem, batch)
+    db.commit()
+
+
+def _update_after_materialize(db, size):
+    """집계 완료 후 일부 항목 수정 (updated_at 이동) → 무효화/재집계 검증용. 수정 건수 반환"""
+    from app.models.issue import WorkItem, ItemStatus
+
+    step = max(size // 100, 1)
+    items = db.query(WorkItem).filter(WorkItem.github_issue_number % step == 0).all()
+    for item in items:
+        item.apply_changes({
+            "status": ItemStatus.CLOSED if item.status != ItemStatus.CLOSED else ItemStatus.OPEN,
+            "title": f"{item.title} (수정)",
+        })
+    db.commit()
+    return len(items)
+
+
+def _measure(func, *args):
+    best = None
+    result = None
+    for _ in range(ROUNDS):
+        started = time.perf_counter()
+        result = func(*args)
+        elapsed = time.perf_counter() - started
+        best = elapsed if best is None else min(best, elapsed)
+    return best, result
+
+
+def main():
+    from sqlalchemy import text
+    from app.core.config import now_kst
+    from app.core.database import engine, Base, SessionLocal
+    from app.services.report_service import (
+        build_report_groups, build_rollup_report_groups, materialize_report_aggregates,
+    )
+    import app.models  # noqa: F401
+
+    sizes = [int(arg) for arg in sys.argv[1:]] or DEFAULT_SIZES
+    Base.metadata.create_all(bind=engine)
+
+    logger.info("=== 보고서 일별 집계 벤치마크 ===")
+    logger.info(
+        f"저장소 {REPO_COUNT}개, 기간 {PERIOD_DAYS}일, 상위 프로젝트 {MAX_PROJECTS}, "
+        f"프로젝트당 {MAX_ITEMS}건, {ROUNDS}회 중 최소"
+    )
+    db = SessionLocal()
+    try:
+        for size in sizes:
+            period_end = now_kst()
+            period_start = (period_end - timedelta(days=PERIOD_DAYS)).replace(
+                hour=0, minute=0, second=0, microsecond=0
+            )
+            _seed(db, size, period_end.replace(tzinfo=None))
+            db.execute(text("ANALYZE"))
+
+            live_seconds, live_result = _measure(
+                build_report_groups, db, period_start, period_end, MAX_PROJECTS, MAX_ITEMS
+            )
+
+            # 일일보고 시점의 선반영 비용 (지난 일자 1회 집계)
+            started = time.perf_counter()
+            days = materialize_report_aggregates(db, period_start.date(), period_end.date())
+            materialize_seconds = time.perf_counter() - started
+
+            rollup_seconds, rollup_result = _measure(
+                build_rollup_report_groups, db, period_start, period_end, MAX_PROJECTS, MAX_ITEMS
+            )
+
+            match = _summary_key(live_result) == _summary_key(rollup_result)
+            logger.info(
+                f"  {size:>7,}건: 전체 집계 {live_seconds * 1000:8.1f}ms | "
+                f"집계 재사용 {rollup_seconds * 1000:8.1f}ms | x{live_seconds / rollup_seconds:.1f} | "
+                f"선반영 {days}일 {materialize_seconds * 1000:.1f}ms | "
+                f"결과 일치: {'OK' if match else 'MISMATCH'}"
+            )
+
+            # 집계된 일자의 항목 수정 후 재집계 결과가 실시간 집계와 같은지 확인
+            updated = _update_after_materialize(db, size)
+            days = materialize_report_aggregates(db, period_start.date(), period_end.date())
+            live_result = build_report_groups(db, period_start, period_end, MAX_PROJECTS, MAX_ITEMS)
+            rollup_result = build_rollup_report_groups(db, period_start, period_end, MAX_PROJECTS, MAX_ITEMS)
+            match = _summary_key(live_result) == _summary_key(rollup_result)
+            logger.info(
+                f"  {size:>7,}건: 집계 후 {updated}건 수정 → 재집계 {days}일 | "
+                f"결과 일치: {'OK' if match else 'MISMATCH'}"
+            )
+
+            # 오늘로 옮겨진 항목 재수정 → 지난 일자 집계는 그대로 (재집계 0일이어야 함)
+            updated = _update_after_materialize(db, size)
+            days = materialize_report_aggregates(db, period_start.date(), period_end.date())
+            logger.info(f"  {size:>7,}건: 오늘 항목 {updated}건 재수정 → 재집계 {days}일")
+    finally:
+        db.close()
+        engine.dispose()
+        if os.path.exists("./benchmark_rollup.db"):
+            os.remove("./benchmark_rollup.db")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,122 @@
+"""
+보고서 템플릿 렌더링 마이크로 벤치마크
+- cold: 캐시 없는 새 환경에서 로드(파싱/컴파일) + 렌더링
+- bytecode: 새 환경 + 바이트코드 캐시에서 로드 + 렌더링 (컨테이너 재기동 상황)
+- warm: 로드된 템플릿 렌더링만
+Usage: python -m scripts.benchmark_templates [반복 횟수]
+"""
+
+import sys
+import os
+import time
+import tempfile
+import logging
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+logging.basicConfig(level=logging.INFO, format="%(asctime)s [%(levelname)s] %(message)s")
+logger = logging.getLogger(__name__)
+
+DEFAULT_ROUNDS = 200
+
+
+def _synthetic_context(projects: int = 5, items: int = 3) -> dict:
+    """템플릿 구조에 맞춘 합성 데이터"""
+    now = datetime.now()
+
+    def item(i):
+        return SimpleNamespace(
+            title=f"업무 항목 {i} - 로그인 세션 만료 처리 개선",
+            github_issue_url=f"https://github.com/org/repo/issues/{i}" if i % 3 else None,
+            labels="bug,backend" if i % 2 else None,
+            created_at=now - timedelta(days=i % 20),
+            updated_at=now - timedelta(hours=i),
+        )
+
+    def section(offset):
+        return {
+            "groups": [
+                {
+                    "repo": f"project-{offset + p}",
+                    "total_count": items + 4,
+                    "top_items": [item(offset * 100 + p * 10 + i) for i in range(items)],
+                    "remaining_count": 4,
+                }
+                for p in range(projects)
+            ],
+            "total_count": projects * (items + 4) + 12,
+            "hidden_projects_count": 2,
+            "hidden_items_count": 12,
+            "project_count": projects + 2,
+        }
+
+    return {
+        "report_type": "daily",
+        "period_start": now - timedelta(days=7),
+        "period_end": now,
+        "total_count": 120,
+        "project_count": 14,
+        "resolved_count": 37,
+        "planned": section(0),
+        "required": section(1),
+        "in_progress": section(2),
+        "generated_at": now,
+    }
+
+
+def _new_env(cache_dir: str = None):
+    from app.core.config import settings
+    from app.services import template_service
+
+    settings.template_cache_dir = cache_dir or ""
+    template_service._env = None
+    if cache_dir is None:
+        # 바이트코드 캐시 없이 생성
+        env = template_service._create_environment()
+        env.bytecode_cache = None
+        return env
+    return template_service.get_template_env()
+
+
+def main():
+    from app.services.template_service import REPORT_TEMPLATES
+
+    rounds = int(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_ROUNDS
+    context = _synthetic_context()
+
+    logger.info(f"=== 보고서 템플릿 벤치마크 ({rounds}회 평균) ===")
+    with tempfile.TemporaryDirectory() as cache_dir:
+        # 바이트코드 캐시 채우기
+        _new_env(cache_dir)
+        from app.services.template_service import warm_templates
+        warm_templates()
+
+        for name in REPORT_TEMPLATES:
+            cold = bytecode = warm = 0.0
+            for _ in range(rounds):
+                env = _new_env(None)
+                started = time.perf_counter()
+                env.get_template(name).render(**context)
+                cold += time.perf_counter() - started
+
+                env = _new_env(cache_dir)
+                started = time.perf_counter()
+                template = env.get_template(name)
+                template.render(**context)
+                bytecode += time.perf_counter() - started
+
+                started = time.perf_counter()
+                template.render(**context)
+                warm += time.perf_counter() - started
+
+            logger.info(
+                f"  {name:22s} cold {cold / rounds * 1000:7.2f}ms | "
+                f"bytecode {bytecode / rounds * 1000:7.2f}ms | "
+                f"warm {warm / rounds * 1000:7.2f}ms"
+            )
+
+
+if __name__ == "__main__":
+    main()
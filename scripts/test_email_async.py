@@ -0,0 +1,102 @@
+"""
+비동기 일괄 발송 테스트 스크립트 (로컬 aiosmtpd 서버 사용, 실제 메일 발송 없음)
+Usage: pip install aiosmtpd && python -m scripts.test_email_async
+"""
+
+import sys
+import os
+import asyncio
+import logging
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+logging.basicConfig(level=logging.INFO, format="%(asctime)s [%(levelname)s] %(message)s")
+logger = logging.getLogger(__name__)
+logging.getLogger("mail.log").setLevel(logging.WARNING)
+
+HOST = "127.0.0.1"
+PORT = 8025
+SLOW_SECONDS = 0.3
+
+
+class _Handler:
+    """수신 메시지 기록, reject@ 수신자는 거부, slow@ 수신자는 지연 응답"""
+
+    def __init__(self):
+        self.delivered = []
+
+    async def handle_RCPT(self, server, session, envelope, address, rcpt_options):
+        if address.startswith("reject@"):
+            return "550 mailbox unavailable"
+        envelope.rcpt_tos.append(address)
+        return "250 OK"
+
+    async def handle_DATA(self, server, session, envelope):
+        if any(r.startswith("hang@") for r in envelope.rcpt_tos):
+            await asyncio.sleep(5)
+        await asyncio.sleep(SLOW_SECONDS)
+        self.delivered.extend(envelope.rcpt_tos)
+        return "250 Message accepted"
+
+
+def _authenticator(server, session, envelope, mechanism, auth_data):
+    from aiosmtpd.smtp import AuthResult
+    return AuthResult(success=auth_data.password == b"secret", handled=False)
+
+
+def main():
+    from aiosmtpd.controller import Controller
+    from app.services.email_service import EmailService
+
+    handler = _Handler()
+    controller = Controller(
+        handler, hostname=HOST, port=PORT,
+        authenticator=_authenticator, auth_require_tls=False,
+    )
+    controller.start()
+    failed = False
+    try:
+        service = EmailService(
+            sender_email="standup@example.com", app_password="secret",
+            smtp_host=HOST, smtp_port=PORT, use_tls=False,
+        )
+        service.RECIPIENT_TIMEOUT = 2
+
+        recipients = [f"user{i}@example.com" for i in range(6)] + ["reject@example.com", "hang@example.com"]
+        started = time.time()
+        results = service.send_batch(recipients, "[StandUp 테스트] 비동기 발송", "<p>테스트</p>")
+        elapsed = time.time() - started
+
+        for result in results:
+            logger.info(f"  {result.recipient:22s} {'OK' if result.success else 'FAIL'} {result.error_message or ''}")
+        logger.info(f"발송 {elapsed:.2f}초 (직렬 예상 {SLOW_SECONDS * 6:.1f}초 이상 + 타임아웃)")
+
+        expected = {f"user{i}@example.com" for i in range(6)}
+        succeeded = {r.recipient for r in results if r.success}
+        if [r.recipient for r in results] != recipients:
+            failed = True
+            logger.error("결과 순서가 수신자 순서와 다름")
+        if succeeded != expected or set(handler.delivered) != expected:
+            failed = True
+            logger.error(f"발송 성공 수신자 불일치: {sorted(succeeded)}")
+
+        wrong_password = EmailService(
+            sender_email="standup@example.com", app_password="wrong",
+            smtp_host=HOST, smtp_port=PORT, use_tls=False,
+        )
+        auth_results = wrong_password.send_batch(["user@example.com"], "auth", "<p>x</p>")
+        logger.info(f"  인증 실패 케이스: {auth_results[0].error_message}")
+        if auth_results[0].success:
+            failed = True
+    finally:
+        controller.stop()
+
+    if failed:
+        logger.error("=== 비동기 발송 테스트 실패 ===")
+        sys.exit(1)
+    logger.info("=== 비동기 발송 테스트 완료 ===")
+
+
+if __name__ == "__main__":
+    main()
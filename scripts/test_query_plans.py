@@ -0,0 +1,181 @@
+"""
+주요 조회 쿼리 실행 계획(EXPLAIN) 점검 스크립트
+시드 데이터를 넣고 보고서/목록 쿼리가 인덱스를 사용하는지 확인
+Usage: python -m scripts.test_query_plans
+       (DATABASE_URL이 PostgreSQL이면 해당 DB에서 EXPLAIN, 기본은 SQLite)
+"""
+
+import sys
+import os
+import logging
+from datetime import datetime, timedelta
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+os.environ.setdefault("DATABASE_URL", "sqlite:///./test_query_plans.db")
+
+logging.basicConfig(level=logging.INFO, format="%(asctime)s [%(levelname)s] %(message)s")
+logger = logging.getLogger(__name__)
+
+SEED_ITEMS = 5000
+SEED_LOGS = 2000
+SEED_REPORTS = 30
+
+
+def _seed(db):
+    from app.models import WorkItem, AgentLog, Report, ReportItem
+    from app.models.issue import ItemCategory
+    from app.models.report import ReportType
+
+    now = datetime.now()
+    categories = list(ItemCategory)
+    db.bulk_insert_mappings(WorkItem, [
+        {
+            "github_repo": f"repo-{i % 40}",
+            "github_issue_number": i,
+            "category": categories[i % len(categories)],
+            "title": f"item {i}",
+            "updated_at": now - timedelta(minutes=i * 7),
+        }
+        for i in range(SEED_ITEMS)
+    ])
+    db.bulk_insert_mappings(AgentLog, [
+        {
+            "agent_name": ("QA-Agent", "Tobe-Agent", "Report-Agent")[i % 3],
+            "action": "scan",
+            "status": "success",
+            "executed_at": now - timedelta(minutes=i * 30),
+        }
+        for i in range(SEED_LOGS)
+    ])
+    reports = [
+        Report(
+            report_type=ReportType.DAILY, period_start=now, period_end=now,
+            subject=f"plan check {i}", recipients="",
+        )
+        for i in range(SEED_REPORTS)
+    ]
+    db.add_all(reports)
+    db.flush()
+    db.bulk_insert_mappings(ReportItem, [
+        {"report_id": report.id, "category": "planned", "project_name": "p", "title": "t", "source_type": "issue"}
+        for report in reports
+        for _ in range(50)
+    ])
+    db.commit()
+
+
+def _hot_queries(db):
+    """(이름, 쿼리, 사용 기대 인덱스 목록)"""
+    from app.models import WorkItem, AgentLog, ReportItem
+    from app.models.issue import ItemCategory
+
+    now = datetime.now()
+    return [
+        (
+            "보고서 기간 조회",
+            db.query(WorkItem)
+            .filter(WorkItem.updated_at >= now - timedelta(days=1))
+            .filter(WorkItem.updated_at <= now)
+            .order_by(WorkItem.category, WorkItem.updated_at.desc()),
+            {"ix_work_items_updated_at", "ix_work_items_category_updated_at"},
+        ),
+        (
+            "업무 항목 목록 (분류 필터)",
+            db.query(WorkItem)
+            .filter(WorkItem.category == ItemCategory.PLANNED)
+            .order_by(WorkItem.updated_at.desc())
+            .limit(50),
+            {"ix_work_items_category_updated_at"},
+        ),
+        (
+            "업무 항목 목록 (저장소 필터)",
+            db.query(WorkItem).filter(WorkItem.github_repo == "repo-1"),
+            {"ix_work_items_repo_issue"},
+        ),
+        (
+            "Issue upsert 조회",
+            db.query(WorkItem).filter(
+                WorkItem.github_repo == "repo-1",
+                WorkItem.github_issue_number.in_([1, 41, 81]),
+            ),
+            {"ix_work_items_repo_issue"},
+        ),
+        (
+            "Agent 로그 (Agent별)",
+            db.query(AgentLog)
+            .filter(AgentLog.agent_name == "QA-Agent")
+            .order_by(AgentLog.executed_at.desc())
+            .limit(20),
+            {"ix_agent_logs_agent_name_executed_at"},
+        ),
+        (
+            "Agent 로그 (전체)",
+            db.query(AgentLog).order_by(AgentLog.executed_at.desc()).limit(20),
+            {"ix_agent_logs_executed_at"},
+        ),
+        (
+            "보고서 항목",
+            db.query(ReportItem).filter(ReportItem.report_id == 1),
+            {"ix_report_items_report_id"},
+        ),
+    ]
+
+
+def _explain(db, query) -> str:
+    from sqlalchemy import text
+
+    sql = str(query.statement.compile(db.get_bind(), compile_kwargs={"literal_binds": True}))
+    if db.get_bind().dialect.name == "sqlite":
+        rows = db.execute(text(f"EXPLAIN QUERY PLAN {sql}")).fetchall()
+        return "\n".join(str(row[-1]) for row in rows)
+    rows = db.execute(text(f"EXPLAIN {sql}")).fetchall()
+    return "\n".join(row[0] for row in rows)
+
+
+def main():
+    from sqlalchemy import text
+    from app.core.database import engine, Base, SessionLocal
+    from app.core.config import settings
+    import app.models  # noqa: F401
+
+    logger.info("=== 쿼리 실행 계획 점검 시작 ===")
+    logger.info(f"DB: {settings.database_url}")
+
+    is_sqlite = engine.dialect.name == "sqlite"
+    if is_sqlite:
+        Base.metadata.create_all(bind=engine)
+
+    db = SessionLocal()
+    failed = []
+    try:
+        if is_sqlite:
+            _seed(db)
+            db.execute(text("ANALYZE"))
+        else:
+            # 소규모 데이터에서도 인덱스 사용 가능 여부만 확인 (트랜잭션 범위)
+            db.execute(text("SET LOCAL enable_seqscan = off"))
+
+        for name, query, expected in _hot_queries(db):
+            plan = _explain(db, query)
+            used = sorted(index for index in expected if index in plan)
+            if used:
+                logger.info(f"  [OK]   {name}: {', '.join(used)}")
+            else:
+                failed.append(name)
+                logger.error(f"  [FAIL] {name}: 기대 인덱스 {sorted(expected)} 미사용\n{plan}")
+    finally:
+        db.rollback()
+        db.close()
+        engine.dispose()
+        if is_sqlite and os.path.exists("./test_query_plans.db"):
+            os.remove("./test_query_plans.db")
+
+    if failed:
+        logger.error(f"=== 인덱스 미사용 쿼리 {len(failed)}건 ===")
+        sys.exit(1)
+    logger.info("=== 쿼리 실행 계획 점검 완료 ===")
+
+
+if __name__ == "__main__":
+    main()